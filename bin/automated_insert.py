@@ -12,7 +12,7 @@ from mechanalyzer.inf import spc as sinfo
 import elstruct
 from automol.geom import ring_fragments_geometry as _fragment_ring_geo
 from mechlib.filesys import save
-from mechroutines.es._routines.conformer import _saved_cnf_info
+from mechroutines.es._routines.conformer import _similar_cnf_info
 from mechroutines.es._routines.conformer import _sym_unique
 from mechroutines.es._routines.conformer import _geo_unique
 
@@ -767,8 +767,8 @@ def main(insert_dct):
         method=method, basis=basis, status=autofile.schema.RunStatus.SUCCESS)
     inf_obj.utc_end_time = autofile.schema.utc_time()
     inf_obj.utc_start_time = autofile.schema.utc_time()
-    _, saved_geos, saved_enes = _saved_cnf_info(
-        cnf_fs, mod_thy_info)
+    _, saved_geos, saved_enes = _similar_cnf_info(
+        geo, ene, cnf_fs, mod_thy_info)
     if _geo_unique(geo, ene, saved_geos, saved_enes, zrxn=zrxn):
         sym_id = _sym_unique(
             geo, ene, saved_geos, saved_enes)
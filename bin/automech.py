@@ -5,9 +5,13 @@
     sub-drivers.
 """
 
+import os
 import sys
+import json
 # import argparse
+from mechlib import filesys
 from mechlib.filesys import prefix_fs
+from mechlib import sched
 from mechlib.amech_io import parser as ioparser
 from mechlib.amech_io import printer as ioprinter
 from drivers import esdriver, thermodriver, ktpdriver, transdriver, procdriver
@@ -16,10 +20,12 @@ import autofile
 
 # Set runtime options based on user input
 JOB_PATH = sys.argv[1]  # Add a check to see if [1] exists; path exits
-if len(sys.argv) > 2:
-    if sys.argv[2] == 'safemode_off':
-        autofile.turn_off_safemode()
-        ioprinter.info_message('Running with safemode turned OFF...')
+if 'safemode_off' in sys.argv[2:]:
+    autofile.turn_off_safemode()
+    ioprinter.info_message('Running with safemode turned OFF...')
+
+# With --plan, only list the jobs the drivers would run in plan.json
+PLAN = '--plan' in sys.argv[2:]
 
 # Print the header message and host name
 ioprinter.program_header('amech')
@@ -52,6 +58,57 @@ ioparser.run.check_inputs(
 
 # Build the Run-Save Filesystem Directories
 prefix_fs(INP_KEY_DCT['run_prefix'], INP_KEY_DCT['save_prefix'])
+filesys.index.enable(INP_KEY_DCT['cnf_index'])
+filesys.archive.enable(
+    INP_KEY_DCT['save_archive'], save_prefix=INP_KEY_DCT['save_prefix'])
+filesys.cache.enable(
+    INP_KEY_DCT['read_cache'], run_prefix=INP_KEY_DCT['run_prefix'])
+
+# Set the cores and memory shared by the jobs queued by all of the drivers
+sched.configure(ncores=INP_KEY_DCT['ncores'], mem=INP_KEY_DCT['mem'])
+
+# List the jobs the drivers would run, checking the save filesystem
+if PLAN:
+    ioprinter.info_message(
+        '\nPlanning the jobs for the requested tasks...')
+    PLAN_JOBS = ()
+    if TSK_LST_DCT.get('es') is not None:
+        PLAN_JOBS += esdriver.plan(
+            PES_RLST, SPC_RLST,
+            TSK_LST_DCT['es'],
+            SPC_DCT, GLOB_DCT, THY_DCT,
+            INP_KEY_DCT['run_prefix'], INP_KEY_DCT['save_prefix'])
+    if TSK_LST_DCT.get('thermo') is not None:
+        PLAN_JOBS += thermodriver.plan(
+            PES_RLST, SPC_RLST,
+            TSK_LST_DCT['thermo'],
+            SMOD_DCT,
+            SPC_DCT, THY_DCT,
+            INP_KEY_DCT['run_prefix'], INP_KEY_DCT['save_prefix'])
+    if TSK_LST_DCT.get('trans') is not None and PES_DCT:
+        PLAN_JOBS += transdriver.plan(
+            PES_RLST, SPC_RLST,
+            TSK_LST_DCT['trans'],
+            SMOD_DCT,
+            SPC_DCT, THY_DCT,
+            INP_KEY_DCT['save_prefix'])
+    if TSK_LST_DCT.get('ktp') is not None:
+        PLAN_JOBS += ktpdriver.plan(
+            PES_RLST, INPUT['pesgrp'],
+            TSK_LST_DCT['ktp'],
+            INP_KEY_DCT['run_prefix'])
+
+    PLAN_PATH = os.path.join(JOB_PATH, 'plan.json')
+    with open(PLAN_PATH, 'w') as plan_file:
+        json.dump(PLAN_JOBS, plan_file, indent=2)
+    for PLAN_JOB in PLAN_JOBS:
+        ioprinter.info_message(
+            '{driver:>6} {task:<12} {program}: {nprocs} cores, '
+            '{mem} GB, {njobs} jobs ({status})'.format(**PLAN_JOB))
+    ioprinter.info_message(
+        f'\nWrote {len(PLAN_JOBS)} planned runs to {PLAN_PATH}')
+    ioprinter.program_exit('amech')
+    sys.exit()
 
 # Run Drivers Requested by User
 ES_TSKS = TSK_LST_DCT.get('es')
@@ -62,7 +119,10 @@ if ES_TSKS is not None:
         ES_TSKS,
         SPC_DCT, GLOB_DCT, THY_DCT,
         INP_KEY_DCT['run_prefix'], INP_KEY_DCT['save_prefix'],
-        print_debug=INP_KEY_DCT['print_debug']
+        print_debug=INP_KEY_DCT['print_debug'],
+        nworkers=INP_KEY_DCT['nworkers'],
+        ncores=INP_KEY_DCT['ncores'],
+        mem=INP_KEY_DCT['mem']
     )
     ioprinter.program_exit('es')
 
@@ -100,6 +160,7 @@ if KTP_TSKS is not None:
         SPC_DCT, GLOB_DCT,
         THY_DCT, KMOD_DCT, SMOD_DCT,
         INP_KEY_DCT['run_prefix'], INP_KEY_DCT['save_prefix'], JOB_PATH,
+        nworkers=INP_KEY_DCT['nworkers']
     )
     ioprinter.program_exit('ktp')
 
@@ -122,5 +183,10 @@ if all(tsks is None
         'User did not provide (uncommented) driver tasks lists in run.dat')
 
 # Exit Program
+if filesys.cache.enabled():
+    CACHE_STATS = filesys.cache.stats()
+    ioprinter.info_message(
+        f"Filesystem reads: {CACHE_STATS['hits']} from the cache, "
+        f"{CACHE_STATS['misses']} from the files")
 ioprinter.obj('vspace')
 ioprinter.program_exit('amech')
@@ -0,0 +1,43 @@
+""" Clean up the run filesystem of the jobs whose results are saved
+
+    Usage:
+        python clean_run.py <run_prefix> <save_prefix> [options]
+
+    Options:
+        --pack         pack the files into compressed tar files instead
+                       of removing them
+        --all          also remove the info, input, and output files of
+                       the jobs
+        --archive      the save filesystem was saved with
+                       `save_archive = True`
+        --dry-run      only report what would be cleaned up
+"""
+
+import sys
+from mechlib import filesys
+from mechlib.amech_io import printer as ioprinter
+
+
+ARGS = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+OPTS = [arg for arg in sys.argv[1:] if arg.startswith('--')]
+if len(ARGS) != 2 or not set(OPTS) <= {
+        '--pack', '--all', '--archive', '--dry-run'}:
+    print(__doc__)
+    sys.exit(1)
+RUN_PREFIX, SAVE_PREFIX = ARGS
+
+filesys.archive.enable('--archive' in OPTS, save_prefix=SAVE_PREFIX)
+
+ioprinter.info_message(
+    f'Finding the jobs in {RUN_PREFIX} with results saved in {SAVE_PREFIX}')
+RUN_JOBS = filesys.clean.saved_run_jobs(RUN_PREFIX, SAVE_PREFIX)
+ioprinter.info_message(f'Found {len(RUN_JOBS)} saved jobs')
+
+NFILES = filesys.clean.clean_run_jobs(
+    RUN_JOBS,
+    pack='--pack' in OPTS,
+    keep_output='--all' not in OPTS,
+    dry_run='--dry-run' in OPTS)
+ioprinter.info_message(
+    f'{"Would clean" if "--dry-run" in OPTS else "Cleaned"} up '
+    f'{NFILES} files')
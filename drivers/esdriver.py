@@ -12,16 +12,22 @@
         (3) Write final data into save filesystem
 """
 
+import functools
 from mechroutines.es import run_tsk
+from mechroutines.es import plan_tsk
+from mechroutines.es.runner import job_resources
 from mechlib.amech_io import parser
 from mechlib.amech_io import printer as ioprinter
+from mechlib.sched import machine_budget
+from mechlib.sched import execute_in_pool
 
 
 def run(pes_rlst, spc_rlst,
         es_tsk_lst,
         spc_dct, glob_dct, thy_dct,
         run_prefix, save_prefix,
-        print_debug=False):
+        print_debug=False,
+        nworkers=1, ncores=None, mem=None):
     """ Executes all electronic structure tasks.
 
         :param pes_rlst: species from PESs to run
@@ -46,6 +52,12 @@ def run(pes_rlst, spc_rlst,
         :type run_prefix: str
         :param save_prefix: root-path to the save-filesystem
         :type save_prefix: str
+        :param nworkers: number of species to run each task for at once
+        :type nworkers: int
+        :param ncores: total cores available to concurrently running jobs
+        :type ncores: int
+        :param mem: total memory (GB) available to concurrently running jobs
+        :type mem: float
     """
 
     # -------------------------------- #
@@ -56,6 +68,13 @@ def run(pes_rlst, spc_rlst,
     # Runs through PESs, then SPC
     run_rlst = parser.rlst.combine(pes_rlst, spc_rlst)
 
+    # Set the cores and memory shared by species run concurrently
+    budget = machine_budget(ncores=ncores, mem=mem)
+    if nworkers > 1:
+        ioprinter.info_message(
+            f'Running up to {nworkers} species at once with '
+            f'{budget[0]} cores and {budget[1]} GB of memory', newline=1)
+
     for (fml, pes_idx, subpes_idx), run_lst in run_rlst.items():
 
         # Print what is being run PESs that are being run
@@ -83,18 +102,121 @@ def run(pes_rlst, spc_rlst,
             [obj, tsk, es_keyword_dct] = tsk_lst
 
             # Build the queue of species based on user request
-            if obj == 'all':
-                obj_queue = parser.rlst.spc_queue(run_lst, fml) + ts_queue
-            elif obj == 'spc':
-                obj_queue = parser.rlst.spc_queue(run_lst, fml)
-            elif obj == 'ts':
-                obj_queue = ts_queue
-            elif obj == 'vdw':
-                obj_queue = ()
-
-            # Run the electronic structure task for all spc in queue
-            for spc_name in obj_queue:
-                run_tsk(tsk, spc_dct, spc_name,
-                        thy_dct, es_keyword_dct,
-                        run_prefix, save_prefix,
-                        print_debug=print_debug)
+            obj_queue = _obj_queue(obj, run_lst, fml, ts_queue)
+
+            # Run the electronic structure task for all spc in queue;
+            # each task finishes for all spc before the next task starts.
+            # Each spc is given the resources of the njobs jobs it may run
+            # at once, which its own pools then share
+            nprocs, mem = _task_resources(es_keyword_dct, thy_dct)
+            njobs = max(es_keyword_dct.get('njobs', 1), 1)
+            execute_in_pool(
+                functools.partial(run_tsk, print_debug=print_debug),
+                tuple((tsk, spc_dct, spc_name,
+                       thy_dct, es_keyword_dct,
+                       run_prefix, save_prefix)
+                      for spc_name in obj_queue),
+                res_lst=((nprocs * njobs, mem * njobs),)*len(obj_queue),
+                nworkers=nworkers, budget=budget)
+
+
+def plan(pes_rlst, spc_rlst,
+         es_tsk_lst,
+         spc_dct, glob_dct, thy_dct,
+         run_prefix, save_prefix):
+    """ Determine the electronic structure jobs that `run` would execute
+        for the same input, checking the save filesystem without running
+        any of them.
+
+        Each job is described by a dictionary with the task, the species
+        or TS, the run level of theory, and the cores and memory (GB) it
+        requests, along with the number of jobs of that kind (see
+        `plan_tsk`; None if only known at run time).
+
+        :rtype: tuple(dict[str: obj])
+    """
+
+    run_rlst = parser.rlst.combine(pes_rlst, spc_rlst)
+
+    jobs = ()
+    for (fml, pes_idx, subpes_idx), run_lst in run_rlst.items():
+
+        ts_dct = None
+        for tsk_lst in es_tsk_lst:
+
+            if (fml != 'SPC' and tsk_lst[0] in ('ts', 'all')):
+                if ts_dct is None:
+                    ts_dct = parser.spc.ts_dct_from_estsks(
+                        pes_idx, es_tsk_lst, run_lst,
+                        thy_dct, spc_dct,
+                        run_prefix, save_prefix)
+                    spc_dct = parser.spc.combine_sadpt_spc_dcts(
+                        ts_dct, spc_dct, glob_dct)
+            ts_queue = tuple(x for x in ts_dct) if ts_dct is not None else ()
+
+            [obj, tsk, es_keyword_dct] = tsk_lst
+            method_dct = thy_dct.get(es_keyword_dct.get('runlvl'), {})
+            nprocs, mem = _task_resources(es_keyword_dct, thy_dct)
+
+            for spc_name in _obj_queue(obj, run_lst, fml, ts_queue):
+                status, njobs = plan_tsk(
+                    tsk, spc_dct, spc_name,
+                    thy_dct, es_keyword_dct,
+                    run_prefix, save_prefix)
+                if status in ('run', 'check'):
+                    jobs += ({
+                        'driver': 'es',
+                        'task': tsk,
+                        'pes': (fml, pes_idx+1, subpes_idx+1),
+                        'species': spc_name,
+                        'level': es_keyword_dct.get('runlvl'),
+                        'program': method_dct.get('program'),
+                        'method': method_dct.get('method'),
+                        'basis': method_dct.get('basis'),
+                        'nprocs': nprocs,
+                        'mem': mem,
+                        'njobs': njobs,
+                        'status': status
+                    },)
+
+    return jobs
+
+
+def _obj_queue(obj, run_lst, fml, ts_queue):
+    """ Build the queue of species and TSs a task is run for
+
+        :param obj: objects the task is requested for
+        :type obj: str
+        :rtype: tuple(str)
+    """
+
+    if obj == 'all':
+        obj_queue = parser.rlst.spc_queue(run_lst, fml) + ts_queue
+    elif obj == 'spc':
+        obj_queue = parser.rlst.spc_queue(run_lst, fml)
+    elif obj == 'ts':
+        obj_queue = ts_queue
+    else:
+        obj_queue = ()
+
+    return obj_queue
+
+
+def _task_resources(es_keyword_dct, thy_dct):
+    """ Determine the cores and memory requested by the electronic
+        structure jobs of a task from its run level of theory.
+
+        :param es_keyword_dct: keyword-value pairs for the task
+        :type es_keyword_dct: dict[str:str]
+        :param thy_dct: all of the theory information
+        :type thy_dct: dict[str:dict]
+        :rtype: (int, float)
+    """
+
+    method_dct = thy_dct.get(es_keyword_dct.get('runlvl'))
+    if method_dct is not None:
+        res = job_resources(method_dct)
+    else:
+        res = (1, 0.0)
+
+    return res
@@ -11,8 +11,10 @@
         (6) Write functional forms to mechanism file
 """
 
+import os
 from mechroutines.ktp import tsk as ktp_tasks
 from mechroutines.ktp import label as ktp_label
+from mechlib import sched
 from mechlib.amech_io import parser
 from mechlib.amech_io import rate_paths
 from mechlib.amech_io import printer as ioprinter
@@ -23,7 +25,8 @@ def run(pes_rlst, pes_grp_dct,
         ktp_tsk_lst,
         spc_dct, glob_dct,
         thy_dct, pes_mod_dct, spc_mod_dct,
-        run_prefix, save_prefix, mdriver_path):
+        run_prefix, save_prefix, mdriver_path,
+        nworkers=1):
     """ Executes all kinetics tasks.
 
         :param pes_rlst: species from PESs to run
@@ -44,6 +47,9 @@ def run(pes_rlst, pes_grp_dct,
         :type save_prefix: str
         :param mdriver_path: path where mechdriver is running
         :type mdriver_path: str
+        :param nworkers: number of channels to read the save filesys for
+            at once when writing the MESS inputs
+        :type nworkers: int
     """
 
     # ------------------------------------------------------------------ #
@@ -61,6 +67,11 @@ def run(pes_rlst, pes_grp_dct,
     # LOOP OVER ALL OF THE SUBPES in PES_RLST #
     # --------------------------------------- #
 
+    # The MESS runs of all groups are launched as their inputs are ready
+    # and left running while later groups are written; each group is only
+    # fit once its own runs are finished
+    mess_futs = ()
+    grp_fit_lst = ()
     for (pes_grp_rlst, pes_param_dct) in pes_grps_rlst:
 
         # print('WORKING ON PES GROUP NUM')
@@ -82,6 +93,7 @@ def run(pes_rlst, pes_grp_dct,
         # ---------------------------------------- #
         # WRITE AND RUN TASK FOR EACH PES IN GROUP #
         # ---------------------------------------- #
+        grp_mess_futs = ()
         for pesgrp_num, (pes_inf, rxn_lst) in enumerate(pes_grp_rlst.items()):
 
             # Print PES Channels that are being run
@@ -96,18 +108,32 @@ def run(pes_rlst, pes_grp_dct,
                     spc_dct,
                     thy_dct, pes_mod_dct, spc_mod_dct,
                     all_instab_chnls[pesgrp_num], label_dct,
-                    rate_paths_dct, run_prefix, save_prefix)
+                    rate_paths_dct, run_prefix, save_prefix,
+                    nworkers=nworkers)
 
             # Run mess to produce rates (currently nothing from tsk lst used)
             if run_rate_tsk is not None:
                 tsk_key_dct = run_rate_tsk[-1]
-                ktp_tasks.run_messrate_task(
+                mess_fut = ktp_tasks.run_messrate_task(
                     pes_inf, all_rxn_lst[pesgrp_num],
-                    tsk_key_dct, spc_dct, rate_paths_dct)
+                    tsk_key_dct, spc_dct, rate_paths_dct,
+                    mess_futs=mess_futs)
+                if mess_fut is not None:
+                    mess_futs += (mess_fut,)
+                    grp_mess_futs += (mess_fut,)
 
-        # ---------------------------------------- #
-        # FIT THE COMBINES RATES FOR ENTIRE GROUP  #
-        # ---------------------------------------- #
+        grp_fit_lst += (
+            (pes_grp_rlst, pes_param_dct, rate_paths_dct, grp_mess_futs),)
+
+    # ---------------------------------------- #
+    # FIT THE COMBINES RATES FOR ENTIRE GROUP  #
+    # ---------------------------------------- #
+
+    for (pes_grp_rlst, pes_param_dct, rate_paths_dct,
+         grp_mess_futs) in grp_fit_lst:
+
+        # Wait for the MESS runs of the group to finish
+        sched.wait(grp_mess_futs)
 
         # Fit rates to functional forms; write parameters to ChemKin file
         if run_fit_tsk is not None:
@@ -118,6 +144,66 @@ def run(pes_rlst, pes_grp_dct,
                 tsk_key_dct, spc_dct)
 
 
+def plan(pes_rlst, pes_grp_dct,
+         ktp_tsk_lst,
+         run_prefix):
+    """ Determine the MESSRATE runs and rate fits that `run` would
+        execute for the same input, without running any of them.
+
+        A MESS run is listed if its input will be written by the
+        `write_mess` task or is already in the run filesystem.
+
+        :rtype: tuple(dict[str: obj])
+    """
+
+    write_rate_tsk = parser.run.extract_task('write_mess', ktp_tsk_lst)
+    run_rate_tsk = parser.run.extract_task('run_mess', ktp_tsk_lst)
+    run_fit_tsk = parser.run.extract_task('run_fits', ktp_tsk_lst)
+
+    jobs = ()
+    for (pes_grp_rlst, _) in parser.rlst.pes_groups(pes_rlst, pes_grp_dct):
+
+        rate_paths_dct = rate_paths(pes_grp_rlst, run_prefix, make_path=False)
+
+        pes_lst = ()
+        for pes_inf in pes_grp_rlst:
+            pes_fml, pes_idx, subpes_idx = pes_inf
+            pes_lst += ((pes_fml, pes_idx+1, subpes_idx+1),)
+
+            if run_rate_tsk is not None:
+                tsk_key_dct = run_rate_tsk[-1]
+                mess_version = tsk_key_dct['mess_version']
+                paths = (rate_paths_dct[pes_inf][f'base-{mess_version}'],
+                         rate_paths_dct[pes_inf][f'wext-{mess_version}'])
+                if write_rate_tsk is not None or any(
+                        os.path.exists(os.path.join(path, 'mess.inp'))
+                        for path in paths):
+                    jobs += ({
+                        'driver': 'ktp',
+                        'task': 'run_mess',
+                        'pes': pes_lst[-1],
+                        'program': f'messrate-{mess_version}',
+                        'nprocs': 1,
+                        'mem': None,
+                        'njobs': 1,
+                        'status': 'run'
+                    },)
+
+        if run_fit_tsk is not None:
+            jobs += ({
+                'driver': 'ktp',
+                'task': 'run_fits',
+                'pes': pes_lst,
+                'program': 'ratefit',
+                'nprocs': 1,
+                'mem': None,
+                'njobs': 1,
+                'status': 'run'
+            },)
+
+    return jobs
+
+
 # ------- #
 # UTILITY #
 # ------- #
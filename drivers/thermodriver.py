@@ -147,6 +147,65 @@ def run(pes_rlst, spc_rlst,
                 nasa_str, ckin_path, idx=idx)
 
 
+def plan(pes_rlst, spc_rlst,
+         therm_tsk_lst,
+         spc_mod_dct,
+         spc_dct, thy_dct,
+         run_prefix, save_prefix):
+    """ Determine the MESSPF runs and thermochemistry fits that `run`
+        would execute for the same input, without running any of them.
+
+        :rtype: tuple(dict[str: obj])
+    """
+
+    write_messpf_tsk = parser.run.extract_task('write_mess', therm_tsk_lst)
+    run_messpf_tsk = parser.run.extract_task('run_mess', therm_tsk_lst)
+    run_fit_tsk = parser.run.extract_task('run_fits', therm_tsk_lst)
+
+    tsk = write_messpf_tsk or run_fit_tsk or run_messpf_tsk
+    if tsk is None:
+        return ()
+
+    spc_mods = list(spc_mod_dct.keys())  # hack
+    spc_mod_dct_i = spc_mod_dct[spc_mods[0]]
+    split_rlst = split_unstable_full(
+        pes_rlst, spc_rlst, spc_dct, spc_mod_dct_i, save_prefix)
+    spc_queue = parser.rlst.spc_queue(
+        tuple(split_rlst.values())[0], 'SPC')
+    spc_locs_dct = _set_spc_locs_dct(
+        spc_queue, spc_dct, spc_mod_dct_i, run_prefix, save_prefix,
+        tsk[-1]['cnf_range'],
+        filesys.mincnf.sort_info_lst(tsk[-1]['sort'], thy_dct))
+
+    jobs = ()
+    for spc_name, spc_locs_lst in spc_locs_dct.items():
+        if run_messpf_tsk is not None:
+            run_mods, _ = parser.models.extract_models(run_messpf_tsk)
+            jobs += ({
+                'driver': 'thermo',
+                'task': 'run_mess',
+                'species': spc_name,
+                'program': 'messpf',
+                'nprocs': 1,
+                'mem': None,
+                'njobs': len(spc_locs_lst) * len(run_mods),
+                'status': 'run'
+            },)
+        if run_fit_tsk is not None:
+            jobs += ({
+                'driver': 'thermo',
+                'task': 'run_fits',
+                'species': spc_name,
+                'program': 'thermp',
+                'nprocs': 1,
+                'mem': None,
+                'njobs': len(spc_locs_lst) + 1,
+                'status': 'run'
+            },)
+
+    return jobs
+
+
 def _set_spc_queue(
         spc_mod_dct, pes_rlst, spc_rlst,
         run_fit_tsk,
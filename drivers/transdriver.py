@@ -53,3 +53,46 @@ def run(pes_rlst, spc_rlst,
                 spc_dct, thy_dct, pes_mod_dct,
                 etrans_keyword_dct,
                 run_prefix, save_prefix, mdriver_path)
+
+
+def plan(pes_rlst, spc_rlst,
+         trans_tsk_lst,
+         spc_mod_dct,
+         spc_dct, thy_dct,
+         save_prefix):
+    """ Determine the OneDMin runs that `run` would execute for the same
+        input, without running any of them. OneDMin checks the save
+        filesystem itself, so the number of its jobs is only known then.
+
+        :rtype: tuple(dict[str: obj])
+    """
+
+    spc_mods = list(spc_mod_dct.keys())  # hack
+    spc_mod_dct_i = spc_mod_dct[spc_mods[0]]
+    split_rlst = split_unstable_full(
+        pes_rlst, spc_rlst, spc_dct, spc_mod_dct_i, save_prefix)
+    spc_queue = parser.rlst.spc_queue(
+        tuple(split_rlst.values())[0], 'SPC')
+
+    jobs = ()
+    for tsk_lst in trans_tsk_lst:
+        [_, tsk, etrans_keyword_dct] = tsk_lst
+        if tsk != 'onedmin':
+            continue
+        method_dct = thy_dct.get(etrans_keyword_dct.get('runlvl'), {})
+        for spc_name in spc_queue:
+            jobs += ({
+                'driver': 'trans',
+                'task': tsk,
+                'species': spc_name,
+                'level': etrans_keyword_dct.get('runlvl'),
+                'program': method_dct.get('program'),
+                'method': method_dct.get('method'),
+                'basis': method_dct.get('basis'),
+                'nprocs': etrans_keyword_dct['njobs'],
+                'mem': None,
+                'njobs': None,
+                'status': 'check'
+            },)
+
+    return jobs
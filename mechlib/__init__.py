@@ -5,10 +5,12 @@ New, Refactored Mechdriver libs
 from mechlib import amech_io
 from mechlib import filesys
 from mechlib import reaction
+from mechlib import sched
 
 
 __all__ = [
     'amech_io',
     'filesys',
-    'reaction'
+    'reaction',
+    'sched'
 ]
@@ -9,6 +9,8 @@ from mechlib.amech_io._path import thermo_paths
 from mechlib.amech_io._path import rate_paths
 from mechlib.amech_io._path import output_path
 from mechlib.amech_io._path import job_path
+from mechlib.amech_io._prov import mess_run_current
+from mechlib.amech_io._prov import run_mess
 
 
 __all__ = [
@@ -19,5 +21,7 @@ __all__ = [
     'thermo_paths',
     'rate_paths',
     'output_path',
-    'job_path'
+    'job_path',
+    'mess_run_current',
+    'run_mess'
 ]
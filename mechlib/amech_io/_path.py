@@ -10,11 +10,12 @@ from mechanalyzer.inf import spc as sinfo
 
 
 # Set paths to MESS jobs
-def rate_paths(pes_dct, run_prefix):
+def rate_paths(pes_dct, run_prefix, make_path=True):
     """ Set up the path for saveing the input and output of
         MESSRATE calculations.
 
-        Creates paths for two different versions of mess
+        Creates paths for two different versions of mess, unless
+        `make_path` is False
 
         Run different types of directories (1 PES)
             - fml-base: Standard base rate calculations (use idx)
@@ -34,10 +35,10 @@ def rate_paths(pes_dct, run_prefix):
             rate_path_dct[pes_inf].update({
                 f'base-{mess_version}': job_path(
                     run_prefix, 'MESS', 'RATE', _pes_str,
-                    locs_id=id1),
+                    locs_id=id1, make_path=make_path),
                 f'wext-{mess_version}': job_path(
                     run_prefix, 'MESS', 'RATE', _pes_str,
-                    locs_id=id2)
+                    locs_id=id2, make_path=make_path)
             })
 
     return rate_path_dct
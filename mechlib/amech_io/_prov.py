@@ -0,0 +1,110 @@
+""" Library to keep track of which MESS input the outputs in a MESS job
+    directory were produced from, so that MESS is not run again for an
+    input that has not changed.
+
+    Next to the input, a record holds a hash of the input and of the
+    auxiliary .dat files it reads, i.e., the .dat files of the directory
+    whose names appear in the input (other than outputs), taken just
+    before MESS was run.
+"""
+
+import os
+import hashlib
+import autorun
+
+
+PROV_EXT = '.prov'
+
+
+def input_hash(path, input_name='mess.inp', output_names=()):
+    """ Hash the MESS input in a directory, along with the files it reads
+
+        :param path: path to the MESS job directory
+        :type path: str
+        :param input_name: name of the MESS input file
+        :type input_name: str
+        :param output_names: names of the output files, left out
+        :type output_names: tuple(str)
+        :rtype: str (None if there is no input)
+    """
+
+    inp_path = os.path.join(path, input_name)
+
+    ret = None
+    if os.path.isfile(inp_path):
+        with open(inp_path, mode='rb') as inp_file:
+            inp_bytes = inp_file.read()
+        inp_str = inp_bytes.decode(errors='replace')
+
+        sha = hashlib.sha256(inp_bytes)
+        for name in sorted(os.listdir(path)):
+            aux_path = os.path.join(path, name)
+            if (name.endswith('.dat') and name in inp_str and
+                    name not in output_names and os.path.isfile(aux_path)):
+                sha.update(b'\0' + name.encode() + b'\0')
+                with open(aux_path, mode='rb') as aux_file:
+                    sha.update(aux_file.read())
+        ret = sha.hexdigest()
+
+    return ret
+
+
+def mess_run_current(path, input_name='mess.inp', output_names=('rate.out',)):
+    """ Check if the outputs of a MESS job are intact and were produced
+        from the input (and auxiliary files) now in its directory
+
+        :param path: path to the MESS job directory
+        :type path: str
+        :param input_name: name of the MESS input file
+        :type input_name: str
+        :param output_names: names of the output files that must be there
+        :type output_names: tuple(str)
+        :rtype: bool
+    """
+
+    try:
+        with open(os.path.join(path, input_name + PROV_EXT),
+                  mode='r', encoding='utf-8') as prov_file:
+            saved_hash = prov_file.read().strip()
+    except OSError:
+        saved_hash = None
+
+    return (
+        saved_hash is not None and
+        all(os.path.isfile(os.path.join(path, name)) and
+            os.path.getsize(os.path.join(path, name)) > 0
+            for name in output_names) and
+        saved_hash == input_hash(
+            path, input_name=input_name, output_names=output_names)
+    )
+
+
+def run_mess(script_str, path, input_name='mess.inp',
+             output_names=('rate.out',)):
+    """ Run MESS with a script in a directory, then record the input
+        the outputs came from, if all of them were written
+
+        :param script_str: script that runs MESS
+        :type script_str: str
+        :param path: path to the MESS job directory
+        :type path: str
+        :param input_name: name of the MESS input file
+        :type input_name: str
+        :param output_names: names of the output files MESS writes
+        :type output_names: tuple(str)
+    """
+
+    prov_path = os.path.join(path, input_name + PROV_EXT)
+    if os.path.exists(prov_path):
+        os.remove(prov_path)
+
+    inp_hash = input_hash(
+        path, input_name=input_name, output_names=output_names)
+    autorun.run_script(script_str, path)
+
+    if inp_hash is not None and all(
+            os.path.isfile(os.path.join(path, name)) and
+            os.path.getsize(os.path.join(path, name)) > 0
+            for name in output_names):
+        with open(prov_path, mode='w', encoding='utf-8') as prov_file:
+            prov_file.write(inp_hash + '\n')
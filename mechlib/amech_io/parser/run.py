@@ -43,7 +43,13 @@ RUN_INP_VAL_DCT = {
     'print_mech': ((bool,), (True, False), False),
     'print_debug': ((bool,), (True, False), False),
     'run_prefix': ((str,), (), None),
-    'save_prefix': ((str,), (), None)
+    'save_prefix': ((str,), (), None),
+    'nworkers': ((int,), (), 1),
+    'ncores': ((int,), (), None),
+    'mem': ((int, float), (), None),
+    'cnf_index': ((bool,), (True, False), False),
+    'save_archive': ((bool,), (True, False), False),
+    'read_cache': ((bool,), (True, False), False)
 }
 
 # HANDLE TASK KEYS
@@ -65,7 +71,8 @@ TSK_KEY_DCT = {
     'init_geom': (('spc',), BASE),
     'find_ts': (('spc', 'ts'), BASE + MREF + ('nobarrier', 'varecof_nprocs')),
     'conf_pucker': (('spc', 'ts'), BASE + ('cnf_range', 'sort',)),
-    'conf_samp': (('spc', 'ts'), BASE + ('cnf_range', 'sort', 'resave',)),
+    'conf_samp': (('spc', 'ts'), BASE + ('cnf_range', 'sort', 'resave',
+                                         'njobs')),
     'conf_energy': (('spc', 'ts'), BASE + ('cnf_range', 'sort',)),
     'conf_grad': (('spc', 'ts'), BASE + ('cnf_range', 'sort',)),
     'conf_hess': (('spc', 'ts'), BASE + ('cnf_range', 'sort',)),
@@ -73,17 +80,17 @@ TSK_KEY_DCT = {
     'conf_prop': (('spc', 'ts'), BASE + ('cnf_range', 'sort',)),
     'conf_opt': (('spc', 'ts'), BASE + ('cnf_range', 'sort',)),
     'hr_scan': (('spc', 'ts'), BASE + ('tors_model', 'resamp_min',
-                                       'cnf_range', 'sort',)),
+                                       'cnf_range', 'sort', 'njobs',)),
     'hr_grad': (('spc', 'ts'), BASE + ('tors_model', 'cnf_range', 'sort',)),
     'hr_hess': (('spc', 'ts'), BASE + ('tors_model', 'cnf_range', 'sort',)),
     'hr_energy': (('spc', 'ts'), BASE + ('tors_model', 'cnf_range', 'sort',)),
     'hr_vpt2': (('spc', 'ts'), BASE + ('tors_model', 'cnf_range', 'sort',)),
     'hr_reopt': (('spc', 'ts'), BASE + ('tors_model', 'hrthresh',
                                         'cnf_range', 'sort',)),
-    'tau_samp': (('spc', 'ts'), BASE + ('resave',)),
-    'tau_energy': (('spc', 'ts'), BASE),
-    'tau_grad': (('spc', 'ts'), BASE),
-    'tau_hess': (('spc', 'ts'), BASE + ('hessmax',)),
+    'tau_samp': (('spc', 'ts'), BASE + ('resave', 'njobs')),
+    'tau_energy': (('spc', 'ts'), BASE + ('njobs',)),
+    'tau_grad': (('spc', 'ts'), BASE + ('njobs',)),
+    'tau_hess': (('spc', 'ts'), BASE + ('hessmax', 'njobs')),
     'rpath_scan': (('ts',), BASE + ('rxncoord',)),
     'rpath_energy': (('ts',), BASE + ('rxncoord',)),
     'rpath_grad': (('ts',), BASE + ('rxncoord',)),
@@ -107,7 +114,7 @@ TSK_KEY_DCT = {
                         'well_extension', 'mess_version',
                         'float_precision',
                         'cnf_range', 'sort')),
-    'run_mess': ((), ('kin_model', 'spc_model', 'nprocs',
+    'run_mess': ((), ('kin_model', 'spc_model', 'nprocs', 'overwrite',
                       'well_extension', 'mess_version',
                       'cnf_range', 'sort')),
     'run_fits': ((), ('kin_model',
@@ -3,8 +3,10 @@
 """
 
 from mechlib.amech_io.reader import mess
+from mechlib.amech_io.reader import es
 
 
 __all__ = [
-    'mess'
+    'mess',
+    'es'
 ]
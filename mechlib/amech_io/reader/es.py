@@ -0,0 +1,216 @@
+"""
+    Cache the quantities parsed from electronic structure outputs
+
+    Each parsed value is stored under the hash of the content of the output
+    it came from. Once an output has been read from the run filesystem
+    (see `register`), its parsed values are also saved in a file in the
+    same directory, so that re-running over an existing run filesystem
+    does not parse the same outputs again. The file is ignored if the
+    output it was made from has since changed.
+
+    The values of an output are saved once the process moves on to
+    another output, when they are dropped from the cache, and at exit;
+    the worker processes of `mechlib.sched`, which do not run the exit
+    handlers, save theirs with `flush` once their call is done.
+    The files are JSON, so a file in a shared run filesystem can never
+    run code when read; values JSON cannot hold are only kept in memory.
+"""
+
+import os
+import copy
+import json
+import atexit
+import hashlib
+from collections import OrderedDict
+import numpy
+
+
+CACHE_NAME = 'parsed.json'
+
+# Most outputs whose values are kept in memory
+MAX_ENTRIES = 256
+
+# hash of output content: {'hash': the hash, 'path': cache file path,
+# 'vals': parsed values, 'dirty': values not yet saved}, least recently
+# used first
+_CACHE = OrderedDict()
+_LAST = [None, None]
+_CURRENT = [None]
+
+
+def register(out_str, path):
+    """ Tie the parsed values of an output read from the run filesystem
+        to the cache file in the directory of the output.
+
+        :param out_str: string of the output file
+        :type out_str: str
+        :param path: directory that holds the output
+        :type path: str
+    """
+
+    out_hash = _hash(out_str)
+    cache_path = os.path.join(path, CACHE_NAME)
+
+    entry = _entry(out_hash)
+    if entry['path'] != cache_path:
+        entry['path'] = cache_path
+        saved_vals = _read_cache_file(cache_path, out_hash) or {}
+        entry['dirty'] = bool(set(entry['vals']) - set(saved_vals))
+        saved_vals.update(entry['vals'])
+        entry['vals'] = saved_vals
+
+
+def cached(reader, *args):
+    """ Call an elstruct reader, `reader(*args)`, where the output string
+        is the last argument, reusing the value from a previous call on
+        an output with the same content if there is one.
+
+        A copy of the value is returned, so changing it does not change
+        the cached value.
+
+        :param reader: elstruct.reader function
+        :type reader: function
+        :rtype: obj
+    """
+
+    out_hash = _hash(args[-1])
+    key = (reader.__module__, reader.__qualname__) + tuple(args[:-1])
+
+    entry = _entry(out_hash)
+    if key not in entry['vals']:
+        entry['vals'][key] = reader(*args)
+        entry['dirty'] = True
+
+    return copy.deepcopy(entry['vals'][key])
+
+
+def flush():
+    """ Save the values not yet saved of all outputs in the cache
+    """
+    for entry in _CACHE.values():
+        _write_cache_file(entry)
+
+
+def _forget_dirty():
+    """ Mark the values in the cache as saved, in a forked process, so
+        that only the parent process saves the values it found
+    """
+    for entry in _CACHE.values():
+        entry['dirty'] = False
+
+
+def _entry(out_hash):
+    """ Get the cache entry of an output, as the most recently used;
+        the values of the output used before it are saved, and the least
+        recently used outputs are dropped
+    """
+
+    if _CURRENT[0] != out_hash and _CURRENT[0] in _CACHE:
+        _write_cache_file(_CACHE[_CURRENT[0]])
+    _CURRENT[0] = out_hash
+
+    if out_hash not in _CACHE:
+        _CACHE[out_hash] = {
+            'hash': out_hash, 'path': None, 'vals': {}, 'dirty': False}
+    _CACHE.move_to_end(out_hash)
+    while len(_CACHE) > MAX_ENTRIES:
+        _, old_entry = _CACHE.popitem(last=False)
+        _write_cache_file(old_entry)
+
+    return _CACHE[out_hash]
+
+
+def _hash(out_str):
+    """ Hash the content of an output, reusing the last hash if the same
+        string is passed again
+    """
+    if _LAST[0] is not out_str:
+        _LAST[0] = out_str
+        _LAST[1] = hashlib.sha1(out_str.encode()).hexdigest()
+    return _LAST[1]
+
+
+def _read_cache_file(cache_path, out_hash):
+    """ Read the saved values if the file was made from the same output
+    """
+    vals = None
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, mode='r', encoding='utf-8') as cache_file:
+                saved = json.load(cache_file)
+            if saved['hash'] == out_hash:
+                vals = {_decode(key): _decode(val)
+                        for key, val in saved['vals']}
+        except (OSError, KeyError, TypeError, ValueError):
+            vals = None
+    return vals
+
+
+def _write_cache_file(entry):
+    """ Save the values of an output, if it has a cache file and values
+        not yet saved; written to a temporary file first so that a
+        killed process never leaves a partial cache file
+    """
+
+    if entry['path'] is not None and entry['dirty']:
+        entry['dirty'] = False
+        val_lst = []
+        for key, val in entry['vals'].items():
+            try:
+                val_lst.append((_encode(key), _encode(val)))
+            except TypeError:
+                pass
+        tmp_path = f'{entry["path"]}.{os.getpid()}.tmp'
+        try:
+            with open(tmp_path, mode='w', encoding='utf-8') as cache_file:
+                json.dump(
+                    {'hash': entry['hash'], 'vals': val_lst}, cache_file)
+            os.replace(tmp_path, entry['path'])
+        except OSError:
+            pass
+
+
+def _encode(val):
+    """ Encode a value as JSON, tagging tuples, dicts and arrays so that
+        they are decoded as they were
+    """
+
+    if val is None or isinstance(val, (bool, int, float, str)):
+        enc = val
+    elif isinstance(val, numpy.ndarray) and val.dtype.kind in 'biuf':
+        enc = {'array': val.tolist(), 'dtype': val.dtype.str}
+    elif isinstance(val, numpy.generic) and val.dtype.kind in 'biuf':
+        enc = val.item()
+    elif isinstance(val, tuple):
+        enc = {'tuple': [_encode(sub_val) for sub_val in val]}
+    elif isinstance(val, list):
+        enc = [_encode(sub_val) for sub_val in val]
+    elif isinstance(val, dict):
+        enc = {'dict': [[_encode(key), _encode(sub_val)]
+                        for key, sub_val in val.items()]}
+    else:
+        raise TypeError(f'Cannot save {type(val)} in the cache file')
+
+    return enc
+
+
+def _decode(enc):
+    """ Decode a value encoded with `_encode`
+    """
+
+    if isinstance(enc, list):
+        val = [_decode(sub_enc) for sub_enc in enc]
+    elif isinstance(enc, dict) and 'array' in enc:
+        val = numpy.array(enc['array'], dtype=numpy.dtype(enc['dtype']))
+    elif isinstance(enc, dict) and 'tuple' in enc:
+        val = tuple(_decode(sub_enc) for sub_enc in enc['tuple'])
+    elif isinstance(enc, dict) and 'dict' in enc:
+        val = {_decode(key): _decode(sub_enc) for key, sub_enc in enc['dict']}
+    else:
+        val = enc
+
+    return val
+
+
+atexit.register(flush)
+os.register_at_fork(after_in_child=_forget_dirty)
@@ -3,15 +3,35 @@
 """
 
 import os
+import math
+from collections.abc import Mapping
+import numpy
 from ioformat.pathtools import read_file
+from phydat import phycon
 import mess_io
 
 
+# Files of a MESSRATE run, by the keys used for them in the string dcts
+RATE_FILE_NAMES = {
+    'inp': 'mess.inp',
+    'ktp_out': 'rate.out',
+    'ke_out': 'ke.out',
+    'ped': 'ped.out',
+    'aux': 'mess.aux',
+    'log': 'mess.log'
+}
+
+
 def rate_strings(rate_paths_dct):
     """ Read the input and output for all of the PESs
 
         returns dictionary for each pes group for a 'base' MESS run
         and a well-extended MESS run
+
+        The strings of a run are only read from its files when they are
+        first looked up (see `rate_files`), so only the files a caller
+        uses are read; the `ped.out` and `mess.log` files of large PESs
+        can be hundreds of MB.
     """
 
     rate_strs_dct, mess_paths_dct = {}, {}
@@ -24,20 +44,13 @@ def rate_strings(rate_paths_dct):
         # Defaults to well-extended if output found for that run
         for typ in ('base', 'wext'):
             for mess_version in ('v1', 'v2'):
-                
+
                 full_typ = f'{typ}-{mess_version}'
 
                 mess_path = rate_paths_dct[pes_inf][full_typ]
 
                 if os.path.exists(os.path.join(mess_path, 'rate.out')):
-                    rate_strs_dct[pes_inf][full_typ] = {
-                        'inp': read_file(mess_path, 'mess.inp'),
-                        'ktp_out': read_file(mess_path, 'rate.out'),
-                        'ke_out': read_file(mess_path, 'ke.out'),
-                        'ped': read_file(mess_path, 'ped.out'),
-                        'aux': read_file(mess_path, 'mess.aux'),
-                        'log': read_file(mess_path, 'mess.log')
-                    }
+                    rate_strs_dct[pes_inf][full_typ] = rate_files(mess_path)
                 else:
                     rate_strs_dct[pes_inf][full_typ] = {}
 
@@ -46,6 +59,143 @@ def rate_strings(rate_paths_dct):
     return rate_strs_dct, mess_paths_dct
 
 
+def rate_files(mess_path):
+    """ Get the strings of the input and output files of a MESSRATE run,
+        as a read-only dict that reads each file the first time its key
+        is looked up; None for a file that does not exist.
+
+        :param mess_path: path to the MESSRATE run
+        :type mess_path: str
+        :rtype: collections.abc.Mapping
+    """
+    return _LazyFileDct(mess_path, RATE_FILE_NAMES)
+
+
+def rate_blocks(mess_path, file_name='rate.out'):
+    """ Read the k(T,P) tables of a MESSRATE output, one reaction at a
+        time, reading the file line by line.
+
+        Yields the reactant and product of each table in the
+        Temperature-Pressure Rate Tables section, and its k(T,P) values as
+        a dictionary {pressure: (temps, ks)}, with 'high' for the
+        high-pressure limit; any value MESS could not compute is None.
+
+        :param mess_path: path to the MESSRATE run
+        :type mess_path: str
+        :param file_name: name of the output file
+        :type file_name: str
+        :rtype: iterator((str, str, dict[float/str: (tuple, tuple)]))
+    """
+
+    with open(os.path.join(mess_path, file_name),
+              mode='r', encoding='utf-8') as out_file:
+
+        in_section = False
+        rxn, temps, ktp_dct = None, None, None
+        for line in out_file:
+            line = line.strip()
+            if not in_section:
+                in_section = line.startswith(
+                    'Temperature-Pressure Rate Tables')
+            elif line.startswith('_') or line.endswith('Tables:'):
+                break
+            elif not line:
+                # Tables end at a blank line; the label is followed by one
+                if ktp_dct:
+                    yield rxn + (ktp_dct,)
+                    rxn, temps, ktp_dct = None, None, None
+            elif '->' in line:
+                if ktp_dct:
+                    yield rxn + (ktp_dct,)
+                rxn, temps, ktp_dct = tuple(line.split('->', 1)), None, {}
+            elif rxn is not None and line.startswith('P\\T'):
+                temps = tuple(float(temp) for temp in line.split()[1:])
+            elif rxn is not None and temps is not None:
+                vals = line.split()
+                if vals[0] == 'O-O':
+                    pressure = 'high'
+                else:
+                    pressure = _rate_value(vals[0])
+                if pressure is not None:
+                    ktp_dct[pressure] = (
+                        temps, tuple(_rate_value(val) for val in vals[1:]))
+
+        if ktp_dct:
+            yield rxn + (ktp_dct,)
+
+
+def rxn_ktp_dct(mess_path, filter_reaction_types=(),
+                tmin=None, tmax=None, pmin=None, pmax=None,
+                file_name='rate.out'):
+    """ Read the k(T,P) values of the reactions of a MESSRATE output for
+        fitting, streaming the tables of the file with `rate_blocks`.
+
+        The values MESS could not compute and the non-positive ones are
+        dropped, as are the temperatures and pressures outside of the
+        given ranges; the high-pressure limit is always kept. Bimolecular
+        rate constants are converted from cm3/s to cm3/mol-s.
+
+        Reactions of the types in `filter_reaction_types` are dropped:
+        'fake' (to or from a fake well), 'self' (a species to itself),
+        'loss' and 'capture' (to or from no species), and 'reverse' (the
+        reverse of a reaction read earlier in the file).
+
+        :param mess_path: path to the MESSRATE run
+        :type mess_path: str
+        :param filter_reaction_types: types of reactions to drop
+        :type filter_reaction_types: tuple(str)
+        :param tmin: lowest temperature to keep (K)
+        :type tmin: float
+        :param tmax: highest temperature to keep (K)
+        :type tmax: float
+        :param pmin: lowest pressure to keep (atm)
+        :type pmin: float
+        :param pmax: highest pressure to keep (atm)
+        :type pmax: float
+        :rtype: dict[tuple: dict[float/str: (numpy.ndarray, numpy.ndarray)]]
+    """
+
+    ktp_dcts = {}
+    for reac, prod, blk_dct in rate_blocks(mess_path, file_name=file_name):
+
+        rxn_typs = set()
+        if reac.startswith('FakeW-') or prod.startswith('FakeW-'):
+            rxn_typs.add('fake')
+        if reac == prod:
+            rxn_typs.add('self')
+        if not prod or prod.lower() == 'loss':
+            rxn_typs.add('loss')
+        if not reac or 'capture' in (reac.lower(), prod.lower()):
+            rxn_typs.add('capture')
+        if (prod, reac) in ktp_dcts:
+            rxn_typs.add('reverse')
+        if rxn_typs & set(filter_reaction_types):
+            continue
+
+        conv = phycon.NAVO if '+' in reac else 1.0
+        ktp_dct = {}
+        for pressure, (temps, kts) in blk_dct.items():
+            if pressure != 'high' and (
+                    (pmin is not None and pressure < pmin) or
+                    (pmax is not None and pressure > pmax)):
+                continue
+            pts = tuple(
+                (temp, ktp*conv) for temp, ktp in zip(temps, kts)
+                if ktp is not None and ktp > 0.0 and
+                (tmin is None or temp >= tmin) and
+                (tmax is None or temp <= tmax))
+            if pts:
+                ktp_dct[pressure] = (
+                    numpy.array([temp for temp, _ in pts]),
+                    numpy.array([ktp for _, ktp in pts]))
+
+        if ktp_dct:
+            ktp_dcts[(reac, prod)] = ktp_dct
+
+    return {(tuple(reac.split('+')), tuple(prod.split('+')), (None,)): dct
+            for (reac, prod), dct in ktp_dcts.items()}
+
+
 def messpf(pf_path):
     """ Obtain the log partition functions from the MESSPF file
     """
@@ -56,3 +206,41 @@ def messpf(pf_path):
     temps, logq, dq_dt, dq2_dt2 = mess_io.reader.pfs.partition_function(
         output_string)
     return temps, logq, dq_dt, dq2_dt2
+
+
+def _rate_value(val_str):
+    """ Read a rate constant from a MESS table, None if it is not a number
+    """
+    try:
+        val = float(val_str)
+    except ValueError:
+        val = None
+    if val is not None and not math.isfinite(val):
+        val = None
+    return val
+
+
+class _LazyFileDct(Mapping):
+    """ Read-only dict of the strings of the files in a directory, which
+        reads each file the first time its key is looked up
+    """
+
+    def __init__(self, path, name_dct):
+        self._path = path
+        self._name_dct = dict(name_dct)
+        self._str_dct = {}
+
+    def __getitem__(self, key):
+        if key not in self._str_dct:
+            name = self._name_dct[key]
+            if os.path.exists(os.path.join(self._path, name)):
+                self._str_dct[key] = read_file(self._path, name)
+            else:
+                self._str_dct[key] = None
+        return self._str_dct[key]
+
+    def __iter__(self):
+        return iter(self._name_dct)
+
+    def __len__(self):
+        return len(self._name_dct)
@@ -7,8 +7,14 @@ from mechlib.filesys._build import prefix_fs
 from mechlib.filesys._build import reaction_fs
 from mechlib.filesys._build import root_locs
 from mechlib.filesys._rct import rcts_cnf_fs
+from mechlib.filesys import archive
+from mechlib.filesys import arrays
+from mechlib.filesys import cache
+from mechlib.filesys import clean
+from mechlib.filesys import index
 from mechlib.filesys import mincnf
 from mechlib.filesys import models
+from mechlib.filesys import pending
 from mechlib.filesys import read
 from mechlib.filesys import save
 
@@ -19,8 +25,14 @@ __all__ = [
     'reaction_fs',
     'root_locs',
     'rcts_cnf_fs',
+    'archive',
+    'arrays',
+    'cache',
+    'clean',
+    'index',
     'mincnf',
     'models',
+    'pending',
     'read',
     'save'
 ]
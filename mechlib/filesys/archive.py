@@ -0,0 +1,368 @@
+"""
+  Packed archive of the files in the conformer trees of the save filesystem
+
+  Instead of writing each geometry, Z-Matrix, energy, Hessian, info file,
+  input, etc. of the conformers of a species or transition state to its
+  own file, they can be kept in one compressed container per
+  species/theory, `archive.db` in the CONFS directory of that level of
+  theory. The directories of the layers are still made, so that the
+  conformers, scans, and single points found there are unchanged; only
+  the files are packed.
+
+  The archive is used through the data files of autofile: once turned on
+  with `enable`, every read, write, and check of a file below a CONFS
+  directory of the save filesystem goes through this module, so the rest of the code (including
+  `mechlib.filesys.save` and `mechlib.filesys.read`) is the same for
+  either layout. Files are read from the container if they are in it,
+  and from the directory otherwise, so trees saved before the archive was
+  used can still be read.
+
+  The archive is off unless turned on; turning it off again restores the
+  data files of autofile, so that containers are not read at all. Any
+  error writing to a container falls back to writing the file, removing
+  any older copy from the container. The files of the run filesystem,
+  which has CONFS directories of its own, are never packed.
+
+  Save filesystems are often shared by several runs on network
+  filesystems (NFS, Lustre), where the locks SQLite relies on are not
+  always honored and the shared memory of its write-ahead log is not
+  available. The containers are therefore kept in rollback-journal mode,
+  and every access also holds a POSIX lock on a file next to the
+  container (`archive.lock`): shared to read, exclusive to write, so that
+  only one process writes to a container at a time. The network
+  filesystem must support POSIX locks (e.g., NFS with lockd, or Lustre
+  mounted with `flock`); if it does not, the archive must not be used by
+  runs that share the save filesystem.
+"""
+
+import os
+import time
+import zlib
+import fcntl
+import sqlite3
+from contextlib import contextmanager
+from collections import OrderedDict
+import autofile
+from mechlib.amech_io import printer as ioprinter
+
+
+ARCHIVE_NAME = 'archive.db'
+LOCK_NAME = 'archive.lock'
+ARCHIVE_LAYER = 'CONFS'
+MAX_CONNS = 32
+
+_STATE = {'enabled': False, 'backend': None, 'save_prefix': None}
+
+_SCHEMA = (
+    'PRAGMA journal_mode=DELETE',
+    'CREATE TABLE IF NOT EXISTS files ('
+    ' key TEXT PRIMARY KEY, data BLOB, mtime INTEGER)',
+)
+
+# Open connections to the containers, and their lock files, by CONFS
+# directory, least recently used first
+_CONNS = OrderedDict()
+os.register_at_fork(after_in_child=_CONNS.clear)
+
+
+def enable(enabled=True, save_prefix=None):
+    """ Turn use of the archive on or off
+
+        :param enabled: use the archive
+        :type enabled: bool
+        :param save_prefix: root of the save filesystem; only the files
+            below it are archived
+        :type save_prefix: str
+    """
+    _STATE['enabled'] = enabled
+    _STATE['save_prefix'] = (
+        os.path.abspath(save_prefix) if save_prefix is not None else None)
+    if enabled:
+        _install()
+    else:
+        _uninstall()
+
+
+def enabled():
+    """ Check if the archive is in use
+
+        :rtype: bool
+    """
+    return _STATE['enabled']
+
+
+def mtime(path):
+    """ Modification time of a file, whether it is in the archive or the
+        directory; None if it does not exist
+
+        :param path: path of the file
+        :type path: str
+        :rtype: int
+    """
+
+    stmp = stamp(path)
+    return stmp[0] if stmp is not None else None
+
+
+def stamp(path):
+    """ Modification time, size, and inode of a file, to tell if it has
+        changed; for a file in the archive, only the time it was archived.
+        None if it does not exist
+
+        :param path: path of the file
+        :type path: str
+        :rtype: (int, int, int)
+    """
+
+    ret = None
+    entry = _entry(path, 'mtime')
+    if entry is not None:
+        ret = (entry, None, None)
+    else:
+        try:
+            stat = os.stat(path)
+            ret = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        except OSError:
+            ret = None
+
+    return ret
+
+
+def archived_paths(root):
+    """ Paths of the files in the archive below a directory
+
+        :param root: directory in a conformer tree
+        :type root: str
+        :rtype: set(str)
+    """
+
+    paths = set()
+    loc = _split(root)
+    if loc is not None and _STATE['backend'] is not None:
+        cnfs_path, key = loc
+        conn = _connect(cnfs_path)
+        if conn is not None:
+            try:
+                with _locked(cnfs_path):
+                    keys = conn.execute(
+                        'SELECT key FROM files WHERE key > ? AND key < ?',
+                        (key + os.sep,
+                         key + chr(ord(os.sep) + 1))).fetchall()
+            except (OSError, sqlite3.Error):
+                keys = ()
+            paths = {os.path.normpath(os.path.join(cnfs_path, key))
+                     for key, in keys}
+
+    return paths
+
+
+def remove(dir_path):
+    """ Remove the files in the archive below a directory, e.g., when the
+        directory of a conformer is removed from the save filesystem
+
+        :param dir_path: directory in a conformer tree
+        :type dir_path: str
+    """
+
+    loc = _split(dir_path)
+    if loc is not None and _connect(loc[0]) is not None:
+        _execute(
+            loc[0], 'DELETE FROM files WHERE key > ? AND key < ?',
+            (loc[1] + os.sep, loc[1] + chr(ord(os.sep) + 1)))
+
+
+def contents(path):
+    """ Contents of a file in the archive, None if it is not in it
+
+        :param path: path of the file
+        :type path: str
+        :rtype: str
+    """
+    data = _entry(path, 'data')
+    return zlib.decompress(data).decode() if data is not None else None
+
+
+# Backend for the autofile data files
+def _install():
+    """ Send the reads and writes of autofile data files through the
+        archive
+    """
+
+    if _STATE['backend'] is None:
+        dfile = autofile.model.DataFile
+        _STATE['backend'] = (dfile.exists, dfile.read, dfile.write)
+        dfile.exists = _exists
+        dfile.read = _read
+        dfile.write = _write
+
+
+def _uninstall():
+    """ Restore the reads and writes of autofile data files, and close the
+        containers
+    """
+
+    if _STATE['backend'] is not None:
+        dfile = autofile.model.DataFile
+        dfile.exists, dfile.read, dfile.write = _STATE['backend']
+        _STATE['backend'] = None
+    while _CONNS:
+        _, (conn, lock_file) = _CONNS.popitem()
+        conn.close()
+        lock_file.close()
+
+
+def _exists(dfile, dir_pth):
+    """ Check for a file in the archive, then the directory
+    """
+    return (_entry(dfile.path(dir_pth), 'mtime') is not None or
+            _STATE['backend'][0](dfile, dir_pth))
+
+
+def _read(dfile, dir_pth):
+    """ Read a file from the archive, else from the directory
+    """
+
+    val_str = contents(dfile.path(dir_pth))
+    if val_str is not None:
+        val = dfile.reader(val_str)
+    else:
+        val = _STATE['backend'][1](dfile, dir_pth)
+
+    return val
+
+
+def _write(dfile, val, dir_pth):
+    """ Write a file to the archive, if it is on and the file is in a
+        conformer tree, else to the directory
+    """
+
+    loc = _split(dfile.path(dir_pth))
+    stored = False
+    if enabled() and loc is not None:
+        data = zlib.compress(dfile.writer(val).encode())
+        stored = _execute(
+            loc[0], 'INSERT OR REPLACE INTO files VALUES (?, ?, ?)',
+            (loc[1], data, time.time_ns()), create=True)
+
+    if not stored:
+        _STATE['backend'][2](dfile, val, dir_pth)
+        if loc is not None:
+            _execute(loc[0], 'DELETE FROM files WHERE key = ?', (loc[1],))
+
+
+# Container access
+def _split(path):
+    """ Split the path of a file into the CONFS directory holding the
+        container and its key in it; None if it is not below one in the
+        save filesystem
+    """
+
+    save_prefix = _STATE['save_prefix']
+    path = os.path.abspath(path)
+    parts = path.split(os.sep)
+
+    ret = None
+    if (save_prefix is not None and
+            os.path.commonpath((save_prefix, path)) == save_prefix):
+        nprefix = len(save_prefix.rstrip(os.sep).split(os.sep))
+        if ARCHIVE_LAYER in parts[nprefix:-1]:
+            idx = parts.index(ARCHIVE_LAYER, nprefix)
+            ret = (os.sep.join(parts[:idx+1]) or os.sep,
+                   os.sep.join(parts[idx+1:]))
+
+    return ret
+
+
+def _entry(path, column):
+    """ Get a column of the archive entry of a file, None if it has none
+    """
+
+    ret = None
+    loc = _split(path)
+    if loc is not None and _STATE['backend'] is not None:
+        conn = _connect(loc[0])
+        if conn is not None:
+            try:
+                with _locked(loc[0]):
+                    row = conn.execute(
+                        f'SELECT {column} FROM files WHERE key = ?',
+                        (loc[1],)).fetchone()
+            except (OSError, sqlite3.Error):
+                row = None
+            if row is not None:
+                ret = row[0]
+
+    return ret
+
+
+def _execute(cnfs_path, statement, args, create=False):
+    """ Run a statement that changes a container and commit it; return
+        whether it succeeded
+    """
+
+    success = False
+    conn = _connect(cnfs_path, create=create)
+    if conn is not None:
+        try:
+            with _locked(cnfs_path, exclusive=True), conn:
+                conn.execute(statement, args)
+            success = True
+        except (OSError, sqlite3.Error) as err:
+            ioprinter.warning_message(
+                f'Could not update the archive in {cnfs_path}: {err}')
+
+    return success
+
+
+def _connect(cnfs_path, create=False):
+    """ Get the connection to the container in a CONFS directory, opening
+        it and its lock file if needed (and closing the least recently
+        used ones if too many are open); None if there is none and it is
+        not to be created
+    """
+
+    conn = None
+    if cnfs_path in _CONNS:
+        _CONNS.move_to_end(cnfs_path)
+        conn, _ = _CONNS[cnfs_path]
+    else:
+        arch_path = os.path.join(cnfs_path, ARCHIVE_NAME)
+        if create or os.path.exists(arch_path):
+            try:
+                lock_file = open(os.path.join(cnfs_path, LOCK_NAME), 'a+',
+                                 encoding='utf-8')
+            except OSError:
+                lock_file = None
+            if lock_file is not None:
+                try:
+                    conn = sqlite3.connect(arch_path, timeout=60.)
+                    _CONNS[cnfs_path] = (conn, lock_file)
+                    with _locked(cnfs_path, exclusive=True):
+                        for statement in _SCHEMA:
+                            conn.execute(statement)
+                except (OSError, sqlite3.Error):
+                    _CONNS.pop(cnfs_path, None)
+                    if conn is not None:
+                        conn.close()
+                    lock_file.close()
+                    conn = None
+            while len(_CONNS) > MAX_CONNS:
+                _, (old_conn, old_lock_file) = _CONNS.popitem(last=False)
+                old_conn.close()
+                old_lock_file.close()
+
+    return conn
+
+
+@contextmanager
+def _locked(cnfs_path, exclusive=False):
+    """ Hold the lock of the container in a CONFS directory, shared or
+        exclusive, which must have been opened with `_connect`
+    """
+
+    _, lock_file = _CONNS[cnfs_path]
+    fcntl.lockf(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+    try:
+        yield
+    finally:
+        fcntl.lockf(lock_file, fcntl.LOCK_UN)
@@ -0,0 +1,163 @@
+"""
+  Binary copies of the Hessians and gradients of the save filesystem
+
+  Next to the text file of each Hessian or gradient saved with
+  `mechlib.filesys.save`, the values are also written to a NumPy (.npy)
+  file, given the same modification time as the text file. Reading it
+  back needs no parsing: the copy is memory-mapped read-only, so only the
+  parts that are used are paged in. The copies are only written by the
+  saves; a text file with no binary copy, or one changed since its copy
+  was written, is read as usual. Callers that change the values must copy
+  them first, e.g., with `numpy.array`.
+
+  The harmonic frequencies and normal-mode displacements that ProjRot
+  finds from a geometry and Hessian are kept in memory, and reused as
+  long as neither changes.
+"""
+
+import os
+import copy
+import hashlib
+from collections import OrderedDict
+import numpy
+from mechlib.filesys import archive
+
+
+BINARY_EXT = '.npy'
+
+# Most sets of harmonic vibrations kept in memory
+MAX_VIBS = 64
+
+# hash of geometry and Hessian: vibrations, least recently used first
+_VIBS = OrderedDict()
+
+
+def hessian(cnf_fs, cnf_locs):
+    """ Read the Hessian saved for a conformer, or any other layer with
+        Hessian files, as a read-only memory map of its binary copy if it
+        has one; None if there is none.
+
+        :param cnf_fs: CONF object with save filesys prefix
+        :type cnf_fs: autofile.fs.conformer obj
+        :param cnf_locs: locators of the conformer
+        :type cnf_locs: tuple(str)
+        :rtype: numpy.ndarray
+    """
+    return _read(cnf_fs[-1].file.hessian, cnf_locs)
+
+
+def gradient(cnf_fs, cnf_locs):
+    """ Read the gradient saved for a conformer, or any other layer with
+        gradient files, as a read-only memory map of its binary copy if it
+        has one; None if there is none.
+
+        :param cnf_fs: CONF object with save filesys prefix
+        :type cnf_fs: autofile.fs.conformer obj
+        :param cnf_locs: locators of the conformer
+        :type cnf_locs: tuple(str)
+        :rtype: numpy.ndarray
+    """
+    return _read(cnf_fs[-1].file.gradient, cnf_locs)
+
+
+def save_hessian(cnf_fs, cnf_locs, hess):
+    """ Write the binary copy of a Hessian just saved in text form
+
+        :param cnf_fs: CONF object with save filesys prefix
+        :type cnf_fs: autofile.fs.conformer obj
+        :param cnf_locs: locators of the conformer
+        :type cnf_locs: tuple(str)
+        :param hess: Hessian
+        :type hess: tuple(tuple(float))
+    """
+    _write(cnf_fs[-1].file.hessian.path(cnf_locs), hess)
+
+
+def save_gradient(cnf_fs, cnf_locs, grad):
+    """ Write the binary copy of a gradient just saved in text form
+
+        :param cnf_fs: CONF object with save filesys prefix
+        :type cnf_fs: autofile.fs.conformer obj
+        :param cnf_locs: locators of the conformer
+        :type cnf_locs: tuple(str)
+        :param grad: gradient
+        :type grad: tuple(tuple(float))
+    """
+    _write(cnf_fs[-1].file.gradient.path(cnf_locs), grad)
+
+
+def harmonic_vibrations(geo, hess, calc_fxn):
+    """ Get the harmonic frequencies and normal modes of a conformer,
+        calling `calc_fxn()` to find them, e.g., with ProjRot, only if
+        they were not found for the same geometry and Hessian before.
+
+        A copy is returned, so changing it does not change the kept
+        values.
+
+        :param geo: geometry the Hessian is for
+        :type geo: automol geometry data structure
+        :param hess: Hessian
+        :type hess: numpy.ndarray
+        :param calc_fxn: function that returns the frequencies and modes
+        :type calc_fxn: function
+        :rtype: obj
+    """
+
+    key = hashlib.sha1(
+        repr(geo).encode() + numpy.asarray(hess, dtype=float).tobytes()
+    ).hexdigest()
+
+    if key not in _VIBS:
+        _VIBS[key] = calc_fxn()
+    _VIBS.move_to_end(key)
+    while len(_VIBS) > MAX_VIBS:
+        _VIBS.popitem(last=False)
+
+    return copy.deepcopy(_VIBS[key])
+
+
+def _read(dfile, locs):
+    """ Read the binary copy of a text file, or the text file if it has
+        no copy matching it
+    """
+
+    txt_path = dfile.path(locs)
+    bin_path = txt_path + BINARY_EXT
+
+    txt_mtime = archive.mtime(txt_path)
+    try:
+        bin_mtime = os.stat(bin_path).st_mtime_ns
+    except OSError:
+        bin_mtime = None
+
+    arr = None
+    if txt_mtime is not None:
+        if bin_mtime == txt_mtime:
+            try:
+                arr = numpy.load(bin_path, mmap_mode='r')
+            except (OSError, ValueError):
+                arr = None
+        if arr is None:
+            arr = numpy.array(dfile.read(locs), dtype=float)
+
+    return arr
+
+
+def _write(txt_path, vals):
+    """ Write the binary copy of a text file, given the modification time
+        of the text file to mark which version it is a copy of; written to
+        a temporary file first so that no partial copy is ever read
+    """
+
+    bin_path = txt_path + BINARY_EXT
+    tmp_path = f'{bin_path}.{os.getpid()}.tmp'
+    txt_mtime = archive.mtime(txt_path)
+
+    if txt_mtime is not None:
+        try:
+            with open(tmp_path, 'wb') as bin_file:
+                numpy.save(bin_file, numpy.asarray(vals, dtype=float))
+            os.utime(tmp_path, ns=(txt_mtime, txt_mtime))
+            os.replace(tmp_path, bin_path)
+        except OSError:
+            pass
@@ -0,0 +1,187 @@
+"""
+  Cache of the values read from the files of the run and save filesystems
+
+  The drivers read the same geometries, Z-Matrices, energies, Hessians,
+  etc. from the save filesystem many times in one process. Once turned
+  on with `enable`, every read of an autofile data file outside of the run
+  filesystem goes through this cache, which keeps the values most recently
+  read, keyed by the path of the file along with its modification time,
+  size, and inode, so a file that changes is read again. Any write of a
+  data file, e.g., by `mechlib.filesys.save`, drops its entry.
+
+  The cache holds a bounded number of entries and of (approximate) bytes,
+  dropping the least recently used entries first. Mutable values, e.g.,
+  info objects, are copied when they are returned, so that changing them
+  does not change the cache.
+"""
+
+import os
+import sys
+import copy
+from collections import OrderedDict
+import numpy
+import autofile
+from mechlib.filesys import archive
+
+
+MAX_ENTRIES = 20000
+MAX_BYTES = 512 * 1024**2
+
+_STATE = {
+    'enabled': False,
+    'backend': None,
+    'run_prefix': None,
+    'max_entries': MAX_ENTRIES,
+    'max_bytes': MAX_BYTES,
+    'nbytes': 0,
+}
+_STATS = {'hits': 0, 'misses': 0}
+
+# path: (stamp, val, nbytes, immutable), least recently used first
+_CACHE = OrderedDict()
+
+
+def enable(enabled=True, run_prefix=None,
+           max_entries=MAX_ENTRIES, max_bytes=MAX_BYTES):
+    """ Turn caching of the values read from autofile data files on or off
+
+        :param enabled: use the cache
+        :type enabled: bool
+        :param run_prefix: root of the run filesystem, whose files are
+            always read from the files
+        :type run_prefix: str
+        :param max_entries: most values to keep
+        :type max_entries: int
+        :param max_bytes: most memory (bytes, approximate) for the values
+        :type max_bytes: int
+    """
+
+    _STATE['enabled'] = enabled
+    _STATE['run_prefix'] = (
+        os.path.abspath(run_prefix) if run_prefix is not None else None)
+    _STATE['max_entries'] = max_entries
+    _STATE['max_bytes'] = max_bytes
+    if not enabled:
+        clear()
+    _evict()
+
+    if enabled and _STATE['backend'] is None:
+        dfile = autofile.model.DataFile
+        _STATE['backend'] = (dfile.read, dfile.write)
+        dfile.read = _read
+        dfile.write = _write
+
+
+def enabled():
+    """ Check if the cache is in use
+
+        :rtype: bool
+    """
+    return _STATE['enabled']
+
+
+def stats():
+    """ Get the number of reads served from the cache (hits) and from the
+        files (misses), and the number of values and bytes held.
+
+        :rtype: dict[str: int]
+    """
+    return dict(_STATS, entries=len(_CACHE), nbytes=_STATE['nbytes'])
+
+
+def invalidate(path):
+    """ Drop the values cached for a file
+
+        :param path: path of the file
+        :type path: str
+    """
+
+    entry = _CACHE.pop(os.path.abspath(path), None)
+    if entry is not None:
+        _STATE['nbytes'] -= entry[2]
+
+
+def clear():
+    """ Drop all of the cached values and reset the counters
+    """
+    _CACHE.clear()
+    _STATE['nbytes'] = 0
+    _STATS.update({'hits': 0, 'misses': 0})
+
+
+# Backend for the autofile data files
+def _read(dfile, dir_pth):
+    """ Read a file, from the cache if it has not changed since it was
+        last read
+    """
+
+    path = os.path.abspath(dfile.path(dir_pth))
+    run_prefix = _STATE['run_prefix']
+
+    if not _STATE['enabled'] or (
+            run_prefix is not None and
+            os.path.commonpath((run_prefix, path)) == run_prefix):
+        val = _STATE['backend'][0](dfile, dir_pth)
+    else:
+        stamp = archive.stamp(path)
+        entry = _CACHE.get(path)
+
+        if stamp is not None and entry is not None and entry[0] == stamp:
+            _STATS['hits'] += 1
+            _CACHE.move_to_end(path)
+            _, val, _, immutable = entry
+            if not immutable:
+                val = copy.deepcopy(val)
+        else:
+            _STATS['misses'] += 1
+            invalidate(path)
+            val = _STATE['backend'][0](dfile, dir_pth)
+            if stamp is not None:
+                nbytes, immutable = _measure(val)
+                if nbytes <= _STATE['max_bytes'] // 8:
+                    _CACHE[path] = (
+                        stamp, val if immutable else copy.deepcopy(val),
+                        nbytes, immutable)
+                    _STATE['nbytes'] += nbytes
+                    _evict()
+
+    return val
+
+
+def _write(dfile, val, dir_pth):
+    """ Write a file and drop its cached values
+    """
+    _STATE['backend'][1](dfile, val, dir_pth)
+    invalidate(dfile.path(dir_pth))
+
+
+def _evict():
+    """ Drop the least recently used values until within the bounds
+    """
+    while _CACHE and (len(_CACHE) > _STATE['max_entries'] or
+                      _STATE['nbytes'] > _STATE['max_bytes']):
+        _, (_, _, nbytes, _) = _CACHE.popitem(last=False)
+        _STATE['nbytes'] -= nbytes
+
+
+def _measure(val):
+    """ Approximate size (bytes) of a value, and whether it is immutable
+    """
+
+    if isinstance(val, (str, bytes)):
+        ret = (sys.getsizeof(val), True)
+    elif isinstance(val, (int, float, complex, bool, type(None))):
+        ret = (sys.getsizeof(val), True)
+    elif isinstance(val, (tuple, frozenset)):
+        nbytes, immutable = sys.getsizeof(val), True
+        for item in val:
+            item_nbytes, item_immutable = _measure(item)
+            nbytes += item_nbytes
+            immutable = immutable and item_immutable
+        ret = (nbytes, immutable)
+    elif isinstance(val, numpy.ndarray):
+        ret = (val.nbytes, False)
+    else:
+        ret = (sys.getsizeof(val), False)
+
+    return ret
@@ -0,0 +1,186 @@
+"""
+  Clean up the jobs of the run filesystem whose results are saved
+
+  The run filesystem mirrors the save filesystem: the RUN directory of a
+  job sits in the run prefix at the same path, relative to the prefix, as
+  the layer its results are saved to in the save prefix. When a result is
+  saved, the input of the job that made it is saved along with it, so a
+  job is taken to be saved if it finished successfully and its input is
+  found in that layer of the save filesystem.
+
+  For a saved job, the subrun directories and any other scratch left in
+  its directory are removed, or packed into one compressed tar file; the
+  info, input, and output files of the job, which are all that is needed
+  to read it again, are kept unless requested otherwise.
+"""
+
+import os
+import shutil
+import tarfile
+import autofile
+from mechlib.amech_io import printer as ioprinter
+from mechlib.amech_io import reader
+from mechlib.filesys import archive
+
+
+RUN_LAYER = 'RUN'
+SCRATCH_NAME = 'scratch.tar.gz'
+
+
+def saved_run_jobs(run_prefix, save_prefix):
+    """ Find the jobs in a run filesystem whose results are saved.
+
+        The run filesystem is walked once, without going into the RUN
+        directories of the jobs.
+
+        :param run_prefix: root of the run filesystem
+        :type run_prefix: str
+        :param save_prefix: root of the save filesystem
+        :type save_prefix: str
+        :rtype: tuple((autofile.fs.run obj, tuple(str)))
+    """
+
+    saved_jobs = []
+    for dir_path, dir_names, _ in os.walk(run_prefix):
+        if RUN_LAYER in dir_names:
+            dir_names.remove(RUN_LAYER)
+            save_path = os.path.join(
+                save_prefix, os.path.relpath(dir_path, run_prefix))
+            if os.path.isdir(save_path):
+                run_fs = autofile.fs.run(dir_path)
+                saved_jobs.extend(
+                    (run_fs, locs) for locs in run_fs[-1].existing()
+                    if _job_saved(run_fs, locs, save_path))
+
+    return tuple(saved_jobs)
+
+
+def clean_run_jobs(run_jobs, pack=False, keep_output=True, dry_run=False):
+    """ Remove, or pack into a tar file, the directories of run jobs.
+
+        :param run_jobs: jobs to clean up, from `saved_run_jobs`
+        :type run_jobs: tuple((autofile.fs.run obj, tuple(str)))
+        :param pack: pack the files into a tar file instead of removing
+        :type pack: bool
+        :param keep_output: keep the info, input, and output files
+        :type keep_output: bool
+        :param dry_run: only report what would be cleaned up
+        :type dry_run: bool
+        :rtype: int
+    """
+
+    nfiles = 0
+    for run_fs, locs in run_jobs:
+        job_path = run_fs[-1].path(locs)
+        if keep_output:
+            keep_paths = {os.path.normpath(path) for path in (
+                run_fs[-1].file.info.path(locs),
+                run_fs[-1].file.input.path(locs),
+                run_fs[-1].file.output.path(locs),
+                os.path.join(job_path, reader.es.CACHE_NAME),
+                os.path.join(job_path, SCRATCH_NAME))}
+            clean_paths = tuple(
+                entry.path for entry in os.scandir(job_path)
+                if os.path.normpath(entry.path) not in keep_paths)
+            tar_path = os.path.join(job_path, SCRATCH_NAME)
+            tar_root = job_path
+        else:
+            clean_paths = (job_path,)
+            tar_path = job_path + '.tar.gz'
+            tar_root = os.path.dirname(job_path)
+
+        if clean_paths:
+            njob_files = sum(_count_files(path) for path in clean_paths)
+            nfiles += njob_files
+            label = 'Packing' if pack else 'Removing'
+            ioprinter.info_message(
+                f'{label} {njob_files} files from {job_path}')
+            if not dry_run:
+                if pack:
+                    _pack(clean_paths, tar_path, tar_root)
+                for path in clean_paths:
+                    _remove(path)
+
+    return nfiles
+
+
+def _job_saved(run_fs, locs, save_path):
+    """ Check if a job finished successfully and its input was saved in
+        the save layer at the path
+    """
+
+    saved = False
+    if (run_fs[-1].file.info.exists(locs) and
+            run_fs[-1].file.input.exists(locs)):
+        inf_obj = run_fs[-1].file.info.read(locs)
+        if inf_obj.status == autofile.schema.RunStatus.SUCCESS:
+            inp_str = run_fs[-1].file.input.read(locs)
+            saved = _saved_input(inp_str, save_path)
+
+    return saved
+
+
+def _saved_input(inp_str, save_path):
+    """ Check if an input was saved in a directory, reading only the files
+        of the same size
+    """
+
+    inp_bytes = inp_str.encode()
+    saved = False
+    for entry in os.scandir(save_path):
+        if entry.is_file() and entry.stat().st_size == len(inp_bytes):
+            with open(entry.path, 'rb') as saved_file:
+                saved = saved_file.read() == inp_bytes
+        if saved:
+            break
+
+    # Look for the input in the archive of the conformer tree, if in use
+    if not saved and archive.enabled():
+        for path in archive.archived_paths(save_path):
+            if os.path.dirname(path) == os.path.normpath(save_path):
+                saved = archive.contents(path) == inp_str
+            if saved:
+                break
+
+    return saved
+
+
+def _count_files(path):
+    """ Count the files in a directory tree, or 1 for a file
+    """
+    nfiles = 1
+    if os.path.isdir(path) and not os.path.islink(path):
+        nfiles = sum(len(file_names) for _, _, file_names in os.walk(path))
+    return nfiles
+
+
+def _pack(paths, tar_path, root):
+    """ Add files and directories to a compressed tar file, with their
+        paths relative to a root directory
+    """
+    mode = 'w:gz'
+    if os.path.exists(tar_path):
+        # Compressed tar files cannot be appended to, so copy the old one
+        with tarfile.open(tar_path, 'r:gz') as old_tar:
+            members = [(member, old_tar.extractfile(member))
+                       for member in old_tar.getmembers()]
+            tmp_path = tar_path + '.tmp'
+            with tarfile.open(tmp_path, mode) as tar:
+                for member, fobj in members:
+                    tar.addfile(member, fobj)
+                for path in paths:
+                    tar.add(path, arcname=os.path.relpath(path, root))
+        os.replace(tmp_path, tar_path)
+    else:
+        with tarfile.open(tar_path, mode) as tar:
+            for path in paths:
+                tar.add(path, arcname=os.path.relpath(path, root))
+
+
+def _remove(path):
+    """ Remove a file or directory tree
+    """
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path)
+    else:
+        os.remove(path)
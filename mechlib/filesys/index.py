@@ -0,0 +1,433 @@
+"""
+  Index of the values used to sort and filter the conformers of a
+  species or transition state
+
+  The conformers with a saved geometry, and their energies, ZPEs,
+  hydrogen-bond flags, and geometry fingerprints, are kept in an SQLite database in the CONFS layer
+  of the save filesystem, so that listing and sorting them, or finding
+  those similar to a new conformer, requires one query instead of reading
+  files from every conformer directory.
+
+  The index is updated when values are saved with `mechlib.filesys.save`,
+  and when conformers are removed with `remove`, and checked against the
+  save filesystem for anything written by other means, e.g., by another
+  run or by a run with the index off. The directories of a ring are
+  listed again only when their modification time differs from that of
+  the last listing, which finds the conformers added or removed since.
+  Conformers seen without a geometry, and values found to be missing, are
+  looked for again each time they are needed; values that were found are
+  trusted until saved again.
+
+  The index is off unless turned on with `enable`. Any error accessing
+  the database falls back to reading the files.
+"""
+
+import os
+import sqlite3
+from contextlib import closing
+import numpy
+import autofile
+from phydat import phycon
+
+
+INDEX_NAME = 'cnf_index.db'
+
+_STATE = {'enabled': False}
+
+_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS vals ('
+    ' rid TEXT, cid TEXT, key TEXT, val REAL,'
+    ' PRIMARY KEY (rid, cid, key))',
+    'CREATE INDEX IF NOT EXISTS vals_by_key ON vals (key, val)'
+)
+
+# Keys of the rows marking the conformers with a geometry, and the
+# layers whose directories have been scanned for them
+_GEO_KEY = 'geometry'
+_SCAN_KEY = 'scanned'
+
+# Key of the geometry fingerprints, kept as the bytes of their arrays
+_FPRINT_KEY = 'fingerprint'
+
+
+def enable(enabled=True):
+    """ Turn use of the conformer index on or off
+
+        :param enabled: use the index
+        :type enabled: bool
+    """
+    _STATE['enabled'] = enabled
+
+
+def enabled():
+    """ Check if the conformer index is in use
+
+        :rtype: bool
+    """
+    return _STATE['enabled']
+
+
+def locators(cnf_save_fs):
+    """ Get the locators of the conformers with a saved geometry, None if
+        the index is off or cannot be read.
+
+        The rings whose directories changed since they were last listed
+        are listed again, and the conformers that had no geometry are
+        checked again.
+
+        :param cnf_save_fs: CONF object with save filesys prefix
+        :type cnf_save_fs: autofile.fs.conformer obj
+        :rtype: tuple(tuple(str))
+    """
+
+    locs_lst = None
+    cnfs_path = cnf_save_fs[0].path()
+    if enabled() and os.path.isdir(cnfs_path):
+        try:
+            with closing(_connect(cnfs_path)) as conn, conn:
+                _rescan(conn, cnf_save_fs, cnfs_path)
+                locs_lst = tuple(sorted(conn.execute(
+                    'SELECT rid, cid FROM vals'
+                    ' WHERE key = ? AND val IS NOT NULL',
+                    (_GEO_KEY,))))
+        except (sqlite3.Error, OSError):
+            locs_lst = None
+
+    return locs_lst
+
+
+# Values for sorting conformers
+def energies(cnf_save_fs, locs_lst, sp_locs):
+    """ Get the energies of conformers at the level of theory of the
+        SP layer locators, None for any conformer without one.
+
+        :param cnf_save_fs: CONF object with save filesys prefix
+        :type cnf_save_fs: autofile.fs.conformer obj
+        :param locs_lst: locators of the conformers
+        :type locs_lst: tuple(tuple(str))
+        :param sp_locs: locators for the SP layer (thy_info[1:4])
+        :type sp_locs: tuple(str)
+        :rtype: dict[tuple(str): float]
+    """
+
+    def _read(locs):
+        ene = None
+        sp_fs = autofile.fs.single_point(cnf_save_fs[-1].path(locs))
+        if sp_fs[-1].file.energy.exists(sp_locs):
+            ene = sp_fs[-1].file.energy.read(sp_locs)
+        return ene
+
+    return _values(cnf_save_fs, locs_lst, _energy_key(sp_locs), _read)
+
+
+def zpes(cnf_save_fs, locs_lst):
+    """ Get the harmonic ZPEs, from the positive frequencies, of
+        conformers, None for any conformer without frequencies.
+
+        :param cnf_save_fs: CONF object with save filesys prefix
+        :type cnf_save_fs: autofile.fs.conformer obj
+        :param locs_lst: locators of the conformers
+        :type locs_lst: tuple(tuple(str))
+        :rtype: dict[tuple(str): float]
+    """
+
+    def _read(locs):
+        zpe = None
+        if cnf_save_fs[-1].file.harmonic_frequencies.exists(locs):
+            zpe = _zpe(cnf_save_fs[-1].file.harmonic_frequencies.read(locs))
+        return zpe
+
+    return _values(cnf_save_fs, locs_lst, 'zpe', _read)
+
+
+def hbond_flags(cnf_save_fs, locs_lst, hbond_cutoffs, flag_fxn):
+    """ Get whether conformers are hydrogen bonded, None for any
+        conformer without a geometry.
+
+        :param cnf_save_fs: CONF object with save filesys prefix
+        :type cnf_save_fs: autofile.fs.conformer obj
+        :param locs_lst: locators of the conformers
+        :type locs_lst: tuple(tuple(str))
+        :param hbond_cutoffs: cutoffs used to identify hydrogen bonds
+        :type hbond_cutoffs: tuple(float)
+        :param flag_fxn: function of the locators that determines the flag
+            from the saved geometry, None if there is none
+        :type flag_fxn: function
+        :rtype: dict[tuple(str): bool]
+    """
+
+    key = f'hbond:{hbond_cutoffs}'
+    vals = _values(cnf_save_fs, locs_lst, key, flag_fxn)
+
+    return {locs: (bool(val) if val is not None else None)
+            for locs, val in vals.items()}
+
+
+def fingerprints(cnf_save_fs, locs_lst, fprint_fxn):
+    """ Get fingerprints of the geometries of conformers, e.g. their
+        sorted Coulomb-matrix eigenvalues, None for any conformer without
+        a geometry.
+
+        :param cnf_save_fs: CONF object with save filesys prefix
+        :type cnf_save_fs: autofile.fs.conformer obj
+        :param locs_lst: locators of the conformers
+        :type locs_lst: tuple(tuple(str))
+        :param fprint_fxn: function of the locators that determines the
+            fingerprint from the saved geometry
+        :type fprint_fxn: function
+        :rtype: dict[tuple(str): numpy.ndarray]
+    """
+
+    def _read(locs):
+        fprint = fprint_fxn(locs)
+        if fprint is not None:
+            fprint = numpy.asarray(fprint, dtype=float).tobytes()
+        return fprint
+
+    vals = _values(cnf_save_fs, locs_lst, _FPRINT_KEY, _read)
+
+    return {locs: (numpy.frombuffer(val, dtype=float)
+                   if val is not None else None)
+            for locs, val in vals.items()}
+
+
+def energy_neighbors(cnf_save_fs, locs_lst, sp_locs, ene, ethresh):
+    """ Find the conformers with energies within a threshold of some
+        energy.
+
+        Returns the locators of the conformers in range, along with
+        their energies, and the locators of those without an energy.
+
+        :param cnf_save_fs: CONF object with save filesys prefix
+        :type cnf_save_fs: autofile.fs.conformer obj
+        :param locs_lst: locators of the conformers to search
+        :type locs_lst: tuple(tuple(str))
+        :param sp_locs: locators for the SP layer (thy_info[1:4])
+        :type sp_locs: tuple(str)
+        :param ene: energy to compare to
+        :type ene: float
+        :param ethresh: energy threshold
+        :type ethresh: float
+        :rtype: (tuple(tuple(str)), tuple(float), tuple(tuple(str)))
+    """
+
+    locs_lst = tuple(tuple(locs) for locs in locs_lst)
+    enes = energies(cnf_save_fs, locs_lst, sp_locs)
+
+    near_locs_lst = tuple(
+        locs for locs in locs_lst
+        if enes[locs] is not None and abs(enes[locs] - ene) < ethresh)
+    near_enes = tuple(enes[locs] for locs in near_locs_lst)
+    no_ene_locs_lst = tuple(
+        locs for locs in locs_lst if enes[locs] is None)
+
+    return near_locs_lst, near_enes, no_ene_locs_lst
+
+
+# Updates made when values are saved
+def save_geometry(cnf_fs, cnf_locs):
+    """ Add a conformer whose geometry was saved to the index, dropping
+        the hydrogen-bond flags and fingerprint of any geometry saved
+        before
+
+        :param cnf_fs: CONF object with save filesys prefix
+        :type cnf_fs: autofile.fs.conformer obj
+        :param cnf_locs: locators of the conformer
+        :type cnf_locs: tuple(str)
+    """
+    cnf_path = cnf_fs[-1].path(cnf_locs)
+    _execute(cnf_path,
+             'DELETE FROM vals'
+             ' WHERE rid = ? AND cid = ? AND (key LIKE ? OR key = ?)',
+             ('hbond:%', _FPRINT_KEY))
+    _save(cnf_path, _GEO_KEY, 1.0)
+
+
+def save_energy(sp_fs, sp_locs, ene):
+    """ Add an energy saved in the SP layer of a conformer to the index
+
+        :param sp_fs: SP object with the conformer path as its prefix
+        :type sp_fs: autofile.fs.single_point obj
+        :param sp_locs: locators for the SP layer (thy_info[1:4])
+        :type sp_locs: tuple(str)
+        :param ene: energy
+        :type ene: float
+    """
+    _save(os.path.dirname(sp_fs[0].path()), _energy_key(sp_locs), ene)
+
+
+def save_frequencies(cnf_fs, cnf_locs, freqs):
+    """ Add the ZPE from frequencies saved for a conformer to the index
+
+        :param cnf_fs: CONF object with save filesys prefix
+        :type cnf_fs: autofile.fs.conformer obj
+        :param cnf_locs: locators of the conformer
+        :type cnf_locs: tuple(str)
+        :param freqs: harmonic frequencies
+        :type freqs: tuple(float)
+    """
+    _save(cnf_fs[-1].path(cnf_locs), 'zpe', _zpe(freqs))
+
+
+def remove(cnf_path):
+    """ Drop a conformer from the index, e.g., when its directory is
+        removed from the save filesystem
+
+        :param cnf_path: path to the conformer
+        :type cnf_path: str
+    """
+    _execute(cnf_path, 'DELETE FROM vals WHERE rid = ? AND cid = ?', ())
+
+
+# Database access
+def _values(cnf_save_fs, locs_lst, key, read_fxn):
+    """ Get a value for each conformer from the index, reading it with
+        `read_fxn`, and adding it to the index, if it has none for the
+        conformer; a value saved meanwhile is not replaced
+    """
+
+    locs_lst = tuple(tuple(locs) for locs in locs_lst)
+
+    saved = None
+    if enabled():
+        try:
+            with closing(_connect(cnf_save_fs[0].path())) as conn, conn:
+                saved = {
+                    (rid, cid): val for rid, cid, val in conn.execute(
+                        'SELECT rid, cid, val FROM vals WHERE key = ?',
+                        (key,))}
+        except sqlite3.Error:
+            saved = None
+
+    vals, new_rows = {}, []
+    for locs in locs_lst:
+        if saved is not None and saved.get(locs) is not None:
+            vals[locs] = saved[locs]
+        else:
+            vals[locs] = read_fxn(locs)
+            new_rows.append((*locs, key, _db_value(vals[locs])))
+
+    if saved is not None and new_rows:
+        try:
+            with closing(_connect(cnf_save_fs[0].path())) as conn, conn:
+                conn.executemany(
+                    'INSERT OR IGNORE INTO vals VALUES (?, ?, ?, ?)',
+                    new_rows)
+                conn.executemany(
+                    'UPDATE vals SET val = ?'
+                    ' WHERE rid = ? AND cid = ? AND key = ? AND val IS NULL',
+                    [(val, rid, cid, key)
+                     for rid, cid, key, val in new_rows if val is not None])
+        except sqlite3.Error:
+            pass
+
+    return vals
+
+
+def _rescan(conn, cnf_save_fs, cnfs_path):
+    """ Bring the conformers in the index up to date with the directories
+        of the rings that changed since they were last listed, and check
+        for the geometries of those seen without one
+    """
+
+    scan_stamps = dict(conn.execute(
+        'SELECT rid, val FROM vals WHERE key = ?', (_SCAN_KEY,)))
+
+    # The modification time of each ring is taken before listing it, so
+    # that a conformer added during the listing is found the next time
+    ring_stamps = {}
+    with os.scandir(cnfs_path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                ring_stamps[entry.name] = float(entry.stat().st_mtime_ns)
+
+    for rid in set(scan_stamps) - set(ring_stamps):
+        conn.execute('DELETE FROM vals WHERE rid = ?', (rid,))
+
+    check_locs_lst = [
+        (rid, cid) for rid, cid in conn.execute(
+            'SELECT rid, cid FROM vals WHERE key = ? AND val IS NULL',
+            (_GEO_KEY,))]
+    for rid, stamp in ring_stamps.items():
+        if scan_stamps.get(rid) != stamp:
+            with os.scandir(os.path.join(cnfs_path, rid)) as entries:
+                cids = {entry.name for entry in entries if entry.is_dir()}
+            for (cid,) in conn.execute(
+                    'SELECT DISTINCT cid FROM vals WHERE rid = ?', (rid,)):
+                if cid and cid not in cids:
+                    conn.execute(
+                        'DELETE FROM vals WHERE rid = ? AND cid = ?',
+                        (rid, cid))
+            known_cids = {cid for (cid,) in conn.execute(
+                'SELECT cid FROM vals WHERE rid = ? AND key = ?',
+                (rid, _GEO_KEY))}
+            check_locs_lst.extend(
+                (rid, cid) for cid in sorted(cids - known_cids))
+            conn.execute(
+                'INSERT OR REPLACE INTO vals VALUES (?, ?, ?, ?)',
+                (rid, '', _SCAN_KEY, stamp))
+
+    for locs in check_locs_lst:
+        has_geo = cnf_save_fs[-1].file.geometry.exists(locs)
+        conn.execute(
+            'INSERT OR IGNORE INTO vals VALUES (?, ?, ?, ?)',
+            (*locs, _GEO_KEY, None))
+        if has_geo:
+            conn.execute(
+                'UPDATE vals SET val = 1.0'
+                ' WHERE rid = ? AND cid = ? AND key = ?',
+                (*locs, _GEO_KEY))
+
+
+def _save(cnf_path, key, val):
+    """ Store the value for the conformer at the path
+    """
+    if val is not None:
+        _execute(cnf_path,
+                 'INSERT OR REPLACE INTO vals VALUES (?, ?, ?, ?)',
+                 (key, _db_value(val)))
+
+
+def _execute(cnf_path, statement, params):
+    """ Execute a statement on the index holding the conformer at the
+        path, if it lies in the CONFS layer of the save filesystem; the
+        rid and cid of the conformer are the first parameters
+    """
+
+    cnfs_path, rid = os.path.split(os.path.dirname(cnf_path))
+    cid = os.path.basename(cnf_path)
+    if enabled() and os.path.basename(cnfs_path) == 'CONFS':
+        try:
+            with closing(_connect(cnfs_path)) as conn, conn:
+                conn.execute(statement, (rid, cid) + tuple(params))
+        except sqlite3.Error:
+            pass
+
+
+def _connect(cnfs_path):
+    """ Open the index database in the CONFS layer
+    """
+    conn = sqlite3.connect(os.path.join(cnfs_path, INDEX_NAME), timeout=60.)
+    for statement in _SCHEMA:
+        conn.execute(statement)
+    return conn
+
+
+def _db_value(val):
+    """ Value as stored in the index: bytes as they are, numbers as floats
+    """
+    if val is not None and not isinstance(val, bytes):
+        val = float(val)
+    return val
+
+
+def _energy_key(sp_locs):
+    """ Key for the energies at the level of theory of the SP locators
+    """
+    return 'energy:' + ','.join(str(loc) for loc in sp_locs)
+
+
+def _zpe(freqs):
+    """ Harmonic ZPE from the positive frequencies
+    """
+    return 0.5 * sum(freq for freq in freqs if freq > 0.) * phycon.WAVEN2EH
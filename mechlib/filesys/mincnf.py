@@ -2,8 +2,7 @@
   Functions to read the filesystem and pull objects from it
 """
 
-import os
-import time
+from collections import OrderedDict
 import numpy
 import autofile
 import elstruct
@@ -16,6 +15,26 @@ from automol.geom import hydrogen_bonded_structure
 from autorun import execute_function_in_parallel
 from mechanalyzer.inf import thy as tinfo
 from mechlib.amech_io import printer as ioprinter
+from mechlib.amech_io import reader
+from mechlib.filesys import archive
+from mechlib.filesys import index
+from mechlib.filesys import pending
+
+
+# Most energies to sort conformers by, and frequency locations, kept in
+# memory
+MAX_SORT_ENES = 4096
+
+# Energies to sort conformers by, found in this process, least recently
+# used first
+_SORT_ENE_MEMO = OrderedDict()
+
+# Locations of the frequencies of conformers at other levels of theory,
+# found in this process, least recently used first
+_FREQ_LOC_MEMO = OrderedDict()
+
+# Number of Z-Matrices compared against a set at once
+MATCH_BATCH = 50
 
 
 def min_energy_conformer_locators(
@@ -81,12 +100,17 @@ def conformer_locators(
 
         fin_locs_lst, fin_paths_lst = (), ()
 
-        cnf_locs_lst = cnf_save_fs[-1].existing()
+        # List the conformers from the index, if it is on
+        cnf_locs_lst = index.locators(cnf_save_fs)
+        indexed = cnf_locs_lst is not None
+        if not indexed:
+            cnf_locs_lst = cnf_save_fs[-1].existing()
         if cnf_locs_lst:
             cnf_locs_lst, cnf_enes_lst = _sorted_cnf_lsts(
                 cnf_locs_lst, cnf_save_fs, mod_thy_info,
                 freq_info=freq_info, sp_info=sp_info,
-                sort_prop_dct=sort_prop_dct, nprocs=nprocs)
+                sort_prop_dct=sort_prop_dct, nprocs=nprocs,
+                indexed=indexed)
             if only_hbnds:
                 cnf_locs_lst, cnf_enes_lst = _remove_nonhbonded_structures(
                     cnf_save_fs, cnf_locs_lst, cnf_enes_lst,
@@ -187,12 +211,17 @@ def conformer_locators(
 
 def _sorted_cnf_lsts(
         cnf_locs_lst, cnf_save_fs, mod_thy_info,
-        freq_info=None, sp_info=None, sort_prop_dct=None, nprocs=1):
+        freq_info=None, sp_info=None, sort_prop_dct=None, nprocs=1,
+        indexed=False):
     """ Sort the list of conformer locators in the save filesystem
         using the energies from the specified electronic structure method.
         The conformers are sorted such that the energies are sorted
         in ascedning order.
 
+        If the locators are those of the conformers with a geometry in the
+        conformer index (`indexed`), the energies are taken from it as well
+        when possible.
+
         :param cnf_locs_lst:
         :type cnf_locs_lst: tuple(tuple(tuple(str),tuple(str)))
         :param cnf_save_fs: CONF object with save filesys prefix
@@ -207,48 +236,78 @@ def _sorted_cnf_lsts(
             sp_info, sort_prop_dct, cnf_locs_lst,
             output_queue=None):
         locs_enes_dct = {}
-        first_enes = None
         for locs in cnf_locs_lst:
-            sort_ene, first_enes = _sort_energy_parameter(
+            locs_enes_dct[tuple(locs)] = _sort_energy_with_reference(
                 locs, cnf_save_fs, mod_thy_info, freq_info,
-                sp_info, sort_prop_dct, first_enes=first_enes)
-            if first_enes is not None:
-                locs_enes_dct[tuple(locs)] = (sort_ene, sum(first_enes))
-            else:
-                locs_enes_dct[tuple(locs)] = (sort_ene, first_enes)
+                sp_info, sort_prop_dct)
         output_queue.put((locs_enes_dct,))
 
     fnd_cnf_enes_lst = []
     fnd_cnf_locs_lst = []
+    index_sort_prop = None
+    if indexed:
+        index_sort_prop = _indexed_sort(
+            freq_info, sort_prop_dct, mod_thy_info)
     if len(cnf_locs_lst) == 1:
         fnd_cnf_enes_lst = [10]
         fnd_cnf_locs_lst = cnf_locs_lst
+    elif index_sort_prop is not None:
+        fnd_cnf_locs_lst, fnd_cnf_enes_lst = _indexed_sort_energies(
+            cnf_locs_lst, cnf_save_fs, mod_thy_info, sp_info,
+            index_sort_prop)
     else:
-        args = (
-                cnf_save_fs, mod_thy_info, freq_info,
-                sp_info, sort_prop_dct
-                )
-        locs_enes_dct_lst = execute_function_in_parallel(
-            _parallel_get_sort_energy_parameters, cnf_locs_lst,
-            args, nprocs=1)
+        # Use the values already found for conformers in this process,
+        # and evaluate the rest, split over the processors
+        memo_keys = {
+            tuple(locs): _sort_memo_key(
+                locs, cnf_save_fs, mod_thy_info, freq_info,
+                sp_info, sort_prop_dct)
+            for locs in cnf_locs_lst}
+        locs_enes_dct = {}
+        for locs, key in memo_keys.items():
+            if key in _SORT_ENE_MEMO:
+                _SORT_ENE_MEMO.move_to_end(key)
+                locs_enes_dct[locs] = _SORT_ENE_MEMO[key]
+        new_locs_lst = tuple(
+            locs for locs in cnf_locs_lst if tuple(locs) not in locs_enes_dct)
+        if new_locs_lst:
+            args = (
+                    cnf_save_fs, mod_thy_info, freq_info,
+                    sp_info, sort_prop_dct
+                    )
+            if nprocs > 1 and len(new_locs_lst) > 1:
+                new_enes_dct_lst = execute_function_in_parallel(
+                    _parallel_get_sort_energy_parameters, new_locs_lst,
+                    args, nprocs=min(nprocs, len(new_locs_lst)))
+            else:
+                new_enes_dct_lst = (
+                    {tuple(locs): _sort_energy_with_reference(locs, *args)
+                     for locs in new_locs_lst},)
+            for new_enes_dct in new_enes_dct_lst:
+                for locs, enes in new_enes_dct.items():
+                    locs_enes_dct[locs] = enes
+                    if enes[0] is not None:
+                        _SORT_ENE_MEMO[memo_keys[locs]] = enes
+            while len(_SORT_ENE_MEMO) > MAX_SORT_ENES:
+                _SORT_ENE_MEMO.popitem(last=False)
+
+        # Put the values relative to the reference values of the first
+        # conformer that has them, independent of how the work was split
         first_ene = None
-        for locs_enes_dct in locs_enes_dct_lst:
-            for locs in locs_enes_dct:
-                _, locs_first_ene = locs_enes_dct[locs]
-                if locs_first_ene is not None:
-                    first_ene = locs_first_ene
+        for locs in cnf_locs_lst:
+            _, locs_first_ene = locs_enes_dct[tuple(locs)]
+            if locs_first_ene is not None:
+                first_ene = locs_first_ene
                 break
 
         for locs in cnf_locs_lst:
-            for locs_enes_dct in locs_enes_dct_lst:
-                if tuple(locs) in locs_enes_dct:
-                    sort_ene, tmp_first_ene = locs_enes_dct[tuple(locs)]
-                    if sort_ene is not None:
-                        if first_ene is not None:
-                            sort_ene = sort_ene + (
-                                (tmp_first_ene - first_ene) / phycon.EH2KCAL)
-                        fnd_cnf_enes_lst.append(sort_ene)
-                        fnd_cnf_locs_lst.append(locs)
+            sort_ene, tmp_first_ene = locs_enes_dct[tuple(locs)]
+            if sort_ene is not None:
+                if first_ene is not None and tmp_first_ene is not None:
+                    sort_ene = sort_ene + (
+                        (tmp_first_ene - first_ene) / phycon.EH2KCAL)
+                fnd_cnf_enes_lst.append(sort_ene)
+                fnd_cnf_locs_lst.append(locs)
             # commenting out from merge conflict
             # elif cnf_save_fs[-1].file.geometry_info.exists(locs):
             #     ioprinter.info_message(
@@ -284,29 +343,110 @@ def _sorted_cnf_lsts(
     return cnf_locs_lst, cnf_enes_lst
 
 
-def _wait_for_energy_to_be_saved(cnf_save_fs, locs, sp_fs, sp_info):
-    """ in case a geo was just written and its about to write and ene
+def _sort_energy_with_reference(
+        locs, cnf_save_fs, mod_thy_info, freq_info,
+        sp_info, sort_prop_dct):
+    """ Find the energy to sort a conformer by, along with the sum of the
+        reference energies it was made relative to (None unless sorting
+        by Gibbs energy), so that it can be shifted to any other reference
+
+        :rtype: (float, float)
     """
-    ene = None
-    # cnf_path = cnf_save_fs[-1].path(locs)
-    if cnf_save_fs[-1].file.geometry_info.exists(locs):
-        # ioprinter.info_message(
-        #     f'No energy saved in single point directory for {cnf_path}')
-        geo_inf_obj = cnf_save_fs[-1].file.geometry_info.read(
-            locs)
-        geo_path = cnf_save_fs[-1].file.geometry_info.path(locs)
-        geo_end_time = geo_inf_obj.utc_end_time
-        current_time = autofile.schema.utc_time()
-        _time = (current_time - geo_end_time).total_seconds()
-        if _time < 120:
-            wait_time = 120 - _time
-            ioprinter.info_message(
-                f'Geo was saved in the last {_time:3.2f} seconds, '
-                f'waiting for {wait_time:3.2f} seconds')
-            time.sleep(wait_time)
-            if sp_fs[-1].file.energy.exists(sp_info[1:4]):
-                ene = sp_fs[-1].file.energy.read(sp_info[1:4])
-    return ene
+    sort_ene, first_enes = _sort_energy_parameter(
+        locs, cnf_save_fs, mod_thy_info, freq_info,
+        sp_info, sort_prop_dct)
+    return sort_ene, (sum(first_enes) if first_enes is not None else None)
+
+
+def _sort_memo_key(
+        locs, cnf_save_fs, mod_thy_info, freq_info,
+        sp_info, sort_prop_dct):
+    """ Key for the sort energy of a conformer, which includes the
+        modification times of its geometry and of the frequencies and
+        energy read for it, which are those of the conformer at the
+        frequency level of theory if that differs (found once, with
+        `_freq_location`), so that a value is not reused once any has been
+        saved again
+    """
+    cnf_path = cnf_save_fs[-1].path(locs)
+    sp_thy_info = sp_info if sp_info is not None else mod_thy_info
+    geo_path = cnf_save_fs[-1].file.geometry.path(locs)
+
+    stamps = (archive.mtime(geo_path),)
+    freq_fs, freq_locs = cnf_save_fs, locs
+    if freq_info is not None and freq_info != mod_thy_info:
+        freq_locs = None
+        if stamps[0] is not None:
+            freq_fs, freq_locs = _freq_location(
+                cnf_save_fs, locs, freq_info[1:4])
+
+    if freq_locs is not None:
+        sp_fs = autofile.fs.single_point(freq_fs[-1].path(freq_locs))
+        stamps += (
+            freq_fs[-1].path(freq_locs),
+            archive.mtime(
+                freq_fs[-1].file.harmonic_frequencies.path(freq_locs)),
+            archive.mtime(sp_fs[-1].file.energy.path(sp_thy_info[1:4])))
+    return (cnf_path, tuple(mod_thy_info),
+            tuple(freq_info) if freq_info is not None else None,
+            tuple(sp_info) if sp_info is not None else None,
+            tuple(sorted((sort_prop_dct or {}).items()))) + stamps
+
+
+def _indexed_sort(freq_info, sort_prop_dct, mod_thy_info):
+    """ Determine if the conformers can be sorted using only the values
+        in the conformer index: electronic energies, plus ZPEs from
+        frequencies at the geometry level of theory.
+
+        :rtype: str ('electronic' or 'ground'), or None if they cannot
+    """
+    sort_prop = None
+    sort_prop_dct = sort_prop_dct or {}
+    if index.enabled():
+        if sort_prop_dct.get('enthalpy') == 0:
+            if freq_info is None or freq_info == mod_thy_info:
+                sort_prop = 'ground'
+        elif 'entropy' not in sort_prop_dct and 'gibbs' not in sort_prop_dct:
+            sort_prop = 'electronic'
+    return sort_prop
+
+
+def _indexed_sort_energies(
+        cnf_locs_lst, cnf_save_fs, mod_thy_info, sp_info, sort_prop):
+    """ Get the energies to sort the conformers by from the conformer
+        index, in the same way as `_sort_energy_parameter`.
+
+        :rtype (tuple(tuple(str)), tuple(float))
+    """
+
+    sp_thy_info = sp_info if sp_info is not None else mod_thy_info
+    enes = index.energies(cnf_save_fs, cnf_locs_lst, sp_thy_info[1:4])
+    if sort_prop == 'ground':
+        zpes = index.zpes(cnf_save_fs, cnf_locs_lst)
+
+    fnd_cnf_locs_lst, fnd_cnf_enes_lst = [], []
+    for locs in cnf_locs_lst:
+        ene = enes[tuple(locs)]
+        if ene is None:
+            sp_fs = autofile.fs.single_point(cnf_save_fs[-1].path(locs))
+            ene = _wait_for_energy_to_be_saved(
+                cnf_save_fs, locs, sp_fs, sp_thy_info[1:4])
+        if ene is not None and sort_prop == 'ground':
+            zpe = zpes[tuple(locs)]
+            ene = ene + zpe if zpe is not None else None
+        if ene is not None:
+            fnd_cnf_locs_lst.append(locs)
+            fnd_cnf_enes_lst.append(ene)
+
+    return fnd_cnf_locs_lst, fnd_cnf_enes_lst
+
+
+def _wait_for_energy_to_be_saved(cnf_save_fs, locs, sp_fs, sp_locs):
+    """ in case a geo was just written and its about to write and ene,
+        wait for the ene while its save is marked as pending
+    """
+    return pending.wait_for_energy(
+        cnf_save_fs[-1].path(locs), sp_fs, sp_locs)
 
 
 def _erange_locs(cnf_locs, cnf_enes, ethresh, ignore_locs_lst=()):
@@ -499,24 +639,10 @@ def _remove_hbonded_structures(
     """
     fin_locs_lst = ()
     fin_enes_lst = ()
+    hbond_dct = _hbond_flags(cnf_save_fs, cnf_locs_lst, hbond_cutoffs)
     for locs, enes in zip(cnf_locs_lst, cnf_enes_lst):
-        if cnf_save_fs[-1].file.geometry.exists(locs):
-            geo = cnf_save_fs[-1].file.geometry.read(locs)
-
-            # Try and get a reaction object for transition state
-            zma_fs = autofile.fs.zmatrix(cnf_save_fs[-1].path(locs))
-            if zma_fs[-1].file.reaction.exists((0,)):
-                zrxn = zma_fs[-1].file.reaction.read((0,))
-                grxn = relabel_for_geometry(zrxn)
-            else:
-                grxn = None
-
-            if hbond_cutoffs is not None:
-                hydrogen_bonded_structure_ = hydrogen_bonded_structure(
-                    geo, *hbond_cutoffs, grxn=grxn)
-            else:
-                hydrogen_bonded_structure_ = hydrogen_bonded_structure(
-                    geo, grxn=grxn)
+        hydrogen_bonded_structure_ = hbond_dct[tuple(locs)]
+        if hydrogen_bonded_structure_ is not None:
             if not hydrogen_bonded_structure_:
                 fin_locs_lst += (locs,)
                 fin_enes_lst += (enes,)
@@ -532,7 +658,27 @@ def _remove_nonhbonded_structures(
     """
     fin_locs_lst = ()
     fin_enes_lst = ()
+    hbond_dct = _hbond_flags(cnf_save_fs, cnf_locs_lst, hbond_cutoffs)
     for locs, enes in zip(cnf_locs_lst, cnf_enes_lst):
+        hydrogen_bonded_structure_ = hbond_dct[tuple(locs)]
+        if hydrogen_bonded_structure_ is not None:
+            if hydrogen_bonded_structure_:
+                fin_locs_lst += (locs,)
+                fin_enes_lst += (enes,)
+            else:
+                print(
+                    'Removing ', locs, ' from list because its not hbonded.',
+                    'Cutoffs are', hbond_cutoffs)
+    return fin_locs_lst, fin_enes_lst
+
+
+def _hbond_flags(cnf_save_fs, cnf_locs_lst, hbond_cutoffs=None):
+    """ Determine whether each conformer is hydrogen bonded, None if it
+        has no geometry saved
+    """
+
+    def _hbond_flag(locs):
+        flag = None
         if cnf_save_fs[-1].file.geometry.exists(locs):
             geo = cnf_save_fs[-1].file.geometry.read(locs)
 
@@ -545,19 +691,20 @@ def _remove_nonhbonded_structures(
                 grxn = None
 
             if hbond_cutoffs is not None:
-                hydrogen_bonded_structure_ = hydrogen_bonded_structure(
+                flag = hydrogen_bonded_structure(
                     geo, *hbond_cutoffs, grxn=grxn)
             else:
-                hydrogen_bonded_structure_ = hydrogen_bonded_structure(
+                flag = hydrogen_bonded_structure(
                     geo, grxn=grxn)
-            if hydrogen_bonded_structure_:
-                fin_locs_lst += (locs,)
-                fin_enes_lst += (enes,)
-            else:
-                print(
-                    'Removing ', locs, ' from list because its not hbonded.',
-                    'Cutoffs are', hbond_cutoffs)
-    return fin_locs_lst, fin_enes_lst
+        return flag
+
+    if index.enabled():
+        hbond_dct = index.hbond_flags(
+            cnf_save_fs, cnf_locs_lst, hbond_cutoffs, _hbond_flag)
+    else:
+        hbond_dct = {tuple(locs): _hbond_flag(locs) for locs in cnf_locs_lst}
+
+    return hbond_dct
 
 
 def _process_cnf_range(cnf_range):
@@ -674,8 +821,10 @@ def this_conformer_was_run_in_run(zma, cnf_fs):
                     method = inf_obj.method
                     prog = inf_obj.prog
                     out_str = run_fs[-1].file.output.read([job])
-                    idx_ene = elstruct.reader.energy(prog, method, out_str)
-                    idx_geo = elstruct.reader.opt_geometry(prog, out_str)
+                    idx_ene = reader.es.cached(
+                        elstruct.reader.energy, prog, method, out_str)
+                    idx_geo = reader.es.cached(
+                        elstruct.reader.opt_geometry, prog, out_str)
                     if idx == locs_idx:
                         # out_enes.append(10000)
                         # out_geos.append(None)
@@ -732,7 +881,8 @@ def collect_rrho_params(
             freq_fs = cnf_save_fs
             freq_locs = locs
         else:
-            freq_fs, freq_locs = get_freq_location(cnf_save_fs, geo, freq_info[1:4], locs)
+            freq_fs, freq_locs = _freq_location(
+                cnf_save_fs, locs, freq_info[1:4], geo=geo)
 
         if freq_locs is not None:
             if freq_fs[-1].file.harmonic_frequencies.exists(freq_locs):
@@ -748,7 +898,7 @@ def collect_rrho_params(
                 ene = sp_fs[-1].file.energy.read(sp_thy_info)
             else:
                 ene = _wait_for_energy_to_be_saved(
-                    cnf_save_fs, locs, sp_fs, sp_info)
+                    cnf_save_fs, locs, sp_fs, sp_thy_info)
 
     if freqs is not None:
         freqs = [freq for freq in freqs if freq > 0.]
@@ -756,6 +906,30 @@ def collect_rrho_params(
     return geo, freqs, ene
 
 
+def _freq_location(cnf_fs, cnf_locs, freq_thy_locs, geo=None):
+    """ Find the frequencies for a conformer at a different level of
+        theory with `get_freq_location`, reusing a location found before
+        as long as the geometry of the conformer has not been saved again
+        and the location still exists
+    """
+
+    key = (cnf_fs[-1].path(cnf_locs), tuple(freq_thy_locs),
+           archive.mtime(cnf_fs[-1].file.geometry.path(cnf_locs)))
+    freq_loc = _FREQ_LOC_MEMO.get(key)
+    if freq_loc is not None and freq_loc[0][-1].exists(freq_loc[1]):
+        _FREQ_LOC_MEMO.move_to_end(key)
+    else:
+        if geo is None:
+            geo = cnf_fs[-1].file.geometry.read(cnf_locs)
+        freq_loc = get_freq_location(cnf_fs, geo, freq_thy_locs, cnf_locs)
+        if freq_loc[1] is not None:
+            _FREQ_LOC_MEMO[key] = freq_loc
+            while len(_FREQ_LOC_MEMO) > MAX_SORT_ENES:
+                _FREQ_LOC_MEMO.popitem(last=False)
+
+    return freq_loc
+
+
 def get_freq_location(cnf_fs, geo, freq_thy_locs, cnf_locs):
     """ find the frequencies for a conformer at a different level of theory
     """
@@ -873,49 +1047,140 @@ def fs_confs_dict(cnf_save_fs, cnf_save_locs_lst,
     """ Assess which structures from the cnf_save_fs currently exist
         within the ini_cnf_save_fs. Generate a dictionary to connect
         the two
+
+        The Z-Matrices of both sets of conformers, along with those of
+        their symmetrically equivalent geometries, are read once and
+        compared all at once.
     """
-    match_dct = {}
-    for ini_locs in ini_cnf_save_locs_lst:
 
+    # Read the Z-Matrices of each conformer, followed by those of its
+    # symmetric geometries
+    ini_zmas_lst = tuple(
+        _zmas_with_symmetry(ini_cnf_save_fs, locs)
+        for locs in ini_cnf_save_locs_lst)
+    zmas_lst = tuple(
+        _zmas_with_symmetry(cnf_save_fs, locs)
+        for locs in cnf_save_locs_lst)
+
+    match = almost_equal_matrix(
+        zmatrix_value_arrays(sum(ini_zmas_lst, ())),
+        zmatrix_value_arrays(sum(zmas_lst, ())),
+        dist_rtol=0.1, ang_atol=.4)
+
+    # Split the columns into matches to the Z-Matrix of each conformer
+    # and matches to any of its symmetric geometries
+    starts = numpy.cumsum([0] + [len(zmas) for zmas in zmas_lst])
+    direct = match[:, starts[:-1]]
+    sym = numpy.zeros_like(direct)
+    for idx, (start, stop) in enumerate(zip(starts[:-1], starts[1:])):
+        sym[:, idx] = match[:, start+1:stop].any(axis=1)
+
+    # For each initial Z-Matrix, take the first conformer it matches,
+    # else the last with a matching symmetric geometry; the last initial
+    # Z-Matrix of a conformer with any match sets its entry
+    match_dct = {}
+    ini_starts = numpy.cumsum([0] + [len(zmas) for zmas in ini_zmas_lst])
+    for ini_locs, ini_start, ini_stop in zip(
+            ini_cnf_save_locs_lst, ini_starts[:-1], ini_starts[1:]):
         match_dct[tuple(ini_locs)] = None
-        # Loop over structs in cnf_save, see if they match the current struct
-        # inigeo = ini_cnf_save_fs[-1].file.geometry.read(ini_locs)
-        # inizma = automol.geom.zmatrix(inigeo)
-        # inizma =  ini_cnf_save_fs[-1].file.zmatrix.read(ini_locs)
-        ini_cnf_save_path = ini_cnf_save_fs[-1].path(ini_locs)
-        # ioprinter.checking('structures', ini_cnf_save_path)
-        ini_zma_save_fs = autofile.fs.zmatrix(ini_cnf_save_path)
-        inizmas = [ini_zma_save_fs[-1].file.zmatrix.read((0,))]
-        ini_sym_fs = autofile.fs.symmetry(ini_cnf_save_path)
-        dummy_key_dct = automol.zmat.dummy_key_dictionary(inizmas[0])
-        for sym_locs in ini_sym_fs[-1].existing():
-            geo = ini_sym_fs[-1].file.geometry.read(sym_locs)
-            geo_wdummy = automol.geom.insert_dummies(geo, dummy_key_dct)
-            inizmas.append(automol.zmat.from_geometry(inizmas[0], geo_wdummy))
-        for inizma in inizmas:
-            for locs in cnf_save_locs_lst:
-                # geo = cnf_save_fs[-1].file.geometry.read(locs)
-                # zma = automol.geom.zmatrix(geo)
-                zma_save_fs = autofile.fs.zmatrix(cnf_save_fs[-1].path(locs))
-                zma = zma_save_fs[-1].file.zmatrix.read((0,))
-                if automol.zmat.almost_equal(
-                        inizma, zma,
-                        dist_rtol=0.1, ang_atol=.4):
-                    # cnf_save_path = cnf_save_fs[-1].path(locs)
-                    # ioprinter.info_message(
-                    #     f'- Similar structure found at {cnf_save_path}')
-                    match_dct[tuple(ini_locs)] = tuple(locs)
-                    break
-                else:
-                    sym_fs = autofile.fs.symmetry(cnf_save_fs[-1].path(locs))
-                    dummy_key_dct = automol.zmat.dummy_key_dictionary(zma)
-                    for sym_locs in sym_fs[-1].existing():
-                        geo = sym_fs[-1].file.geometry.read(sym_locs)
-                        geo_wdummy = automol.geom.insert_dummies(
-                            geo, dummy_key_dct)
-                        sym_zma = automol.zmat.from_geometry(zma, geo_wdummy)
-                        if automol.zmat.almost_equal(
-                                inizma, sym_zma, dist_rtol=0.1, ang_atol=.4):
-                            match_dct[tuple(ini_locs)] = tuple(locs)
-                            break
+        for row in range(ini_start, ini_stop):
+            if direct[row].any():
+                idx = numpy.argmax(direct[row])
+            elif sym[row].any():
+                idx = numpy.flatnonzero(sym[row])[-1]
+            else:
+                continue
+            match_dct[tuple(ini_locs)] = tuple(cnf_save_locs_lst[idx])
+
     return match_dct
+
+
+def _zmas_with_symmetry(cnf_fs, locs):
+    """ Read the Z-Matrix of a conformer, followed by the Z-Matrices of
+        the geometries in its symmetry layer
+    """
+
+    cnf_path = cnf_fs[-1].path(locs)
+    zma_fs = autofile.fs.zmatrix(cnf_path)
+    zmas = [zma_fs[-1].file.zmatrix.read((0,))]
+
+    sym_fs = autofile.fs.symmetry(cnf_path)
+    dummy_key_dct = automol.zmat.dummy_key_dictionary(zmas[0])
+    for sym_locs in sym_fs[-1].existing():
+        geo = sym_fs[-1].file.geometry.read(sym_locs)
+        geo_wdummy = automol.geom.insert_dummies(geo, dummy_key_dct)
+        zmas.append(automol.zmat.from_geometry(zmas[0], geo_wdummy))
+
+    return tuple(zmas)
+
+
+def zmatrix_value_arrays(zmas):
+    """ Collect the values of a set of Z-Matrices into arrays, grouped
+        by their symbols and key matrices, for comparing them all at once
+        with `almost_equal_matrix`.
+
+        Angles are taken modulo 2 pi.
+
+        :param zmas: Z-Matrices
+        :type zmas: tuple(automol Z-Matrix data structure)
+        :rtype: (int, dict[tuple: (numpy.ndarray, numpy.ndarray,
+            numpy.ndarray)])
+    """
+
+    grp_dct = {}
+    for idx, zma in enumerate(zmas):
+        key = (automol.zmat.symbols(zma), automol.zmat.key_matrix(zma))
+        val_mat = numpy.array(automol.zmat.value_matrix(zma), dtype=float)
+        dists = val_mat[1:, 0]
+        angs = numpy.mod(
+            numpy.hstack((val_mat[2:, 1], val_mat[3:, 2])), 2*numpy.pi)
+
+        idxs, dists_lst, angs_lst = grp_dct.setdefault(key, ([], [], []))
+        idxs.append(idx)
+        dists_lst.append(dists)
+        angs_lst.append(angs)
+
+    grp_dct = {
+        key: (numpy.array(idxs, dtype=int),
+              numpy.array(dists_lst), numpy.array(angs_lst))
+        for key, (idxs, dists_lst, angs_lst) in grp_dct.items()}
+
+    return len(zmas), grp_dct
+
+
+def almost_equal_matrix(zma_arrs1, zma_arrs2, dist_rtol=2e-5, ang_atol=2e-3):
+    """ Assess which pairs of Z-Matrices from two sets are numerically
+        equal, with the same test as `automol.zmat.almost_equal` applied
+        to each pair, the first set giving its first argument.
+
+        :param zma_arrs1: arrays of the first set of Z-Matrices, from
+            `zmatrix_value_arrays`
+        :param zma_arrs2: arrays of the second set of Z-Matrices
+        :param dist_rtol: relative tolerance for the distances
+        :type dist_rtol: float
+        :param ang_atol: absolute tolerance for the angles
+        :type ang_atol: float
+        :rtype: numpy.ndarray
+    """
+
+    nzmas1, grp_dct1 = zma_arrs1
+    nzmas2, grp_dct2 = zma_arrs2
+
+    match = numpy.zeros((nzmas1, nzmas2), dtype=bool)
+    for key, (idxs1, dists1, angs1) in grp_dct1.items():
+        if key not in grp_dct2:
+            continue
+        idxs2, dists2, angs2 = grp_dct2[key]
+        dist_tols = 1.0e-8 + dist_rtol * numpy.abs(dists2)
+        for start in range(0, len(idxs1), MATCH_BATCH):
+            stop = start + MATCH_BATCH
+            dist_diffs = numpy.abs(
+                dists1[start:stop, None, :] - dists2[None, :, :])
+            ang_diffs = numpy.abs(
+                angs1[start:stop, None, :] - angs2[None, :, :])
+            ang_diffs = numpy.pi - numpy.abs(ang_diffs - numpy.pi)
+            match[numpy.ix_(idxs1[start:stop], idxs2)] = (
+                numpy.all(dist_diffs <= dist_tols, axis=-1) &
+                numpy.all(numpy.abs(ang_diffs) <= ang_atol, axis=-1))
+
+    return match
@@ -0,0 +1,139 @@
+"""
+  Marks for conformer energies that are about to be saved
+
+  A conformer's geometry is saved a moment before its energy. While
+  `mechlib.filesys.save` writes both, it leaves a marker file in the
+  conformer directory, naming the host and process doing the save, and
+  removes it once the energy is written (or the save fails).
+
+  A reader that finds a geometry without an energy waits, checking again
+  at increasing intervals, only while the marker is there and its writer
+  may still be running. If there is no marker, or its writer has died,
+  the energy is not coming and the reader returns at once.
+
+  The same markers (`writer_marker`, `writer_running`) tell if a job in
+  the run filesystem is still being run.
+"""
+
+import os
+import time
+import socket
+from contextlib import contextmanager
+
+
+PENDING_NAME = 'energy.pending'
+
+# Longest time (s) to wait on a writer, and between checks of the energy
+MAX_WAIT = 120.
+MAX_DELAY = 2.
+
+
+@contextmanager
+def energy_pending(cnf_fs, cnf_locs):
+    """ Mark the energy of a conformer as about to be saved while the
+        code in the context saves it.
+
+        :param cnf_fs: CONF object with save filesys prefix
+        :type cnf_fs: autofile.fs.conformer obj
+        :param cnf_locs: locators of the conformer
+        :type cnf_locs: tuple(str)
+    """
+
+    cnf_fs[-1].create(cnf_locs)
+    with writer_marker(os.path.join(cnf_fs[-1].path(cnf_locs), PENDING_NAME)):
+        yield
+
+
+@contextmanager
+def writer_marker(marker):
+    """ Leave a marker file naming the host and process while the code in
+        the context runs, so that others can tell if it is still running
+        (see `writer_running`).
+
+        :param marker: path of the marker file
+        :type marker: str
+    """
+
+    try:
+        with open(marker, 'w', encoding='utf-8') as mark_file:
+            mark_file.write(f'{socket.gethostname()} {os.getpid()}\n')
+    except OSError:
+        marker = None
+
+    try:
+        yield
+    finally:
+        if marker is not None:
+            try:
+                os.remove(marker)
+            except OSError:
+                pass
+
+
+def wait_for_energy(cnf_path, sp_fs, sp_locs, max_wait=MAX_WAIT):
+    """ Read the energy of a conformer, waiting for it while it is
+        marked as about to be saved; None if it is not saved.
+
+        :param cnf_path: path of the conformer, which holds the marker
+        :type cnf_path: str
+        :param sp_fs: SP object the energy is saved in
+        :type sp_fs: autofile.fs.single_point obj
+        :param sp_locs: locators for the SP layer (thy_info[1:4])
+        :type sp_locs: tuple(str)
+        :param max_wait: longest time (s) to wait
+        :type max_wait: float
+        :rtype: float
+    """
+
+    marker = os.path.join(cnf_path, PENDING_NAME)
+    end_time = time.time() + max_wait
+    delay = 0.05
+
+    ene = None
+    while True:
+        # Check the marker before the energy, so that a save finished in
+        # between is still seen
+        pending = writer_running(marker, max_age=max_wait)
+        if sp_fs[-1].file.energy.exists(sp_locs):
+            ene = sp_fs[-1].file.energy.read(sp_locs)
+            break
+        if not pending or time.time() >= end_time:
+            break
+        time.sleep(min(delay, max(end_time - time.time(), 0.)))
+        delay = min(2. * delay, MAX_DELAY)
+
+    return ene
+
+
+def writer_running(marker, max_age=None):
+    """ Check if a marker exists and the process that left it may still
+        be running. Processes on other hosts cannot be checked, so their
+        markers are trusted up to an age, or always if none is given.
+
+        :param marker: path of the marker file
+        :type marker: str
+        :param max_age: age (s) up to which to trust markers of other hosts
+        :type max_age: float
+        :rtype: bool
+    """
+
+    try:
+        with open(marker, encoding='utf-8') as mark_file:
+            host, pid = mark_file.read().split()
+        pid = int(pid)
+        age = time.time() - os.path.getmtime(marker)
+    except (OSError, ValueError):
+        return False
+
+    if host != socket.gethostname():
+        running = max_age is None or age < max_age
+    else:
+        try:
+            os.kill(pid, 0)
+            running = True
+        except ProcessLookupError:
+            running = False
+        except PermissionError:
+            running = True
+
+    return running
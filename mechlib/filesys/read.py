@@ -1,6 +1,7 @@
 """ drivers for coordinate scans
 """
 
+import os
 import numpy
 from scipy.interpolate import CubicSpline
 from scipy.interpolate import Akima1DInterpolator
@@ -11,6 +12,8 @@ from phydat import phycon
 from mechanalyzer.inf import spc as sinfo
 from mechanalyzer.inf import thy as tinfo
 from mechanalyzer.inf import rxn as rinfo
+from mechlib.filesys import archive
+from mechlib.filesys import arrays
 from mechlib.filesys._build import build_fs
 from mechlib.filesys.mincnf import min_energy_conformer_locators
 
@@ -43,24 +46,47 @@ def potential(names, grid_vals, cnf_save_path,
         scn_fs = autofile.fs.scan(zma_path)
     else:
         scn_fs = autofile.fs.cscan(zma_path)
-    # Read the filesystem
-    for idx, vals in enumerate(grid_coords):
-
-        # Get angles in degrees for potential for now
-        vals_conv = tuple(val*phycon.RAD2DEG for val in vals)
 
-        # Get locs for reading filesysten
+    # Get the locs of each point, and its back-step, for reading filesystem
+    locs_lst, back_locs_lst = [], []
+    for vals, back_vals in zip(grid_coords, back_coords):
         locs = [names, vals]
-        back_locs = [names, back_coords[idx]]
+        back_locs = [names, back_vals]
         if constraint_dct is not None:
             locs = [constraint_dct] + locs
             back_locs = [constraint_dct] + back_locs
+        locs_lst.append(locs)
+        back_locs_lst.append(back_locs)
+
+    # List the files of the scan in one pass, then read those that exist
+    scn_files = _tree_files(
+        tuple(scn_fs[-1].path(locs) for locs in locs_lst + back_locs_lst))
+
+    def _exists(ddir, locs):
+        """ Check if a file of a scan point exists """
+        return os.path.normpath(ddir.path(locs)) in scn_files
+
+    def _read(ddir, locs):
+        """ Read a file of a scan point, None if it does not exist """
+        return ddir.read(locs) if _exists(ddir, locs) else None
+
+    def _energy(locs):
+        """ Read the energy of a scan point """
+        sp_fs = autofile.fs.single_point(scn_fs[-1].path(locs))
+        return _read(sp_fs[-1].file.energy, mod_tors_ene_info[1:4])
+
+    # Read the filesystem
+    for idx, vals in enumerate(grid_coords):
+
+        # Get angles in degrees for potential for now
+        vals_conv = tuple(val*phycon.RAD2DEG for val in vals)
+        locs = locs_lst[idx]
         # print('path', scn_fs[-1].path(locs))
 
         # Read values of interest
-        ene = energy(scn_fs, locs, mod_tors_ene_info)
+        ene = _energy(locs)
         if read_energy_backstep:
-            back_ene = energy(scn_fs, back_locs, mod_tors_ene_info)
+            back_ene = _energy(back_locs_lst[idx])
             step_ene = None
             if ene is not None:
                 if back_ene is not None:
@@ -85,28 +111,20 @@ def potential(names, grid_vals, cnf_save_path,
             pot[vals_conv] = (ene - ref_ene) * phycon.EH2KCAL
 
         if read_geom:
-            if scn_fs[-1].file.geometry.exists(locs):
-                geoms[vals_conv] = scn_fs[-1].file.geometry.read(locs)
-            else:
-                geoms[vals_conv] = None
+            geoms[vals_conv] = _read(scn_fs[-1].file.geometry, locs)
 
         if read_grad:
-            if scn_fs[-1].file.gradient.exists(locs):
-                grads[vals_conv] = scn_fs[-1].file.gradient.read(locs)
-            else:
-                grads[vals_conv] = None
+            grads[vals_conv] = (
+                arrays.gradient(scn_fs, locs)
+                if _exists(scn_fs[-1].file.gradient, locs) else None)
 
         if read_hess:
-            if scn_fs[-1].file.hessian.exists(locs):
-                hessians[vals_conv] = scn_fs[-1].file.hessian.read(locs)
-            else:
-                hessians[vals_conv] = None
+            hessians[vals_conv] = (
+                arrays.hessian(scn_fs, locs)
+                if _exists(scn_fs[-1].file.hessian, locs) else None)
 
         if read_zma:
-            if scn_fs[-1].file.zmatrix.exists(locs):
-                zmas[vals_conv] = scn_fs[-1].file.zmatrix.read(locs)
-            else:
-                zmas[vals_conv] = None
+            zmas[vals_conv] = _read(scn_fs[-1].file.zmatrix, locs)
 
         paths[vals] = scn_fs[-1].path(locs)
 
@@ -124,6 +142,20 @@ def potential(names, grid_vals, cnf_save_path,
     return pot, geoms, grads, hessians, zmas, paths
 
 
+def _tree_files(paths):
+    """ Get the files in the tree of the deepest directory common to a
+        set of paths, walking it once, along with those in the archive
+    """
+
+    root = os.path.commonpath(paths)
+    files = archive.archived_paths(root)
+    for dir_path, _, file_names in os.walk(root):
+        files.update(os.path.normpath(os.path.join(dir_path, name))
+                     for name in file_names)
+
+    return files
+
+
 def identify_bad_point(pot, thresh=0.05):
     """ Identifies a single bad point in a torsional potential based on a
         comparison of Akima and cubic spline fits
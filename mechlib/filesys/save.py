@@ -6,6 +6,10 @@ import automol
 import elstruct
 import autofile
 from mechlib.amech_io import printer as ioprinter
+from mechlib.amech_io import reader
+from mechlib.filesys import arrays
+from mechlib.filesys import index
+from mechlib.filesys import pending
 
 
 def atom(sp_ret, cnf_fs, thy_locs, zma,
@@ -30,6 +34,7 @@ def atom(sp_ret, cnf_fs, thy_locs, zma,
 
     geo = automol.zmat.geometry(zma)
     cnf_fs[-1].file.geometry.write(geo, cnf_locs)
+    index.save_geometry(cnf_fs, cnf_locs)
     zma_fs[-1].file.zmatrix.write(zma, zma_locs)
 
     # Save data from energy job
@@ -69,9 +74,10 @@ def conformer(opt_ret, hess_ret, cnf_fs, thy_locs,
         cnf_fs, rng_locs, tors_locs, zma_locs)
 
     # Save data from optimization and hessian jobs
-    _save_geom(opt_ret, cnf_fs, cnf_locs)
-    _save_zmatrix(opt_ret, zma_fs, zma_locs, init_zma=init_zma)
-    _save_energy(opt_ret, sp_fs, thy_locs)
+    with pending.energy_pending(cnf_fs, cnf_locs):
+        _save_geom(opt_ret, cnf_fs, cnf_locs)
+        _save_zmatrix(opt_ret, zma_fs, zma_locs, init_zma=init_zma)
+        _save_energy(opt_ret, sp_fs, thy_locs)
 
     if hess_ret is not None:
         _save_hessian(hess_ret, cnf_fs, cnf_locs)
@@ -93,9 +99,10 @@ def parsed_conformer(
 
     # Save data from optimization and hessian jobs
     geo, zma, ene, inf_obj, inp_str = save_info
-    _save_geom_parsed(geo, inf_obj, inp_str, cnf_fs, cnf_locs)
-    _save_zmatrix_parsed(zma, inf_obj, inp_str, zma_fs, zma_locs)
-    _save_energy_parsed(ene, inf_obj, inp_str, sp_fs, thy_locs)
+    with pending.energy_pending(cnf_fs, cnf_locs):
+        _save_geom_parsed(geo, inf_obj, inp_str, cnf_fs, cnf_locs)
+        _save_zmatrix_parsed(zma, inf_obj, inp_str, zma_fs, zma_locs)
+        _save_energy_parsed(ene, inf_obj, inp_str, sp_fs, thy_locs)
     if hess_ret is not None:
         _save_hessian(hess_ret, cnf_fs, cnf_locs)
 
@@ -176,6 +183,7 @@ def instability(conn_zma, disconn_zmas, cnf_save_fs,
     # Save structure and stability info in CONF and Z filesys
     cnf_save_fs[-1].create(cnf_locs)
     cnf_save_fs[-1].file.geometry.write(conn_geo, cnf_locs)
+    index.save_geometry(cnf_save_fs, cnf_locs)
     cnf_save_path = cnf_save_fs[-1].path(cnf_locs)
 
     # Save zma information seperately, if required
@@ -311,10 +319,10 @@ def read_job_zma(ret, init_zma=None, rebuild=False):
     #         zma = automol.reac.ts_zmatrix(zrxn, geo)
 
     _, _, out_str, prog, _ = _unpack_ret(ret)
-    zma = elstruct.reader.opt_zmatrix(prog, out_str)
+    zma = reader.es.cached(elstruct.reader.opt_zmatrix, prog, out_str)
     if zma is None or rebuild:
         print('Getting ZMA from a geometry...')
-        geo = elstruct.reader.opt_geometry(prog, out_str)
+        geo = reader.es.cached(elstruct.reader.opt_geometry, prog, out_str)
         if init_zma is not None:
             print('Resetting ZMA coords using opt geoms...')
             zma = rebuild_zma_from_opt_geo(init_zma, geo)
@@ -351,6 +359,7 @@ def _save_geom_parsed(geo, inf_obj, inp_str, cnf_fs, cnf_locs):
     cnf_fs[-1].file.geometry_info.write(inf_obj, cnf_locs)
     cnf_fs[-1].file.geometry_input.write(inp_str, cnf_locs)
     cnf_fs[-1].file.geometry.write(geo, cnf_locs)
+    index.save_geometry(cnf_fs, cnf_locs)
 
 
 def _save_geom(ret, cnf_fs, cnf_locs):
@@ -359,7 +368,7 @@ def _save_geom(ret, cnf_fs, cnf_locs):
 
     print(" - Reading geometry from output...")
     inf_obj, inp_str, out_str, prog, _ = _unpack_ret(ret)
-    geo = elstruct.reader.opt_geometry(prog, out_str)
+    geo = reader.es.cached(elstruct.reader.opt_geometry, prog, out_str)
     _save_geom_parsed(geo, inf_obj, inp_str, cnf_fs, cnf_locs)
 
 
@@ -370,7 +379,7 @@ def _save_grad(ret, cnf_fs, cnf_locs):
     print(" - Reading gradient from output...")
     inf_obj, inp_str, out_str, prog, _ = _unpack_ret(ret)
 
-    grad = elstruct.reader.gradient(prog, out_str)
+    grad = reader.es.cached(elstruct.reader.gradient, prog, out_str)
 
     cnf_fs[-1].create(cnf_locs)
     cnf_path = cnf_fs[-1].path(cnf_locs)
@@ -379,6 +388,7 @@ def _save_grad(ret, cnf_fs, cnf_locs):
     cnf_fs[-1].file.gradient_info.write(inf_obj, cnf_locs)
     cnf_fs[-1].file.gradient_input.write(inp_str, cnf_locs)
     cnf_fs[-1].file.gradient.write(grad, cnf_locs)
+    arrays.save_gradient(cnf_fs, cnf_locs, grad)
 
 
 def _save_zmatrix_parsed(zma, inf_obj, inp_str, zma_fs, zma_locs):
@@ -405,7 +415,7 @@ def _save_zmatrix(ret, zma_fs, zma_locs, init_zma=None):
     zma = None
     if init_zma is not None:
         print('using opt geo fro zma')
-        geo = elstruct.reader.opt_geometry(prog, out_str)
+        geo = reader.es.cached(elstruct.reader.opt_geometry, prog, out_str)
         zma = read_zma_from_geo(init_zma, geo)
     if zma is None:
         zma = read_job_zma(ret, init_zma=init_zma)
@@ -422,6 +432,7 @@ def _save_energy_parsed(ene, inf_obj, inp_str, sp_fs, sp_locs):
     sp_fs[-1].file.input.write(inp_str, sp_locs)
     sp_fs[-1].file.info.write(inf_obj, sp_locs)
     sp_fs[-1].file.energy.write(ene, sp_locs)
+    index.save_energy(sp_fs, sp_locs, ene)
 
 
 def _save_energy(ret, sp_fs, sp_locs):
@@ -431,7 +442,7 @@ def _save_energy(ret, sp_fs, sp_locs):
     print(" - Reading energy from output...")
     inf_obj, inp_str, out_str, prog, method = _unpack_ret(ret)
 
-    ene = elstruct.reader.energy(prog, method, out_str)
+    ene = reader.es.cached(elstruct.reader.energy, prog, method, out_str)
     _save_energy_parsed(ene, inf_obj, inp_str, sp_fs, sp_locs)
 
 
@@ -445,7 +456,9 @@ def _save_hessian_parsed(hess, freqs, inf_obj, inp_str, cnf_fs, cnf_locs):
     cnf_fs[-1].file.hessian_info.write(inf_obj, cnf_locs)
     cnf_fs[-1].file.hessian_input.write(inp_str, cnf_locs)
     cnf_fs[-1].file.hessian.write(hess, cnf_locs)
+    arrays.save_hessian(cnf_fs, cnf_locs, hess)
     cnf_fs[-1].file.harmonic_frequencies.write(freqs, cnf_locs)
+    index.save_frequencies(cnf_fs, cnf_locs, freqs)
 
 
 def _save_hessian(ret, cnf_fs, cnf_locs):
@@ -455,8 +468,9 @@ def _save_hessian(ret, cnf_fs, cnf_locs):
     print(" - Reading hessian and harmonic frequencies from output...")
     inf_obj, inp_str, out_str, prog, _ = _unpack_ret(ret)
 
-    hess = elstruct.reader.hessian(prog, out_str)
-    freqs = elstruct.reader.harmonic_frequencies(prog, out_str)
+    hess = reader.es.cached(elstruct.reader.hessian, prog, out_str)
+    freqs = reader.es.cached(
+        elstruct.reader.harmonic_frequencies, prog, out_str)
     _save_hessian_parsed(hess, freqs, inf_obj, inp_str, cnf_fs, cnf_locs)
 
 
@@ -0,0 +1,24 @@
+""" Libraries for running independent MechDriver jobs concurrently
+    under a shared budget of cores and memory
+"""
+
+from mechlib.sched._queue import machine_budget
+from mechlib.sched._queue import configure
+from mechlib.sched._queue import current_budget
+from mechlib.sched._queue import submit
+from mechlib.sched._queue import wait
+from mechlib.sched._queue import wait_any
+from mechlib.sched._queue import run
+from mechlib.sched._pool import execute_in_pool
+
+
+__all__ = [
+    'machine_budget',
+    'configure',
+    'current_budget',
+    'submit',
+    'wait',
+    'wait_any',
+    'run',
+    'execute_in_pool'
+]
@@ -0,0 +1,175 @@
+""" Run a function over several sets of arguments in separate processes.
+
+    Each call is paired with the (nprocs, mem) that the job it launches
+    will request. Calls are started in the order given as soon as enough
+    of the machine budget is free, so the total cores and memory requested
+    by all running jobs never exceed the budget. A call whose request
+    alone exceeds the budget is still run, but only by itself.
+
+    Results are returned in the order the calls were started, regardless
+    of the order in which the calls finish.
+"""
+
+import itertools
+import traceback
+import multiprocessing
+from multiprocessing.connection import wait
+from mechlib.amech_io import reader
+from mechlib.amech_io.printer import warning_message
+from mechlib.sched._queue import current_budget
+from mechlib.sched._queue import configure
+
+
+_END = object()
+
+
+def execute_in_pool(fxn, args_lst, res_lst=None,
+                    nworkers=1, budget=None, callback=None):
+    """ Call `fxn(*args)` for each set of args in `args_lst` using up to
+        `nworkers` processes at once.
+
+        `args_lst` is consumed lazily: the next set of args is only taken
+        when a worker is free, so it may be a generator whose output depends
+        on calls that have already finished (via `callback`). A generator
+        may yield None to wait for the next running call to finish before
+        being asked again; if nothing is running, None ends the iteration.
+
+        If only one worker is requested, all calls are made in order in
+        the current process, exactly as in a plain loop.
+
+        A call that raises an exception in a worker process is reported,
+        and passed to `callback` with a result of None, while the remaining
+        calls proceed; once all have finished, the exception of the first
+        call that failed is raised, as it would be by a plain loop.
+
+        :param fxn: function to call
+        :type fxn: function
+        :param args_lst: positional arguments for each call
+        :type args_lst: iterable(tuple(obj))
+        :param res_lst: (nprocs, mem) requested by each call
+        :type res_lst: iterable((int, float))
+        :param nworkers: maximum number of calls running at once
+        :type nworkers: int
+        :param budget: (ncores, mem) shared by all running calls; defaults
+            to the budget of this process (see `current_budget`)
+        :type budget: (int, float)
+        :param callback: function called as `callback(idx, ret)` in the
+            parent process as each call finishes
+        :type callback: function
+        :rtype: tuple(obj)
+    """
+
+    args_iter = iter(args_lst)
+    if res_lst is None:
+        res_iter = itertools.repeat((1, 0.0))
+    else:
+        res_iter = iter(res_lst)
+    if budget is None:
+        budget = current_budget()
+
+    rets = []
+    errs = []
+    if nworkers <= 1:
+        for args in args_iter:
+            if args is None:
+                break
+            idx = len(rets)
+            rets.append(fxn(*args))
+            if callback is not None:
+                callback(idx, rets[idx])
+    else:
+        ncores, mem = budget
+        ctx = multiprocessing.get_context('fork')
+
+        running = {}
+        used_cores, used_mem = 0, 0.0
+        nxt, exhausted = None, False
+        while not exhausted or nxt is not None or running:
+
+            # Start calls in order while there are free workers and budget
+            while len(running) < nworkers:
+                if nxt is None and not exhausted:
+                    args = next(args_iter, _END)
+                    if args is _END:
+                        exhausted = True
+                    elif args is None:
+                        if not running:
+                            exhausted = True
+                        break
+                    else:
+                        nxt = (args, next(res_iter))
+                if nxt is None:
+                    break
+
+                args, (job_nprocs, job_mem) = nxt
+                fits = (used_cores + job_nprocs <= ncores and
+                        used_mem + job_mem <= mem)
+                if running and not fits:
+                    break
+                nxt = None
+
+                recv_conn, send_conn = ctx.Pipe(duplex=False)
+                proc = ctx.Process(
+                    target=_run_call,
+                    args=(fxn, args, (job_nprocs, job_mem), send_conn))
+                proc.start()
+                send_conn.close()
+
+                idx = len(rets)
+                rets.append(None)
+                running[recv_conn] = (idx, proc, job_nprocs, job_mem)
+                used_cores += job_nprocs
+                used_mem += job_mem
+
+            # Collect the results of any calls that have finished
+            if running:
+                for conn in wait(list(running)):
+                    idx, proc, job_nprocs, job_mem = running.pop(conn)
+                    try:
+                        success, ret = conn.recv()
+                    except EOFError:
+                        success, ret = False, RuntimeError(
+                            'Worker exited without a result')
+                    conn.close()
+                    proc.join()
+
+                    used_cores -= job_nprocs
+                    used_mem -= job_mem
+
+                    if success:
+                        rets[idx] = ret
+                    else:
+                        warning_message(
+                            f'Concurrent job {idx+1} failed:', repr(ret))
+                        errs.append((idx, ret))
+                    if callback is not None:
+                        callback(idx, rets[idx])
+
+    if errs:
+        raise min(errs, key=lambda err: err[0])[1]
+
+    return tuple(rets)
+
+
+def _run_call(fxn, args, res, conn):
+    """ Make a single call in a worker process and send the result
+        (or the exception raised) back to the parent process
+
+        Jobs the call submits to the queue of the worker share only the
+        resources requested for the call.
+    """
+
+    configure(ncores=res[0], mem=res[1])
+    try:
+        ret = (True, fxn(*args))
+    except Exception as err:
+        traceback.print_exc()
+        ret = (False, err)
+    reader.es.flush()
+
+    try:
+        conn.send(ret)
+    except Exception:
+        conn.send((False, RuntimeError(traceback.format_exc())))
+    finally:
+        conn.close()
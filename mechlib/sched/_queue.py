@@ -0,0 +1,251 @@
+""" Queue of jobs that share the cores and memory of the machine.
+
+    Routines submit a function that runs an external program (an electronic
+    structure code, MESS, ProjRot, ThermP, OneDMin) along with the
+    (nprocs, mem) it requests and a priority, and get back a future. Queued
+    jobs are started in order of priority, then submission, in separate
+    processes as soon as enough of the budget is free; a job whose request
+    alone exceeds the budget is run only by itself. The queue is advanced,
+    and the futures completed, while a routine waits on any of them.
+
+    The jobs are plain functions, so the queue can be checked with any
+    stand-in for a program, e.g., `autorun.run_script` called with a script
+    that just sleeps and writes an output file in place of Gaussian.
+
+    The state is kept per process: a process forked to run a job starts
+    with an empty queue, so any job it submits in turn is run by itself.
+"""
+
+import os
+import heapq
+import itertools
+import traceback
+import multiprocessing
+from multiprocessing.connection import wait as wait_conns
+from concurrent.futures import Future
+from mechlib.amech_io import reader
+
+
+_STATE = {}
+
+
+def machine_budget(ncores=None, mem=None):
+    """ Set the total number of cores and memory (GB) that concurrently
+        running jobs are allowed to request.
+
+        If not given, the cores default to those available to this process
+        and the memory is left unbounded.
+
+        :param ncores: number of cores available to all running jobs
+        :type ncores: int
+        :param mem: memory (GB) available to all running jobs
+        :type mem: float
+        :rtype: (int, float)
+    """
+
+    if ncores is None:
+        ncores = len(os.sched_getaffinity(0))
+    if mem is None:
+        mem = float('inf')
+
+    return ncores, mem
+
+
+def _reset(budget=None):
+    """ Empty the queue and set the budget of the current process
+    """
+    _STATE.clear()
+    _STATE.update({
+        'budget': budget,
+        'used': (0, 0.0),
+        'queue': [],
+        'running': {},
+        'count': itertools.count(),
+    })
+
+
+_reset()
+os.register_at_fork(after_in_child=_reset)
+
+
+def configure(ncores=None, mem=None):
+    """ Set the total number of cores and memory (GB) shared by the
+        jobs run at once by the queue of this process.
+
+        Defaults are those of `machine_budget`.
+
+        :param ncores: number of cores available to all running jobs
+        :type ncores: int
+        :param mem: memory (GB) available to all running jobs
+        :type mem: float
+    """
+    _STATE['budget'] = machine_budget(ncores=ncores, mem=mem)
+
+
+def current_budget():
+    """ Get the total number of cores and memory (GB) shared by the jobs
+        run at once by this process, i.e., those set by `configure` (or,
+        in a process started for a job, those the job requested).
+
+        :rtype: (int, float)
+    """
+    if _STATE['budget'] is None:
+        configure()
+    return _STATE['budget']
+
+
+def submit(fxn, args=(), kwargs=None, res=None, priority=0):
+    """ Add a call of `fxn(*args, **kwargs)` to the queue.
+
+        :param fxn: function that runs the program
+        :type fxn: function
+        :param args: positional arguments for the call
+        :type args: tuple(obj)
+        :param kwargs: keyword arguments for the call
+        :type kwargs: dict[str: obj]
+        :param res: (nprocs, mem) requested by the job, (1, 0.0) if None
+        :type res: (int, float)
+        :param priority: jobs with higher values are started first
+        :type priority: int
+        :rtype: concurrent.futures.Future
+    """
+
+    fut = Future()
+    job = (fxn, tuple(args), dict(kwargs or {}), res or (1, 0.0))
+    heapq.heappush(
+        _STATE['queue'], (-priority, next(_STATE['count']), fut, job))
+    _launch()
+
+    return fut
+
+
+def wait(futs):
+    """ Run the queue until all of the futures are done and return
+        their results, raising the exception of any job that failed.
+
+        :param futs: futures returned by `submit`
+        :type futs: tuple(concurrent.futures.Future)
+        :rtype: tuple(obj)
+    """
+
+    futs = tuple(futs)
+    while not all(fut.done() for fut in futs):
+        _launch()
+        if not _STATE['running']:
+            raise ValueError(
+                'Waiting on futures not submitted to this queue')
+        _collect()
+
+    return tuple(fut.result() for fut in futs)
+
+
+def wait_any(futs):
+    """ Run the queue until at least one of the futures is done and
+        return those that are done, without raising the exceptions of
+        failed jobs (get them from the futures).
+
+        :param futs: futures returned by `submit`
+        :type futs: tuple(concurrent.futures.Future)
+        :rtype: tuple(concurrent.futures.Future)
+    """
+
+    futs = tuple(futs)
+    while futs and not any(fut.done() for fut in futs):
+        _launch()
+        if not _STATE['running']:
+            raise ValueError(
+                'Waiting on futures not submitted to this queue')
+        _collect()
+
+    return tuple(fut for fut in futs if fut.done())
+
+
+def run(fxn, args=(), kwargs=None, res=None, priority=0):
+    """ Run a single job through the queue and return its result.
+
+        The job is queued along with any others submitted by this process,
+        so it only starts once its request fits in the free budget.
+
+        :rtype: obj
+    """
+    ret, = wait((submit(fxn, args=args, kwargs=kwargs,
+                        res=res, priority=priority),))
+    return ret
+
+
+def _launch():
+    """ Start queued jobs, in order, while they fit in the free budget
+    """
+
+    ncores, mem = current_budget()
+    ctx = multiprocessing.get_context('fork')
+
+    queue, running = _STATE['queue'], _STATE['running']
+    while queue:
+        _, _, fut, (fxn, args, kwargs, res) = queue[0]
+        used_cores, used_mem = _STATE['used']
+        fits = (used_cores + res[0] <= ncores and
+                used_mem + res[1] <= mem)
+        if running and not fits:
+            break
+        heapq.heappop(queue)
+
+        if not fut.set_running_or_notify_cancel():
+            continue
+
+        recv_conn, send_conn = ctx.Pipe(duplex=False)
+        proc = ctx.Process(
+            target=_run_job, args=(fxn, args, kwargs, res, send_conn))
+        proc.start()
+        send_conn.close()
+
+        running[recv_conn] = (fut, proc, res)
+        _STATE['used'] = (used_cores + res[0], used_mem + res[1])
+
+
+def _collect():
+    """ Wait for running jobs to finish and complete their futures
+    """
+
+    running = _STATE['running']
+    for conn in wait_conns(list(running)):
+        fut, proc, res = running.pop(conn)
+        try:
+            success, ret = conn.recv()
+        except EOFError:
+            success, ret = False, RuntimeError(
+                'Job process exited without a result')
+        conn.close()
+        proc.join()
+
+        used_cores, used_mem = _STATE['used']
+        _STATE['used'] = (used_cores - res[0], used_mem - res[1])
+
+        if success:
+            fut.set_result(ret)
+        else:
+            fut.set_exception(ret)
+
+
+def _run_job(fxn, args, kwargs, res, conn):
+    """ Run a job in its own process and send the result (or the
+        exception raised) back to the queue
+
+        Jobs the job submits to the queue of its process share only the
+        resources requested for it.
+    """
+
+    configure(ncores=res[0], mem=res[1])
+    try:
+        ret = (True, fxn(*args, **kwargs))
+    except Exception as err:
+        traceback.print_exc()
+        ret = (False, err)
+    reader.es.flush()
+
+    try:
+        conn.send(ret)
+    except Exception:
+        conn.send((False, RuntimeError(traceback.format_exc())))
+    finally:
+        conn.close()
@@ -0,0 +1,101 @@
+""" Test the cache of the values read from the filesystems in
+    mechlib.filesys.cache
+"""
+
+import os
+import tempfile
+import numpy
+import autofile
+from mechlib.filesys import cache
+
+
+HESS = numpy.array(((1.0, 0.5), (0.5, 2.0)))
+
+
+def _conformer_fs(prefix, ncnfs):
+    """ Build a conformer filesystem with a few conformers
+    """
+    cnf_fs = autofile.fs.conformer(prefix)
+    rid = autofile.schema.generate_new_ring_id()
+    locs_lst = tuple((rid, autofile.schema.generate_new_conformer_id())
+                     for _ in range(ncnfs))
+    for locs in locs_lst:
+        cnf_fs[-1].create(locs)
+    return cnf_fs, locs_lst
+
+
+def test__cache():
+    """ test cache.enable
+        test cache.stats
+    """
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        run_prefix = os.path.join(tmp_dir, 'run')
+        save_prefix = os.path.join(tmp_dir, 'save')
+        cache.enable(run_prefix=run_prefix)
+        cache.clear()
+
+        cnf_fs, locs_lst = _conformer_fs(save_prefix, 3)
+        locs = locs_lst[0]
+        cnf_fs[-1].file.energy.write(-79.8, locs)
+        cnf_fs[-1].file.hessian.write(HESS, locs)
+
+        # A value read again comes from the cache
+        assert cnf_fs[-1].file.energy.read(locs) == -79.8
+        assert cnf_fs[-1].file.energy.read(locs) == -79.8
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 1
+
+        # Changing a mutable value that was read does not change the cache
+        hess = cnf_fs[-1].file.hessian.read(locs)
+        hess[0, 0] = 100.
+        assert numpy.allclose(cnf_fs[-1].file.hessian.read(locs), HESS)
+        assert cache.stats()['hits'] == 2
+
+        # Writing a file drops its value
+        cnf_fs[-1].file.energy.write(-79.9, locs)
+        assert cnf_fs[-1].file.energy.read(locs) == -79.9
+        assert cache.stats()['misses'] == 3
+
+        # A file replaced by another process is read again, even with the
+        # same modification time and size
+        ene_path = cnf_fs[-1].file.energy.path(locs)
+        stat = os.stat(ene_path)
+        with open(ene_path, encoding='utf-8') as ene_file:
+            ene_str = ene_file.read()
+        with open(ene_path + '.new', 'w', encoding='utf-8') as ene_file:
+            ene_file.write(ene_str.replace('-79.9', '-79.7'))
+        os.replace(ene_path + '.new', ene_path)
+        os.utime(ene_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert os.stat(ene_path).st_size == stat.st_size
+        assert cnf_fs[-1].file.energy.read(locs) == -79.7
+
+        # The files of the run filesystem are never cached
+        run_fs, run_locs_lst = _conformer_fs(run_prefix, 1)
+        run_fs[-1].file.energy.write(-40.5, run_locs_lst[0])
+        nreads = cache.stats()['hits'] + cache.stats()['misses']
+        for _ in range(2):
+            assert run_fs[-1].file.energy.read(run_locs_lst[0]) == -40.5
+        assert cache.stats()['hits'] + cache.stats()['misses'] == nreads
+
+        # The least recently used values are dropped first
+        cache.enable(run_prefix=run_prefix, max_entries=2)
+        for idx, locs in enumerate(locs_lst):
+            cnf_fs[-1].file.energy.write(-1. * idx, locs)
+            cnf_fs[-1].file.energy.read(locs)
+        assert cache.stats()['entries'] == 2
+        nhits = cache.stats()['hits']
+        cnf_fs[-1].file.energy.read(locs_lst[2])
+        cnf_fs[-1].file.energy.read(locs_lst[0])
+        assert cache.stats()['hits'] == nhits + 1
+
+        # Once turned off, the files are always read
+        cache.enable(False)
+        assert cache.stats()['entries'] == 0
+        for _ in range(2):
+            assert cnf_fs[-1].file.energy.read(locs_lst[1]) == -1.
+        assert cache.stats()['hits'] == cache.stats()['misses'] == 0
+
+
+if __name__ == '__main__':
+    test__cache()
@@ -0,0 +1,124 @@
+""" Test the index of the conformer sort values in mechlib.filesys.index
+"""
+
+import shutil
+import tempfile
+import autofile
+from mechlib.filesys import index
+
+
+SP_LOCS = ('b3lyp', '6-31g*', 'R')
+GEO = (('C', (0.0, 0.0, 0.0)), ('O', (0.0, 0.0, 2.7)))
+
+
+def _conformer_fs(prefix, ncnfs):
+    """ Build a conformer filesystem with a few conformers
+    """
+    cnf_fs = autofile.fs.conformer(prefix)
+    rid = autofile.schema.generate_new_ring_id()
+    locs_lst = tuple((rid, autofile.schema.generate_new_conformer_id())
+                     for _ in range(ncnfs))
+    for locs in locs_lst:
+        cnf_fs[-1].create(locs)
+    return cnf_fs, locs_lst
+
+
+def _sp_fs(cnf_fs, locs):
+    """ Build the SP filesystem of a conformer, with the SP level
+    """
+    sp_fs = autofile.fs.single_point(cnf_fs[-1].path(locs))
+    sp_fs[-1].create(SP_LOCS)
+    return sp_fs
+
+
+def test__index():
+    """ test index.locators
+        test index.energies
+        test index.zpes
+        test index.fingerprints
+        test index.energy_neighbors
+        test index.remove
+    """
+
+    index.enable()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cnf_fs, locs_lst = _conformer_fs(tmp_dir, 3)
+        for locs in locs_lst[:2]:
+            cnf_fs[-1].file.geometry.write(GEO, locs)
+
+        # The conformers with a geometry are listed, and those seen
+        # without one are checked again
+        assert index.locators(cnf_fs) == tuple(sorted(locs_lst[:2]))
+        cnf_fs[-1].file.geometry.write(GEO, locs_lst[2])
+        assert index.locators(cnf_fs) == tuple(sorted(locs_lst))
+
+        # Conformers added or removed by other means are found once their
+        # ring directory changes
+        new_locs = (autofile.schema.generate_new_ring_id(),
+                    autofile.schema.generate_new_conformer_id())
+        cnf_fs[-1].create(new_locs)
+        cnf_fs[-1].file.geometry.write(GEO, new_locs)
+        assert new_locs in index.locators(cnf_fs)
+        shutil.rmtree(cnf_fs[-1].path(new_locs))
+        assert index.locators(cnf_fs) == tuple(sorted(locs_lst))
+
+        # A value missing from the index is read from its file until it is
+        # found, and is then only updated when saved
+        sp_fs_lst = tuple(_sp_fs(cnf_fs, locs) for locs in locs_lst)
+        sp_fs_lst[0][-1].file.energy.write(-79.8, SP_LOCS)
+        assert index.energies(cnf_fs, locs_lst, SP_LOCS) == {
+            locs_lst[0]: -79.8, locs_lst[1]: None, locs_lst[2]: None}
+
+        sp_fs_lst[0][-1].file.energy.write(-79.7, SP_LOCS)
+        sp_fs_lst[1][-1].file.energy.write(-79.9, SP_LOCS)
+        assert index.energies(cnf_fs, locs_lst, SP_LOCS) == {
+            locs_lst[0]: -79.8, locs_lst[1]: -79.9, locs_lst[2]: None}
+
+        index.save_energy(sp_fs_lst[0], SP_LOCS, -79.7)
+        index.save_energy(sp_fs_lst[2], SP_LOCS, -79.800001)
+        assert index.energies(cnf_fs, locs_lst, SP_LOCS) == {
+            locs_lst[0]: -79.7, locs_lst[1]: -79.9, locs_lst[2]: -79.800001}
+
+        index.save_frequencies(cnf_fs, locs_lst[0], (-100., 1000., 3000.))
+        zpes = index.zpes(cnf_fs, locs_lst)
+        assert zpes[locs_lst[1]] is None
+        assert abs(zpes[locs_lst[0]] - 2000. * 4.556335e-6) < 1e-8
+
+        # Fingerprints are kept until the geometry is saved again
+        fprints = index.fingerprints(
+            cnf_fs, locs_lst, lambda locs: (1., 2., float(len(locs[1]))))
+        assert all(fprints[locs].tolist() == [1., 2., len(locs[1])]
+                   for locs in locs_lst)
+        fprints = index.fingerprints(cnf_fs, locs_lst, lambda locs: None)
+        assert fprints[locs_lst[0]].tolist() == [1., 2., len(locs_lst[0][1])]
+        index.save_geometry(cnf_fs, locs_lst[0])
+        fprints = index.fingerprints(cnf_fs, locs_lst, lambda locs: (3.,))
+        assert fprints[locs_lst[0]].tolist() == [3.]
+        assert fprints[locs_lst[1]].tolist() == [1., 2., len(locs_lst[1][1])]
+
+        # Conformers near an energy
+        near_locs, near_enes, no_ene_locs = index.energy_neighbors(
+            cnf_fs, locs_lst, SP_LOCS, -79.8, 1e-5)
+        assert near_locs == (locs_lst[2],)
+        assert near_enes == (-79.800001,)
+        assert not no_ene_locs
+
+        # Removed conformers are dropped
+        index.remove(cnf_fs[-1].path(locs_lst[2]))
+        assert index.locators(cnf_fs) == tuple(sorted(locs_lst[:2]))
+        assert index.energy_neighbors(
+            cnf_fs, index.locators(cnf_fs), SP_LOCS, -79.8, 1e-5)[0] == ()
+
+    # Once turned off, the index is not used
+    index.enable(False)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cnf_fs, locs_lst = _conformer_fs(tmp_dir, 1)
+        assert index.locators(cnf_fs) is None
+        sp_fs = _sp_fs(cnf_fs, locs_lst[0])
+        sp_fs[-1].file.energy.write(-79.8, SP_LOCS)
+        assert index.energies(cnf_fs, locs_lst, SP_LOCS) == {
+            locs_lst[0]: -79.8}
+
+
+if __name__ == '__main__':
+    test__index()
@@ -0,0 +1,82 @@
+""" Test the vectorized Z-Matrix comparison of mechlib.filesys.mincnf
+"""
+
+import numpy
+from mechlib.filesys import mincnf
+
+
+KEY1 = (('C', 'C', 'H', 'H'), ((None, None, None), (0, None, None),
+                               (0, 1, None), (1, 0, 2)))
+KEY2 = (('C', 'O', 'H', 'H'), KEY1[1])
+
+
+def _pair_equal(dists1, angs1, dists2, angs2,
+                dist_rtol=2e-5, ang_atol=2e-3):
+    """ Compare one pair of Z-Matrices, as automol.zmat.almost_equal
+    """
+    ang_diffs = numpy.mod(numpy.abs(angs1 - angs2), 2*numpy.pi)
+    ang_diffs = numpy.minimum(ang_diffs, 2*numpy.pi - ang_diffs)
+    return (numpy.allclose(dists1, dists2, rtol=dist_rtol, atol=1.0e-8) and
+            numpy.all(ang_diffs <= ang_atol))
+
+
+def _arrays(grps):
+    """ Build the arrays of `zmatrix_value_arrays` from (key, dists, angs)
+        of each Z-Matrix
+    """
+    grp_dct = {}
+    for idx, (key, dists, angs) in enumerate(grps):
+        idxs, dists_lst, angs_lst = grp_dct.setdefault(key, ([], [], []))
+        idxs.append(idx)
+        dists_lst.append(dists)
+        angs_lst.append(numpy.mod(angs, 2*numpy.pi))
+    grp_dct = {
+        key: (numpy.array(idxs, dtype=int),
+              numpy.array(dists_lst), numpy.array(angs_lst))
+        for key, (idxs, dists_lst, angs_lst) in grp_dct.items()}
+    return len(grps), grp_dct
+
+
+def test__almost_equal_matrix():
+    """ test mincnf.almost_equal_matrix
+    """
+
+    rng = numpy.random.default_rng(7)
+
+    # Near copies of a few Z-Matrices, some just across the tolerances
+    # and some with dihedrals on either side of 0/2 pi
+    base = [(rng.uniform(1.0, 3.0, 3), rng.uniform(0., 2*numpy.pi, 3))
+            for _ in range(6)]
+    base[0][1][2] = 0.0005
+    zmas1, zmas2 = [], []
+    for idx in range(120):
+        dists, angs = base[idx % len(base)]
+        key = KEY1 if idx % 7 else KEY2
+        dist_shift = rng.choice((0., 1e-5, 5e-5))
+        ang_shift = rng.choice((0., 1e-3, -1e-3, 3e-3, -3e-3))
+        zmas1.append((key, dists, angs))
+        zmas2.append((KEY1 if idx % 5 else KEY2,
+                      dists * (1. + dist_shift), angs + ang_shift))
+    zmas2.append((KEY2, base[0][0], base[0][1] - 0.0015))
+
+    match = mincnf.almost_equal_matrix(_arrays(zmas1), _arrays(zmas2))
+
+    assert match.shape == (len(zmas1), len(zmas2))
+    ref_match = numpy.array([
+        [key1 == key2 and _pair_equal(dists1, angs1, dists2, angs2)
+         for key2, dists2, angs2 in zmas2]
+        for key1, dists1, angs1 in zmas1])
+    assert numpy.array_equal(match, ref_match)
+    assert match.any() and not match.all()
+
+    # The dihedral at 0.0005 matches the one at 2 pi - 0.001
+    assert match[0, -1]
+
+    # Sets with no symbols or keys in common never match
+    match = mincnf.almost_equal_matrix(
+        _arrays(zmas1[1:3]), _arrays([(KEY2,) + zmas1[1][1:]]))
+    assert not match.any()
+
+
+if __name__ == '__main__':
+    test__almost_equal_matrix()
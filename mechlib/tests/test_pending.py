@@ -0,0 +1,125 @@
+""" Test the markers of energies about to be saved in
+    mechlib.filesys.pending
+"""
+
+import os
+import time
+import socket
+import tempfile
+import threading
+import subprocess
+import autofile
+from mechlib.filesys import pending
+
+
+SP_LOCS = ('b3lyp', '6-31g*', 'R')
+CNF_LOCS = (autofile.schema.generate_new_ring_id(),
+            autofile.schema.generate_new_conformer_id())
+
+
+def _conformer_fs(prefix):
+    """ Build a conformer filesystem, with the directory of one conformer
+    """
+    cnf_fs = autofile.fs.conformer(prefix)
+    cnf_fs[-1].create(CNF_LOCS)
+    return cnf_fs
+
+
+def test__writer_marker():
+    """ test pending.writer_marker
+        test pending.writer_running
+    """
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        marker = os.path.join(tmp_dir, 'run.owner')
+
+        assert not pending.writer_running(marker)
+        with pending.writer_marker(marker):
+            with open(marker, encoding='utf-8') as mark_file:
+                assert mark_file.read().split() == [
+                    socket.gethostname(), str(os.getpid())]
+            assert pending.writer_running(marker)
+        assert not os.path.exists(marker)
+        assert not pending.writer_running(marker)
+
+        # The marker is removed even if the code in the context fails
+        try:
+            with pending.writer_marker(marker):
+                raise ValueError
+        except ValueError:
+            pass
+        assert not os.path.exists(marker)
+
+        # A marker left by a process that has stopped
+        proc = subprocess.Popen(['true'])
+        proc.wait()
+        with open(marker, 'w', encoding='utf-8') as mark_file:
+            mark_file.write(f'{socket.gethostname()} {proc.pid}\n')
+        assert not pending.writer_running(marker)
+
+        # Markers of other hosts are trusted, up to an age if one is given
+        with open(marker, 'w', encoding='utf-8') as mark_file:
+            mark_file.write('not-this-host 1\n')
+        assert pending.writer_running(marker)
+        assert pending.writer_running(marker, max_age=60.)
+        assert not pending.writer_running(marker, max_age=0.)
+
+        with open(marker, 'w', encoding='utf-8') as mark_file:
+            mark_file.write('garbage\n')
+        assert not pending.writer_running(marker)
+
+
+def test__wait_for_energy():
+    """ test pending.energy_pending
+        test pending.wait_for_energy
+    """
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cnf_fs = _conformer_fs(tmp_dir)
+        cnf_path = cnf_fs[-1].path(CNF_LOCS)
+        sp_fs = autofile.fs.single_point(cnf_path)
+
+        # No energy and no marker: the energy is not coming
+        start = time.time()
+        assert pending.wait_for_energy(cnf_path, sp_fs, SP_LOCS) is None
+        assert time.time() - start < 1.
+
+        # An energy saved while the reader waits on the marker
+        saving = threading.Event()
+
+        def _save():
+            with pending.energy_pending(cnf_fs, CNF_LOCS):
+                saving.set()
+                time.sleep(0.5)
+                sp_fs[-1].create(SP_LOCS)
+                sp_fs[-1].file.energy.write(-79.8, SP_LOCS)
+
+        thread = threading.Thread(target=_save)
+        thread.start()
+        saving.wait()
+        assert pending.wait_for_energy(cnf_path, sp_fs, SP_LOCS) == -79.8
+        thread.join()
+        assert not os.path.exists(
+            os.path.join(cnf_path, pending.PENDING_NAME))
+
+        # An energy already saved is read at once
+        start = time.time()
+        assert pending.wait_for_energy(cnf_path, sp_fs, SP_LOCS) == -79.8
+        assert time.time() - start < 1.
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cnf_fs = _conformer_fs(tmp_dir)
+        cnf_path = cnf_fs[-1].path(CNF_LOCS)
+        sp_fs = autofile.fs.single_point(cnf_path)
+
+        # A marker whose writer is still running is waited on, up to a time
+        with pending.energy_pending(cnf_fs, CNF_LOCS):
+            start = time.time()
+            assert pending.wait_for_energy(
+                cnf_path, sp_fs, SP_LOCS, max_wait=0.5) is None
+            assert 0.5 <= time.time() - start < 2.
+
+
+if __name__ == '__main__':
+    test__writer_marker()
+    test__wait_for_energy()
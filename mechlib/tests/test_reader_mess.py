@@ -0,0 +1,211 @@
+""" Test the streaming reader of MESSRATE outputs in
+    mechlib.amech_io.reader.mess
+"""
+
+import os
+import tempfile
+import numpy
+from phydat import phycon
+import mess_io
+from mechlib.amech_io import reader
+
+
+# Parts of the rate.out of a MESSRATE run of C2H6+H=C2H5+H2, with a
+# fake well for the products
+RATE_OUT_STR = """Wells: FakeW-C2H5+H2
+Bimolecular: C2H6+H C2H5+H2
+
+Pressure-Independent Rate Coefficients, 1/sec and cm^3/sec:
+
+T(K)  C2H6+H->C2H5+H2  C2H5+H2->C2H6+H
+500   2.1e-15          4.3e-18
+1000  1.2e-12          6.5e-14
+
+Temperature-Pressure Rate Tables:
+
+C2H6+H->C2H5+H2
+
+P\\T          500         1000        1500        2000
+0.1      2.1e-15     1.2e-12     1.1e-11     ***
+1        2.2e-15     1.3e-12     1.2e-11     3.3e-11
+10       2.2e-15     1.3e-12     -1.0e-20    3.4e-11
+O-O      2.3e-15     1.4e-12     1.3e-11     3.5e-11
+
+C2H6+H->FakeW-C2H5+H2
+
+P\\T          500         1000        1500        2000
+1        5.0e-14     8.1e-13     2.2e-12     4.0e-12
+O-O      5.1e-14     8.2e-13     2.3e-12     4.1e-12
+
+C2H6+H->C2H6+H
+
+P\\T          500         1000        1500        2000
+1        1.0e-12     2.0e-12     3.0e-12     4.0e-12
+
+C2H6+H->
+
+P\\T          500         1000        1500        2000
+1        2.1e-15     1.2e-12     1.1e-11     3.3e-11
+
+C2H5+H2->C2H6+H
+
+P\\T          500         1000        1500        2000
+1        4.3e-18     6.5e-14     1.5e-12     8.8e-12
+O-O      4.4e-18     6.6e-14     1.6e-12     8.9e-12
+
+C2H5+H2->C2H4+H+H2
+
+P\\T          500         1000        1500        2000
+1        nan         2.0e-16     3.0e-15     1.0e-14
+O-O      ***         2.1e-16     3.1e-15     1.1e-14
+
+_______________________________________________________________________
+
+Capture/Escape Rate Coefficients, 1/sec:
+
+C2H6+H->C2H5+H2  9.9e-10
+"""
+
+# A rate.out of the same run with only the channels between the reactants
+# and products, as MESS writes them when no fake wells are used
+CHANNEL_RATE_OUT_STR = """Temperature-Pressure Rate Tables:
+
+C2H6+H->C2H5+H2
+
+P\\T          500         1000        1500        2000
+0.1      2.1e-15     1.2e-12     1.1e-11     ***
+1        2.2e-15     1.3e-12     1.2e-11     3.3e-11
+10       2.2e-15     1.3e-12     -1.0e-20    3.4e-11
+O-O      2.3e-15     1.4e-12     1.3e-11     3.5e-11
+
+C2H5+H2->C2H6+H
+
+P\\T          500         1000        1500        2000
+0.1      4.2e-18     6.4e-14     1.4e-12     8.7e-12
+1        4.3e-18     6.5e-14     1.5e-12     8.8e-12
+10       4.3e-18     6.5e-14     1.5e-12     8.8e-12
+O-O      4.4e-18     6.6e-14     1.6e-12     8.9e-12
+
+_______________________________________________________________________
+
+Capture/Escape Rate Coefficients, 1/sec:
+
+C2H6+H->C2H5+H2  9.9e-10
+"""
+
+TEMPS = (500., 1000., 1500., 2000.)
+
+
+def _write_rate_out(path):
+    """ Write the rate.out of the C2H6+H run in the path
+    """
+    with open(os.path.join(path, 'rate.out'), 'w',
+              encoding='utf-8') as out_file:
+        out_file.write(RATE_OUT_STR)
+
+
+def test__rate_blocks():
+    """ test reader.mess.rate_blocks
+    """
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        _write_rate_out(tmp_dir)
+        blocks = tuple(reader.mess.rate_blocks(tmp_dir))
+
+    # Every table of the Temperature-Pressure Rate Tables section is read,
+    # and the section after the divider is not
+    assert tuple((reac, prod) for reac, prod, _ in blocks) == (
+        ('C2H6+H', 'C2H5+H2'),
+        ('C2H6+H', 'FakeW-C2H5+H2'),
+        ('C2H6+H', 'C2H6+H'),
+        ('C2H6+H', ''),
+        ('C2H5+H2', 'C2H6+H'),
+        ('C2H5+H2', 'C2H4+H+H2'))
+
+    _, _, ktp_dct = blocks[0]
+    assert tuple(ktp_dct) == (0.1, 1.0, 10.0, 'high')
+    assert all(temps == TEMPS for temps, _ in ktp_dct.values())
+    assert ktp_dct[0.1][1] == (2.1e-15, 1.2e-12, 1.1e-11, None)
+    assert ktp_dct[10.0][1] == (2.2e-15, 1.3e-12, -1.0e-20, 3.4e-11)
+    assert ktp_dct['high'][1] == (2.3e-15, 1.4e-12, 1.3e-11, 3.5e-11)
+
+    # Values MESS could not compute are None
+    _, _, ktp_dct = blocks[-1]
+    assert ktp_dct[1.0][1][0] is None
+    assert ktp_dct['high'][1][0] is None
+
+
+def test__rxn_ktp_dct():
+    """ test reader.mess.rxn_ktp_dct
+    """
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        _write_rate_out(tmp_dir)
+
+        # Reading every reaction, for every temperature and pressure
+        rxn_ktp_dct = reader.mess.rxn_ktp_dct(tmp_dir)
+        assert len(rxn_ktp_dct) == 6
+
+        # Dropping the fake, self, loss and reverse reactions, and the
+        # values out of the ranges
+        rxn_ktp_dct = reader.mess.rxn_ktp_dct(
+            tmp_dir,
+            filter_reaction_types=('fake', 'self',
+                                   'loss', 'capture', 'reverse'),
+            tmin=500., tmax=1500., pmin=1., pmax=10.)
+
+    rxn1 = (('C2H6', 'H'), ('C2H5', 'H2'), (None,))
+    rxn2 = (('C2H5', 'H2'), ('C2H4', 'H', 'H2'), (None,))
+    assert tuple(rxn_ktp_dct) == (rxn1, rxn2)
+
+    # Bimolecular rate constants are given per mole; the values that are
+    # not positive or that MESS could not compute are dropped
+    ktp_dct = rxn_ktp_dct[rxn1]
+    assert tuple(ktp_dct) == (1.0, 10.0, 'high')
+    assert numpy.allclose(ktp_dct[1.0][0], (500., 1000., 1500.))
+    assert numpy.allclose(
+        ktp_dct[1.0][1],
+        numpy.array((2.2e-15, 1.3e-12, 1.2e-11)) * phycon.NAVO)
+    assert numpy.allclose(ktp_dct[10.0][0], (500., 1000.))
+    assert numpy.allclose(ktp_dct['high'][0], (500., 1000., 1500.))
+
+    ktp_dct = rxn_ktp_dct[rxn2]
+    assert numpy.allclose(ktp_dct[1.0][0], (1000., 1500.))
+    assert numpy.allclose(ktp_dct['high'][0], (1000., 1500.))
+
+
+def test__rxn_ktp_dct_mess_io():
+    """ test that reader.mess.rxn_ktp_dct gives the same k(T,P) values
+        as mess_io.reader.rates.get_rxn_ktp_dct
+    """
+
+    kwarg_dcts = (
+        {},
+        {'filter_reaction_types': ('fake', 'self',
+                                   'loss', 'capture', 'reverse'),
+         'tmin': 500., 'tmax': 1500., 'pmin': 1., 'pmax': 10.},
+    )
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with open(os.path.join(tmp_dir, 'rate.out'), 'w',
+                  encoding='utf-8') as out_file:
+            out_file.write(CHANNEL_RATE_OUT_STR)
+
+        for kwarg_dct in kwarg_dcts:
+            rxn_ktp_dct = reader.mess.rxn_ktp_dct(tmp_dir, **kwarg_dct)
+            ref_rxn_ktp_dct = mess_io.reader.rates.get_rxn_ktp_dct(
+                CHANNEL_RATE_OUT_STR, filter_kts=True, **kwarg_dct)
+
+            assert set(rxn_ktp_dct) == set(ref_rxn_ktp_dct)
+            for rxn, ktp_dct in rxn_ktp_dct.items():
+                ref_ktp_dct = ref_rxn_ktp_dct[rxn]
+                assert set(ktp_dct) == set(ref_ktp_dct)
+                for pressure, (temps, kts) in ktp_dct.items():
+                    ref_temps, ref_kts = ref_ktp_dct[pressure]
+                    assert numpy.allclose(temps, ref_temps)
+                    assert numpy.allclose(kts, ref_kts)
+
+
+if __name__ == '__main__':
+    test__rate_blocks()
+    test__rxn_ktp_dct()
+    test__rxn_ktp_dct_mess_io()
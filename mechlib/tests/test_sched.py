@@ -0,0 +1,255 @@
+""" Test the job queue and the pool of mechlib.sched, using a script that
+    just sleeps and writes an output file in place of a program
+"""
+
+import os
+import time
+import tempfile
+import subprocess
+import pytest
+from mechlib import sched
+
+
+SLEEP_SCRIPT = (
+    'set -e\n'
+    'date +%s.%N > start.out\n'
+    'sleep {0}\n'
+    'echo {1} > job.out\n'
+    'date +%s.%N > end.out\n'
+)
+
+
+def _run_program(path, wait_time, val):
+    """ Stand in for a program run in a job directory: sleep, then write
+        the value to the output; return the value and the start and end
+        times of the run
+    """
+
+    os.makedirs(path, exist_ok=True)
+    subprocess.check_call(
+        ['bash', '-c', SLEEP_SCRIPT.format(wait_time, val)], cwd=path)
+
+    with open(os.path.join(path, 'job.out'), encoding='utf-8') as fobj:
+        out_val = int(fobj.read())
+    times = []
+    for name in ('start.out', 'end.out'):
+        with open(os.path.join(path, name), encoding='utf-8') as fobj:
+            times.append(float(fobj.read()))
+
+    return out_val, tuple(times)
+
+
+def _fail_program(path):
+    """ Stand in for a program that fails
+    """
+    os.makedirs(path, exist_ok=True)
+    subprocess.check_call(['bash', '-c', 'exit 1'], cwd=path)
+
+
+def _max_overlap(times_lst):
+    """ Most runs going at any one time
+    """
+    events = sorted([(start, 1) for start, _ in times_lst] +
+                    [(end, -1) for _, end in times_lst])
+    nrun, max_nrun = 0, 0
+    for _, change in events:
+        nrun += change
+        max_nrun = max(max_nrun, nrun)
+    return max_nrun
+
+
+def test__submit_wait():
+    """ test sched.submit
+        test sched.wait
+    """
+
+    sched.configure(ncores=4, mem=10.)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        futs = tuple(
+            sched.submit(
+                _run_program,
+                args=(os.path.join(tmp_dir, str(idx)), wait_time, idx),
+                res=(1, 1.))
+            for idx, wait_time in enumerate((0.6, 0.1, 0.3)))
+        rets = sched.wait(futs)
+
+    assert tuple(val for val, _ in rets) == (0, 1, 2)
+    assert _max_overlap([times for _, times in rets]) == 3
+    assert all(fut.done() for fut in futs)
+
+    # A single job is run through the queue as well
+    assert sched.run(os.getpid) != os.getpid()
+
+    # A job shares only the resources it requested with the jobs it
+    # submits in turn
+    assert sched.run(sched.current_budget, res=(2, 3.)) == (2, 3.)
+
+
+def test__wait_any():
+    """ test sched.wait_any
+    """
+
+    sched.configure(ncores=2, mem=10.)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        futs = tuple(
+            sched.submit(
+                _run_program,
+                args=(os.path.join(tmp_dir, str(idx)), wait_time, idx),
+                res=(1, 1.))
+            for idx, wait_time in enumerate((1.0, 0.1)))
+
+        # Returns once the first job to finish is done, whichever it is
+        done_futs = sched.wait_any(futs)
+        assert done_futs == (futs[1],)
+        assert not futs[0].done()
+        assert sched.wait_any(done_futs) == done_futs
+        sched.wait(futs)
+
+
+def test__budget():
+    """ test that running jobs never request more than the budget
+    """
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+
+        # Two cores: jobs asking for two cores run one at a time
+        sched.configure(ncores=2, mem=10.)
+        rets = sched.wait(
+            sched.submit(
+                _run_program,
+                args=(os.path.join(tmp_dir, f'a{idx}'), 0.3, idx),
+                res=(2, 1.))
+            for idx in range(3))
+        assert _max_overlap([times for _, times in rets]) == 1
+
+        # Memory bounds them as well as the cores
+        sched.configure(ncores=8, mem=10.)
+        rets = sched.wait(
+            sched.submit(
+                _run_program,
+                args=(os.path.join(tmp_dir, f'b{idx}'), 0.3, idx),
+                res=(1, 5.))
+            for idx in range(4))
+        assert _max_overlap([times for _, times in rets]) == 2
+
+        # A job asking for more than the budget still runs, by itself
+        sched.configure(ncores=2, mem=10.)
+        rets = sched.wait(
+            sched.submit(
+                _run_program,
+                args=(os.path.join(tmp_dir, f'c{idx}'), 0.3, idx),
+                res=res)
+            for idx, res in enumerate(((1, 1.), (4, 1.), (1, 1.))))
+        assert tuple(val for val, _ in rets) == (0, 1, 2)
+        assert _max_overlap([times for _, times in rets]) == 1
+
+
+def test__ordering():
+    """ test that queued jobs start by priority, then submission
+    """
+
+    sched.configure(ncores=1, mem=10.)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        futs = tuple(
+            sched.submit(
+                _run_program,
+                args=(os.path.join(tmp_dir, str(idx)), 0.1, idx),
+                res=(1, 1.), priority=priority)
+            for idx, priority in enumerate((0, 0, 1, 0, 2)))
+        rets = sched.wait(futs)
+
+    # The first job starts as soon as it is submitted
+    start_order = sorted(range(len(rets)), key=lambda idx: rets[idx][1][0])
+    assert start_order == [0, 4, 2, 1, 3]
+
+
+def test__failure():
+    """ test that a failed job raises on wait, without stopping others
+    """
+
+    sched.configure(ncores=2, mem=10.)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        fail_fut = sched.submit(
+            _fail_program, args=(os.path.join(tmp_dir, 'fail'),))
+        fut = sched.submit(
+            _run_program, args=(os.path.join(tmp_dir, 'ok'), 0.1, 7))
+
+        with pytest.raises(subprocess.CalledProcessError):
+            sched.wait((fail_fut, fut))
+        assert sched.wait((fut,))[0][0] == 7
+        assert isinstance(fail_fut.exception(),
+                          subprocess.CalledProcessError)
+
+        # Waiting on a future of another queue can never finish
+        with pytest.raises(ValueError):
+            sched.wait((sched.submit(time.sleep, args=(0.,)),
+                        type(fail_fut)()))
+
+
+def test__execute_in_pool():
+    """ test sched.execute_in_pool
+    """
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+
+        # Results come back in order, whatever order the calls finish in
+        wait_times = (0.5, 0.1, 0.3, 0.2)
+        rets = sched.execute_in_pool(
+            _run_program,
+            [(os.path.join(tmp_dir, f'a{idx}'), wait_time, idx)
+             for idx, wait_time in enumerate(wait_times)],
+            nworkers=4, budget=(4, 10.))
+        assert tuple(val for val, _ in rets) == (0, 1, 2, 3)
+        assert _max_overlap([times for _, times in rets]) == 4
+
+        # The workers and the budget both bound the calls run at once
+        rets = sched.execute_in_pool(
+            _run_program,
+            [(os.path.join(tmp_dir, f'b{idx}'), 0.2, idx)
+             for idx in range(4)],
+            nworkers=3, budget=(4, 10.))
+        assert _max_overlap([times for _, times in rets]) == 3
+        rets = sched.execute_in_pool(
+            _run_program,
+            [(os.path.join(tmp_dir, f'c{idx}'), 0.2, idx)
+             for idx in range(4)],
+            res_lst=[(2, 1.)]*4, nworkers=4, budget=(4, 10.))
+        assert _max_overlap([times for _, times in rets]) == 2
+
+        # The budget defaults to that of the process, shared by the jobs
+        # the calls submit in turn
+        sched.configure(ncores=3, mem=10.)
+        rets = sched.execute_in_pool(
+            sched.current_budget, [()]*2,
+            res_lst=[(2, 1.), (1, 4.)], nworkers=2)
+        assert rets == ((2, 1.), (1, 4.))
+
+        # A failed call is raised once the others have run
+        done = {}
+
+        def _done(idx, ret):
+            done[idx] = ret
+
+        with pytest.raises(subprocess.CalledProcessError):
+            sched.execute_in_pool(
+                _run_program,
+                [(os.path.join(tmp_dir, 'd0'), 0.1, 0),
+                 (os.path.join(tmp_dir, 'd1'), 'x', 1),
+                 (os.path.join(tmp_dir, 'd2'), 0.1, 2)],
+                nworkers=2, budget=(2, 10.), callback=_done)
+        assert sorted(done) == [0, 1, 2]
+        assert done[1] is None
+        assert (done[0][0], done[2][0]) == (0, 2)
+
+        # A single worker makes the calls in order in this process
+        rets = sched.execute_in_pool(os.getpid, [()]*2)
+        assert rets == (os.getpid(),)*2
+
+
+if __name__ == '__main__':
+    test__submit_wait()
+    test__wait_any()
+    test__budget()
+    test__ordering()
+    test__failure()
+    test__execute_in_pool()
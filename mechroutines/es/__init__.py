@@ -2,12 +2,14 @@
 """
 
 from mechroutines.es.tsk import run_tsk
+from mechroutines.es.tsk import plan_tsk
 from mechroutines.es import ts
 from mechroutines.es import runner
 
 
 __all__ = [
     'run_tsk',
+    'plan_tsk',
     'ts',
     'runner'
 ]
@@ -6,7 +6,9 @@ import automol
 import elstruct
 import autorun
 from mechanalyzer.inf import thy as tinfo
+from mechlib import sched
 from mechlib.amech_io import printer as ioprinter
+from mechlib.amech_io import reader
 from mechroutines.es import runner as es_runner
 from mechroutines.es.runner import qchem_params
 
@@ -100,18 +102,20 @@ def _kickoff_saddle(geo, norm_coords, size=0.1, backward=False, mode=0):
 def _check_imaginary(geo, hess, hess_ret, run_fs):
     """ Assess the imaginary modes to decide whether to kick or not
     """
-    _, _, imag_freq, _ = autorun.projrot.frequencies(
-       autorun.SCRIPT_DCT['projrot'],
-       run_fs[-1].path([elstruct.Job.HESSIAN]),
-       [geo], [[]], [hess])
+    _, _, imag_freq, _ = sched.run(
+       autorun.projrot.frequencies,
+       args=(autorun.SCRIPT_DCT['projrot'],
+             run_fs[-1].path([elstruct.Job.HESSIAN]),
+             [geo], [[]], [hess]))
 
     # Mode for now set the imaginary frequency check to -100:
     # Should decrease once freq projector functions properly
     if imag_freq:
-        _, norm_coords = autorun.projrot.displacements(
-           autorun.SCRIPT_DCT['projrot'],
-           run_fs[-1].path([elstruct.Job.HESSIAN]),
-           [geo], [[]], [hess])
+        _, norm_coords = sched.run(
+           autorun.projrot.displacements,
+           args=(autorun.SCRIPT_DCT['projrot'],
+                 run_fs[-1].path([elstruct.Job.HESSIAN]),
+                 [geo], [[]], [hess]))
     else:
         norm_coords = None
 
@@ -141,7 +145,8 @@ def _opt(spc_info, mod_thy_info, geo, run_fs,
     if success:
         inf_obj, _, out_str = ret
         prog = inf_obj.prog
-        ret_geo = elstruct.reader.opt_geometry(prog, out_str)
+        ret_geo = reader.es.cached(
+            elstruct.reader.opt_geometry, prog, out_str)
     else:
         ret_geo = None
 
@@ -170,7 +175,7 @@ def _hess(spc_info, mod_thy_info, geo, run_fs,
     if success:
         inf_obj, _, out_str = ret
         prog = inf_obj.prog
-        ret_hess = elstruct.reader.hessian(prog, out_str)
+        ret_hess = reader.es.cached(elstruct.reader.hessian, prog, out_str)
     else:
         ret_hess = None
 
@@ -3,6 +3,7 @@
 
 import numpy
 import automol
+from phydat import phycon
 from mechlib.amech_io.printer import info_message
 
 
@@ -68,3 +69,161 @@ def nsamp_init(nsamp_par, ntaudof):
     else:
         nsamp = nsamp_par[5]
     return nsamp
+
+
+# Lennard-Jones (epsilon [kcal/mol], sigma [Ang]) and covalent radii [Ang]
+# used to screen torsional samples; other elements use the X entries. These
+# are not those of automol.pot, so the samples kept are checked with it too
+LJ_PARAM_DCT = {
+    'H': (0.044, 2.571),
+    'C': (0.105, 3.431),
+    'N': (0.069, 3.261),
+    'O': (0.060, 3.118),
+    'S': (0.274, 3.595),
+    'X': (0.100, 3.400),
+}
+COV_RAD_DCT = {
+    'H': 0.31,
+    'C': 0.76,
+    'N': 0.71,
+    'O': 0.66,
+    'S': 1.05,
+    'X': 0.80,
+}
+
+
+def screened_samples(zma, tors_range_dct, nsamp=100, thresh=None):
+    """ Generate a batch of torsional samples of a Z-Matrix, dropping
+        those with too much intramolecular repulsion.
+
+        All of the samples are converted to Cartesian coordinates and
+        their Lennard-Jones sums over atom pairs at least three bonds
+        apart are evaluated at once with NumPy. The samples whose sums
+        exceed that of the input Z-Matrix by more than the threshold are
+        dropped; the rest are returned in the order they were drawn,
+        along with the increase of their sums.
+
+        :param zma: Z-Matrix to sample the torsions of
+        :type zma: automol.zmat object
+        :param tors_range_dct: range of values to sample for each torsion
+        :type tors_range_dct: dict[str: (float, float)]
+        :param nsamp: number of samples in the batch
+        :type nsamp: int
+        :param thresh: largest increase of the sum (kcal/mol) kept, if any
+        :type thresh: float
+        :rtype: tuple((automol.zmat object, float))
+    """
+
+    symbs = automol.zmat.symbols(zma)
+    key_mat = automol.zmat.key_matrix(zma)
+    name_mat = automol.zmat.name_matrix(zma)
+    val_mat = numpy.array(
+        [[0.0 if val is None else val for val in row]
+         for row in automol.zmat.value_matrix(zma)])
+
+    # Set the sampled torsion values for the batch; the input is first
+    tors_names = tuple(tors_range_dct.keys())
+    tors_vals = numpy.array(
+        [numpy.random.uniform(*tors_range_dct[name], size=nsamp)
+         for name in tors_names]).T
+    val_arr = numpy.repeat(val_mat[numpy.newaxis], nsamp+1, axis=0)
+    for idx, name in enumerate(tors_names):
+        for row, names in enumerate(name_mat):
+            if names[2] == name:
+                val_arr[1:, row, 2] = tors_vals[:, idx]
+
+    xyz_arr = _zmatrix_cartesians(key_mat, val_arr)
+    pots = _lj_potential_sums(symbs, xyz_arr)
+    dpots = pots[1:] - pots[0]
+
+    samps = []
+    for idx, dpot in enumerate(dpots):
+        if thresh is None or dpot <= thresh:
+            samp_zma = automol.zmat.set_values_by_name(
+                zma, dict(zip(tors_names, tors_vals[idx])),
+                angstrom=False, degree=False)
+            samps.append((samp_zma, float(dpot)))
+
+    return tuple(samps)
+
+
+def _zmatrix_cartesians(key_mat, val_arr):
+    """ Convert a batch of values for the same Z-Matrix to Cartesian
+        coordinates (in a frame that is arbitrary but the same for all)
+
+        :param key_mat: key matrix of the Z-Matrix
+        :param val_arr: values (bohr, radian) for each sample, (nsamp, natm, 3)
+        :rtype: numpy.ndarray (nsamp, natm, 3)
+    """
+
+    nsamp, natm, _ = val_arr.shape
+    xyz_arr = numpy.zeros((nsamp, natm, 3))
+    for row in range(1, natm):
+        dist = val_arr[:, row, 0]
+        if row == 1:
+            xyz_arr[:, 1, 2] = dist
+            continue
+
+        key1, key2 = key_mat[row][0], key_mat[row][1]
+        xyz1, xyz2 = xyz_arr[:, key1], xyz_arr[:, key2]
+        if row == 2:
+            ang, dih = val_arr[:, row, 1], numpy.zeros(nsamp)
+            xyz3 = xyz2 + numpy.array([1.0, 0.0, 0.0])
+        else:
+            ang, dih = val_arr[:, row, 1], val_arr[:, row, 2]
+            xyz3 = xyz_arr[:, key_mat[row][2]]
+
+        # Place the atom in the frame of its three reference atoms
+        uvec1 = xyz1 - xyz2
+        uvec1 /= numpy.linalg.norm(uvec1, axis=1)[:, numpy.newaxis]
+        uvec3 = numpy.cross(xyz2 - xyz3, uvec1)
+        uvec3 /= numpy.linalg.norm(uvec3, axis=1)[:, numpy.newaxis]
+        uvec2 = numpy.cross(uvec3, uvec1)
+        comps = numpy.array([-dist * numpy.cos(ang),
+                             dist * numpy.sin(ang) * numpy.cos(dih),
+                             dist * numpy.sin(ang) * numpy.sin(dih)]).T
+        xyz_arr[:, row] = (xyz1 +
+                           comps[:, 0:1] * uvec1 +
+                           comps[:, 1:2] * uvec2 +
+                           comps[:, 2:3] * uvec3)
+
+    return xyz_arr
+
+
+def _lj_potential_sums(symbs, xyz_arr):
+    """ Sum the Lennard-Jones potential (kcal/mol) over pairs of real atoms
+        at least three bonds apart for each structure of a batch, where the
+        bonds are set from the first structure
+
+        :rtype: numpy.ndarray (nsamp,)
+    """
+
+    idxs = [idx for idx, symb in enumerate(symbs) if symb != 'X']
+    symbs = [symbs[idx] for idx in idxs]
+    xyz_arr = xyz_arr[:, idxs] * phycon.BOHR2ANG
+    natm = len(idxs)
+
+    # Find the number of bonds between atoms in the first structure
+    dist_mat = numpy.linalg.norm(
+        xyz_arr[0, :, numpy.newaxis] - xyz_arr[0, numpy.newaxis], axis=2)
+    rads = numpy.array([COV_RAD_DCT.get(symb, COV_RAD_DCT['X'])
+                        for symb in symbs])
+    bond_mat = dist_mat < 1.2 * (rads[:, numpy.newaxis] + rads)
+    numpy.fill_diagonal(bond_mat, False)
+    near_mat = numpy.identity(natm, dtype=int) + bond_mat.astype(int)
+    near_mat = near_mat @ near_mat
+
+    idxs1, idxs2 = numpy.triu_indices(natm, k=1)
+    far = near_mat[idxs1, idxs2] == 0
+    idxs1, idxs2 = idxs1[far], idxs2[far]
+
+    # Combine the parameters of each pair and sum their potentials
+    params = numpy.array([LJ_PARAM_DCT.get(symb, LJ_PARAM_DCT['X'])
+                          for symb in symbs])
+    eps = numpy.sqrt(params[idxs1, 0] * params[idxs2, 0])
+    sig = (params[idxs1, 1] + params[idxs2, 1]) / 2.0
+    dists = numpy.linalg.norm(
+        xyz_arr[:, idxs1] - xyz_arr[:, idxs2], axis=2)
+    ratio6 = (sig / dists)**6
+
+    return numpy.sum(4.0 * eps * (ratio6**2 - ratio6), axis=1)
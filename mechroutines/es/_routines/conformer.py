@@ -2,13 +2,16 @@
 """
 
 import shutil
-import time
+import itertools
+import numpy
 import automol
 import elstruct
 import autofile
 from autofile import fs
 from mechanalyzer.inf import thy as tinfo
 from mechlib import filesys
+from mechlib.sched import execute_in_pool
+from mechlib.amech_io import reader
 from mechlib.amech_io.printer import info_message, warning_message
 from mechlib.amech_io.printer import debug_message, error_message, obj
 from mechlib.amech_io.printer import existing_path, bad_conformer, checking
@@ -17,6 +20,10 @@ from mechroutines.es._routines import _util as util
 from mechroutines.es._routines._geom import remove_imag
 
 
+# Number of torsional samples screened for repulsion at once
+SCREEN_BATCH = 100
+
+
 # Initial conformer
 def initial_conformer(spc_dct_i, spc_info, ini_method_dct, method_dct,
                       ini_cnf_save_fs, cnf_run_fs, cnf_save_fs,
@@ -149,6 +156,8 @@ def _obtain_ini_geom(spc_dct_i, ini_cnf_save_fs,
             cnf_save_path = ini_cnf_save_fs[-1].path(locs)
             debug_message(f'Removing {cnf_save_path}')
             shutil.rmtree(cnf_save_path)
+            filesys.archive.remove(cnf_save_path)
+            filesys.index.remove(cnf_save_path)
 
     if geo_init is None:
         if 'geo_inp' in spc_dct_i:
@@ -236,8 +245,10 @@ def _optimize_molecule(spc_info, zma_init,
     # read the geometry
     if success:
         inf_obj, _, out_str = ret
-        geo = elstruct.reader.opt_geometry(inf_obj.prog, out_str)
-        zma = elstruct.reader.opt_zmatrix(inf_obj.prog, out_str)
+        geo = reader.es.cached(
+            elstruct.reader.opt_geometry, inf_obj.prog, out_str)
+        zma = reader.es.cached(
+            elstruct.reader.opt_zmatrix, inf_obj.prog, out_str)
         if zma is None:
             zma = automol.geom.zmatrix(geo)
         geo_conn = bool(automol.geom.connected(geo))
@@ -337,11 +348,13 @@ def single_conformer(zma, spc_info, mod_thy_info,
             inf_obj, _, out_str = ret
             prog = inf_obj.prog
             method = inf_obj.method
-            ene = elstruct.reader.energy(prog, method, out_str)
-            geo = elstruct.reader.opt_geometry(prog, out_str)
+            ene = reader.es.cached(
+                elstruct.reader.energy, prog, method, out_str)
+            geo = reader.es.cached(
+                elstruct.reader.opt_geometry, prog, out_str)
             # zma = elstruct.reader.opt_zmatrix(prog, out_str)
-            saved_locs, saved_geos, saved_enes = _saved_cnf_info(
-                cnf_save_fs, mod_thy_info)
+            saved_locs, saved_geos, saved_enes = _similar_cnf_info(
+                geo, ene, cnf_save_fs, mod_thy_info)
 
             if _geo_unique(geo, ene, saved_geos, saved_enes, zrxn=zrxn):
                 sym_id = _sym_unique(
@@ -404,8 +417,18 @@ def conformer_sampling(zma, spc_info, thy_info,
                        zrxn=None, two_stage=False,
                        retryfail=False, resave=False,
                        repulsion_thresh=40.0, print_debug=True,
+                       njobs=1, job_res=(1, 0.0),
                        **kwargs):
     """ run sampling algorithm to find conformers
+
+        Up to `njobs` sample optimizations are run at once, each in its own
+        leaf of the run filesys. Samples are saved as their optimizations
+        finish, and new samples are only launched while the number saved
+        plus the number still running is short of the number requested.
+
+        Samples are screened for an approximate repulsion in batches of
+        `SCREEN_BATCH`, and those kept are taken in the order they were
+        drawn, each then checked as before.
     """
 
     # Check if any saving needs to be done before hand
@@ -438,58 +461,99 @@ def conformer_sampling(zma, spc_info, thy_info,
     # Generate all of the conformers, as needed
     samp_idx = 1
     samp_attempt_idx = 1
-    while True:
-        nsamp = nsamp0 - nsampd
-        # Break the while loop if enough sampls completed
-        if nsamp <= 0:
-            info_message(
-                'Requested number of samples have been completed.',
-                'Conformer search complete.')
-            break
-        if samp_attempt_idx == brk_tot_samp:
-            info_message(
-                f'Max sample num: 5*{nsamp} attempted, ending search',
-                'Run again if more samples desired.')
-            break
-
-        # Run the conformer sampling
-        if nsampd > 0:
-            samp_zma, = automol.zmat.samples(zma, 1, tors_range_dct)
-        else:
-            samp_zma = zma
-
-        info_message(
-            'Generating sample Z-Matrix that does not have',
-            'high intramolecular repulsion...')
+    nrunning = 0
+    samp_lst = []
+    tors_names = tuple(tors_range_dct.keys()) if tors_range_dct else ()
+
+    ref_pot = None
+    screened_samps = []
+
+    def _screened_sample():
+        """ Take the next of the screened samples left, screening a new
+            batch when none are left, and check its repulsion
+        """
+        nonlocal ref_pot
+        if ref_pot is None:
+            ref_pot = automol.pot.intramol_interaction_potential_sum(
+                automol.zmat.geometry(zma))
         bad_geo_cnt = 0
-        ref_pot = automol.pot.intramol_interaction_potential_sum(
-            automol.zmat.geometry(zma))
-        samp_pot = automol.pot.intramol_interaction_potential_sum(
-            automol.zmat.geometry(samp_zma))
-        while samp_pot-ref_pot > repulsion_thresh and bad_geo_cnt < 1000:
+        while True:
+            if not screened_samps:
+                thresh = repulsion_thresh if bad_geo_cnt < 1000 else None
+                batch = util.screened_samples(
+                    zma, tors_range_dct, nsamp=SCREEN_BATCH, thresh=thresh)
+                bad_geo_cnt += SCREEN_BATCH - len(batch)
+                screened_samps.extend(batch)
+                continue
+            samp_zma, _ = screened_samps.pop(0)
+            samp_pot = automol.pot.intramol_interaction_potential_sum(
+                automol.zmat.geometry(samp_zma))
+            if samp_pot-ref_pot <= repulsion_thresh or bad_geo_cnt >= 1000:
+                break
             if print_debug:
                 warning_message('Structure has high repulsion.')
                 warning_message(
-                    'Sums of intramol LJ potential interactions [kcal/mol]:',
+                    'Sums of intramol LJ potential interactions '
+                    '[kcal/mol]:',
                     f'Ref:{ref_pot:.2f}, Test:{samp_pot:.2f}, '
                     f'Diff:{samp_pot-ref_pot:.2f}')
                 warning_message(
-                    'Generating new sample Z-Matrix')
-            samp_zma, = automol.zmat.samples(zma, 1, tors_range_dct)
-            samp_pot = automol.pot.intramol_interaction_potential_sum(
-                automol.zmat.geometry(samp_zma))
+                    'Taking next screened sample Z-Matrix')
             bad_geo_cnt += 1
 
-        cid = autofile.schema.generate_new_conformer_id()
-        locs = [rid, cid]
+        return samp_zma
+
+    def _sample_jobs():
+        """ Generate a sample Z-Matrix and run filesys leaf for each job,
+            while more samples are still needed
+        """
+        nonlocal samp_attempt_idx, nrunning
+        while True:
+            nsamp = nsamp0 - nsampd
+            # Break the while loop if enough sampls completed
+            if nsamp <= 0 and not nrunning:
+                info_message(
+                    'Requested number of samples have been completed.',
+                    'Conformer search complete.')
+                break
+            if samp_attempt_idx == brk_tot_samp:
+                info_message(
+                    f'Max sample num: 5*{nsamp} attempted, ending search',
+                    'Run again if more samples desired.')
+                break
+            # Wait on running samples if they may complete the request
+            if nsamp - nrunning <= 0:
+                yield None
+                continue
 
-        cnf_run_fs[-1].create(locs)
-        cnf_run_path = cnf_run_fs[-1].path(locs)
-        run_fs = autofile.fs.run(cnf_run_path)
+            # Run the conformer sampling
+            if nsampd > 0 or nrunning > 0:
+                info_message(
+                    'Generating sample Z-Matrix that does not have',
+                    'high intramolecular repulsion...')
+                samp_zma = _screened_sample()
+            else:
+                samp_zma = zma
+
+            cid = autofile.schema.generate_new_conformer_id()
+            locs = [rid, cid]
+
+            cnf_run_fs[-1].create(locs)
+            cnf_run_path = cnf_run_fs[-1].path(locs)
+
+            info_message(f"Run {samp_idx+nrunning}/{tot_samp}")
+            print('two_stage test:', two_stage, tors_names)
 
-        info_message(f"Run {samp_idx}/{tot_samp}")
-        tors_names = tuple(tors_range_dct.keys())
-        print('two_stage test:', two_stage, tors_names)
+            # Increment attempt counter
+            samp_attempt_idx += 1
+            nrunning += 1
+            samp_lst.append((samp_zma, locs))
+            yield (samp_zma, cnf_run_path)
+
+    def _run_sample(samp_zma, cnf_run_path):
+        """ Optimize a single sample in its run filesys leaf
+        """
+        run_fs = autofile.fs.run(cnf_run_path)
         if two_stage and tors_names:
             frozen_coords_lst = (tors_names, ())
             success, ret = es_runner.multi_stage_optimization(
@@ -519,11 +583,19 @@ def conformer_sampling(zma, spc_info, thy_info,
                 retryfail=retryfail,
                 **kwargs
             )
+        return success, ret
+
+    def _save_sample(idx, job_ret):
+        """ Save a finished sample and update the sample counts
+        """
+        nonlocal nsampd, samp_idx, nrunning
+        nrunning -= 1
+        samp_zma, locs = samp_lst[idx]
 
         # save function added here
-        if success:
+        if job_ret is not None and job_ret[0]:
             save_conformer(
-                ret, cnf_run_fs, cnf_save_fs, locs, thy_info,
+                job_ret[1], cnf_run_fs, cnf_save_fs, locs, thy_info,
                 zrxn=zrxn, orig_ich=spc_info[0], rid_traj=True,
                 init_zma=samp_zma)
 
@@ -534,8 +606,10 @@ def conformer_sampling(zma, spc_info, thy_info,
             cnf_save_fs[1].file.info.write(inf_obj, [rid])
             cnf_run_fs[1].file.info.write(inf_obj, [rid])
 
-        # Increment attempt counter
-        samp_attempt_idx += 1
+    execute_in_pool(
+        _run_sample, _sample_jobs(),
+        res_lst=itertools.repeat(job_res),
+        nworkers=njobs, callback=_save_sample)
 
 
 def _num_samp_zmas(ring_atoms, nsamp_par):
@@ -739,14 +813,14 @@ def save_conformer(ret, cnf_run_fs, cnf_save_fs, locs, thy_info, zrxn=None,
           # may need to get geo, ene, etc; maybe make function
     """
 
-    saved_locs, saved_geos, saved_enes = _saved_cnf_info(
-        cnf_save_fs, thy_info, locs)
-
     inf_obj, _, out_str = ret
     prog = inf_obj.prog
     method = inf_obj.method
-    ene = elstruct.reader.energy(prog, method, out_str)
-    geo = elstruct.reader.opt_geometry(prog, out_str)
+    ene = reader.es.cached(elstruct.reader.energy, prog, method, out_str)
+    geo = reader.es.cached(elstruct.reader.opt_geometry, prog, out_str)
+
+    saved_locs, saved_geos, saved_enes = _similar_cnf_info(
+        geo, ene, cnf_save_fs, thy_info, orig_locs=locs)
     zma = None
     if init_zma is not None:
         zma = filesys.save.read_zma_from_geo(init_zma, geo)
@@ -780,6 +854,8 @@ def save_conformer(ret, cnf_run_fs, cnf_save_fs, locs, thy_info, zrxn=None,
                 if cnf_save_fs[-1].exists(locs):
                     cnf_save_path = cnf_save_fs[-1].path(locs)
                     shutil.rmtree(cnf_save_path)
+                    filesys.archive.remove(cnf_save_path)
+                    filesys.index.remove(cnf_save_path)
                 if cnf_run_fs[-1].exists(locs):
                     cnf_run_path = cnf_run_fs[-1].path(locs)
                     shutil.rmtree(cnf_run_path)
@@ -787,6 +863,8 @@ def save_conformer(ret, cnf_run_fs, cnf_save_fs, locs, thy_info, zrxn=None,
             if cnf_save_fs[-1].exists(locs):
                 cnf_save_path = cnf_save_fs[-1].path(locs)
                 shutil.rmtree(cnf_save_path)
+                filesys.archive.remove(cnf_save_path)
+                filesys.index.remove(cnf_save_path)
             if cnf_run_fs[-1].exists(locs):
                 cnf_run_path = cnf_run_fs[-1].path(locs)
                 shutil.rmtree(cnf_run_path)
@@ -811,41 +889,104 @@ def _saved_cnf_info(cnf_save_fs, mod_thy_info, orig_locs=None):
     found_saved_geos = []
     found_saved_enes = []
     for idx, locs in enumerate(saved_locs):
-        path = cnf_save_fs[-1].path(locs)
-        sp_save_fs = autofile.fs.single_point(path)
-        if sp_save_fs[-1].file.energy.exists(mod_thy_info[1:4]):
-            found_saved_enes.append(sp_save_fs[-1].file.energy.read(
-                mod_thy_info[1:4]))
+        ene = _saved_cnf_energy(cnf_save_fs, locs, mod_thy_info)
+        if ene is not None:
+            found_saved_enes.append(ene)
             found_saved_locs.append(saved_locs[idx])
             found_saved_geos.append(saved_geos[idx])
-        else:
-            info_message(
-                f'No energy saved in single point directory for {path}')
-            # geo_inf_obj = cnf_save_fs[-1].file.geometry_info.read(
-            #     mod_thy_info[1:4])
-            geo_inf_obj = cnf_save_fs[-1].file.geometry_info.read(
-                locs)
-            geo_end_time = geo_inf_obj.utc_end_time
-            current_time = autofile.schema.utc_time()
-            if (current_time - geo_end_time).total_seconds() < 120:
-                last_time = (current_time - geo_end_time).total_seconds()
-                wait_time = 120 - last_time
-                info_message(
-                    f'Geo was saved in the last {last_time:3.2f} seconds, '
-                    f'waiting for {wait_time:3.2f} seconds')
-                time.sleep(wait_time)
-                if sp_save_fs[-1].file.energy.exists(mod_thy_info[1:4]):
-                    found_saved_enes.append(sp_save_fs[-1].file.energy.read(
-                        mod_thy_info[1:4]))
-                    found_saved_locs.append(saved_locs[idx])
-                    found_saved_geos.append(saved_geos[idx])
-                    info_message('the energy is now found')
-                else:
-                    info_message('waiting helped nothing')
 
     return found_saved_locs, found_saved_geos, found_saved_enes
 
 
+def _similar_cnf_info(geo, ene, cnf_save_fs, mod_thy_info, orig_locs=None,
+                      ethresh=1.0e-5):
+    """ get the locs, geos and enes for the saved conformers that a new
+        conformer must be compared to in order to assess if it is unique
+
+        `_geo_unique` compares a new conformer to all of the saved ones
+        as soon as one has an energy within the threshold, so all are
+        returned if one does, and none otherwise. The conformer index, if
+        turned on, is used to check this without reading every energy;
+        otherwise all are read as in `_saved_cnf_info`.
+
+        The conformers are ordered by how close their geometry
+        fingerprints are to that of the new conformer, so that the
+        comparisons stop at a match as early as possible. The fingerprints
+        are kept in the conformer index, if turned on.
+    """
+
+    similar = True
+    if filesys.index.enabled():
+        saved_locs = filesys.index.locators(cnf_save_fs)
+        if saved_locs is None:
+            saved_locs = cnf_save_fs[-1].existing()
+        saved_locs = [locs for locs in saved_locs
+                      if not tuple(locs) == tuple(orig_locs or ())]
+        near_locs, _, no_ene_locs = filesys.index.energy_neighbors(
+            cnf_save_fs, saved_locs, mod_thy_info[1:4], ene, ethresh)
+        similar = bool(near_locs)
+        for locs in no_ene_locs:
+            if not similar:
+                sene = _saved_cnf_energy(cnf_save_fs, locs, mod_thy_info)
+                similar = sene is not None and abs(sene - ene) < ethresh
+
+    found_saved_locs, found_saved_geos, found_saved_enes = [], [], []
+    if similar:
+        saved_locs, saved_geos, saved_enes = _saved_cnf_info(
+            cnf_save_fs, mod_thy_info, orig_locs=orig_locs)
+
+        # Compare to the nearest fingerprints first
+        geo_dct = {tuple(locs): sgeo
+                   for locs, sgeo in zip(saved_locs, saved_geos)}
+        fprint = _coulomb_fingerprint(geo)
+        fprint_dct = filesys.index.fingerprints(
+            cnf_save_fs, saved_locs,
+            lambda locs: _coulomb_fingerprint(geo_dct[tuple(locs)]))
+
+        def _fprint_distance(idx):
+            sfprint = fprint_dct[tuple(saved_locs[idx])]
+            if sfprint is None or len(sfprint) != len(fprint):
+                dist = float('inf')
+            else:
+                dist = float(numpy.linalg.norm(sfprint - fprint))
+            return dist
+
+        order = sorted(range(len(saved_locs)), key=_fprint_distance)
+        found_saved_locs = [saved_locs[idx] for idx in order]
+        found_saved_geos = [saved_geos[idx] for idx in order]
+        found_saved_enes = [saved_enes[idx] for idx in order]
+
+    return found_saved_locs, found_saved_geos, found_saved_enes
+
+
+def _coulomb_fingerprint(geo):
+    """ sorted eigenvalues of the Coulomb matrix of a geometry, which
+        are the same for conformers that are equivalent by symmetry
+    """
+    return numpy.sort(automol.geom.coulomb_spectrum(geo))
+
+
+def _saved_cnf_energy(cnf_save_fs, locs, mod_thy_info):
+    """ get the energy of a saved conformer, waiting for it if its
+        save is still pending
+    """
+
+    ene = None
+    path = cnf_save_fs[-1].path(locs)
+    sp_save_fs = autofile.fs.single_point(path)
+    if sp_save_fs[-1].file.energy.exists(mod_thy_info[1:4]):
+        ene = sp_save_fs[-1].file.energy.read(mod_thy_info[1:4])
+    else:
+        info_message(
+            f'No energy saved in single point directory for {path}')
+        ene = filesys.pending.wait_for_energy(
+            path, sp_save_fs, mod_thy_info[1:4])
+        if ene is not None:
+            info_message('the energy is now found')
+
+    return ene
+
+
 def _init_geom_is_running(cnf_run_fs):
     """ Check the RUN filesystem for currently running initial geometry submissions
     """
@@ -1062,14 +1203,19 @@ def unique_fs_ring_confs(
     uni_ini_cnf_locs = []
     rng_dct = {}
 
+    # Read the saved Z-Matrices once, to compare each initial one against
+    cnf_rids = numpy.array([locs[0] for locs in cnf_locs_lst])
+    cnf_zma_arrs = filesys.mincnf.zmatrix_value_arrays(
+        tuple(_saved_zma(cnf_save_fs, locs) for locs in cnf_locs_lst))
+    rng_frag_zmas = None
+
     for ini_locs in ini_cnf_locs_lst:
         ini_rid, _ = ini_locs
         if ini_rid in [locs[0] for locs in uni_ini_rng_locs]:
             uni_ini_rng_locs.append(ini_locs)
             continue
         ini_cnf_save_path = ini_cnf_save_fs[-1].path(ini_locs)
-        ini_zma_fs = autofile.fs.zmatrix(ini_cnf_save_path)
-        inizma = ini_zma_fs[-1].file.zmatrix.read((0,))
+        inizma = _saved_zma(ini_cnf_save_fs, ini_locs)
         inigeo = automol.zmat.geometry(inizma)
         checking('structures', ini_cnf_save_path)
         # Check to see if a similar ring pucker is in the runlvl filesystem
@@ -1077,35 +1223,11 @@ def unique_fs_ring_confs(
         if ini_rid in rng_dct:
             found_rid = rng_dct[ini_rid]
         else:
-            frag_ini_geo = automol.geom.ring_fragments_geometry(inigeo)
-            if frag_ini_geo is not None:
-                frag_ini_zma = automol.geom.zmatrix(frag_ini_geo)
-            skip_trid = []
-            for tlocs in cnf_save_fs[-1].existing():
-                trid, _ = tlocs
-                if frag_ini_geo is None:
-                    found_rid = trid
-                    rng_dct[ini_rid] = trid
-                    break
-                if trid in skip_trid:
-                    continue
-                cnf_save_path = cnf_save_fs[-1].path(tlocs)
-                zma_fs = autofile.fs.zmatrix(cnf_save_path)
-                zma = zma_fs[-1].file.zmatrix.read((0,))
-                geo = automol.zmat.geometry(zma)
-                # geo = cnf_save_fs[-1].file.geometry.read(tlocs)
-                frag_geo = automol.geom.ring_fragments_geometry(geo)
-                if frag_geo is None:
-                    found_rid = trid
-                    rng_dct[ini_rid] = trid
-                    break
-                frag_zma = automol.geom.zmatrix(frag_geo)
-                if automol.zmat.almost_equal(frag_ini_zma, frag_zma,
-                                             dist_rtol=0.1, ang_atol=.4):
-                    rng_dct[ini_rid] = trid
-                    found_rid = trid
-                    break
-                skip_trid.append(trid)
+            if rng_frag_zmas is None:
+                rng_frag_zmas = _ring_fragment_zmas(cnf_save_fs)
+            found_rid = _similar_ring(inigeo, rng_frag_zmas)
+            if found_rid is not None:
+                rng_dct[ini_rid] = found_rid
         # If no similar runlvl ring pucker, then add it to unique rings
         if found_rid is None:
             uni_ini_rng_locs.append(ini_locs)
@@ -1113,29 +1235,71 @@ def unique_fs_ring_confs(
 
         # If similar ring is found,
         # check actual conformers under that ring orientation
-        found = False
-        for locs in cnf_locs_lst:
-            rid, _ = locs
-            if rid != found_rid:
-                continue
-            cnf_save_path = cnf_save_fs[-1].path(locs)
-            zma_fs = autofile.fs.zmatrix(cnf_save_path)
-            zma = zma_fs[-1].file.zmatrix.read((0,))
-            geo = automol.zmat.geometry(zma)
-            if automol.zmat.almost_equal(inizma, zma,
-                                         dist_rtol=0.1, ang_atol=.4):
-                info_message(
-                    f'- Similar structure found at {cnf_save_path}')
-                found = True
-                break
-
+        match = filesys.mincnf.almost_equal_matrix(
+            filesys.mincnf.zmatrix_value_arrays((inizma,)), cnf_zma_arrs,
+            dist_rtol=0.1, ang_atol=.4)[0]
+        match &= cnf_rids == found_rid
+        if match.any():
+            cnf_save_path = cnf_save_fs[-1].path(
+                cnf_locs_lst[numpy.argmax(match)])
+            info_message(
+                f'- Similar structure found at {cnf_save_path}')
         # If no match was found, add to unique locs lst
-        if not found:
+        else:
             uni_ini_cnf_locs.append((ini_locs, found_rid))
 
     return uni_ini_rng_locs, uni_ini_cnf_locs
 
 
+def _ring_fragment_zmas(cnf_save_fs):
+    """ Z-Matrices of the ring fragments of the first conformer saved
+        for each ring, None for any without ring fragments
+    """
+
+    rng_frag_zmas = {}
+    for locs in cnf_save_fs[-1].existing():
+        rid, _ = locs
+        if rid not in rng_frag_zmas:
+            geo = automol.zmat.geometry(_saved_zma(cnf_save_fs, locs))
+            frag_geo = automol.geom.ring_fragments_geometry(geo)
+            rng_frag_zmas[rid] = (
+                automol.geom.zmatrix(frag_geo) if frag_geo is not None
+                else None)
+
+    return rng_frag_zmas
+
+
+def _similar_ring(geo, rng_frag_zmas):
+    """ Find the first saved ring whose fragments match those of a
+        geometry; any saved ring matches if either lacks ring fragments
+    """
+
+    rids = tuple(rng_frag_zmas)
+    frag_geo = automol.geom.ring_fragments_geometry(geo)
+    if frag_geo is None:
+        found = numpy.ones(len(rids), dtype=bool)
+    else:
+        frag_zmas = tuple(
+            zma for zma in rng_frag_zmas.values() if zma is not None)
+        match = filesys.mincnf.almost_equal_matrix(
+            filesys.mincnf.zmatrix_value_arrays(
+                (automol.geom.zmatrix(frag_geo),)),
+            filesys.mincnf.zmatrix_value_arrays(frag_zmas),
+            dist_rtol=0.1, ang_atol=.4)[0]
+        found = numpy.array(
+            [zma is None for zma in rng_frag_zmas.values()], dtype=bool)
+        found[~found] = match
+
+    return rids[numpy.argmax(found)] if found.any() else None
+
+
+def _saved_zma(cnf_fs, locs):
+    """ Read the Z-Matrix saved for a conformer
+    """
+    zma_fs = autofile.fs.zmatrix(cnf_fs[-1].path(locs))
+    return zma_fs[-1].file.zmatrix.read((0,))
+
+
 def unique_fs_confs(cnf_save_fs, cnf_save_locs_lst,
                     ini_cnf_save_fs, ini_cnf_save_locs_lst):
     """ Assess which structures from the cnf_save_fs currently exist
@@ -1143,32 +1307,30 @@ def unique_fs_confs(cnf_save_fs, cnf_save_locs_lst,
         in the ini_cnf_save_fs.
     """
 
-    uni_ini_cnf_save_locs = []
-    for ini_locs in ini_cnf_save_locs_lst:
+    # Build the Z-Matrices of both sets of structures once and compare
+    # them all at once
+    inizmas = tuple(
+        automol.geom.zmatrix(ini_cnf_save_fs[-1].file.geometry.read(locs))
+        for locs in ini_cnf_save_locs_lst)
+    zmas = tuple(
+        automol.geom.zmatrix(cnf_save_fs[-1].file.geometry.read(locs))
+        for locs in cnf_save_locs_lst)
+    match = filesys.mincnf.almost_equal_matrix(
+        filesys.mincnf.zmatrix_value_arrays(inizmas),
+        filesys.mincnf.zmatrix_value_arrays(zmas),
+        dist_rtol=0.1, ang_atol=.4)
 
-        # Initialize variable to see if initial struct is found
-        found = False
-
-        # Loop over structs in cnf_save, see if they match the current struct
-        inigeo = ini_cnf_save_fs[-1].file.geometry.read(ini_locs)
-        inizma = automol.geom.zmatrix(inigeo)
-        # inizma =  ini_cnf_save_fs[-1].file.zmatrix.read(ini_locs)
+    uni_ini_cnf_save_locs = []
+    for ini_locs, ini_match in zip(ini_cnf_save_locs_lst, match):
         ini_cnf_save_path = ini_cnf_save_fs[-1].path(ini_locs)
         checking('structures', ini_cnf_save_path)
-        for locs in cnf_save_locs_lst:
-            geo = cnf_save_fs[-1].file.geometry.read(locs)
-            zma = automol.geom.zmatrix(geo)
-            # zma =  cnf_save_fs[-1].file.zmatrix.read(locs)
-            if automol.zmat.almost_equal(inizma, zma,
-                                         dist_rtol=0.1, ang_atol=.4):
-                cnf_save_path = cnf_save_fs[-1].path(locs)
-                info_message(
-                    f'- Similar structure found at {cnf_save_path}')
-                found = True
-                break
-
+        if ini_match.any():
+            cnf_save_path = cnf_save_fs[-1].path(
+                cnf_save_locs_lst[numpy.argmax(ini_match)])
+            info_message(
+                f'- Similar structure found at {cnf_save_path}')
         # If no match was found, add to unique locs lst
-        if not found:
+        else:
             uni_ini_cnf_save_locs.append(ini_locs)
 
     return uni_ini_cnf_save_locs
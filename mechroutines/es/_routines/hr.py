@@ -1,10 +1,12 @@
 """ es_runners for coordinate scans
 """
 
+import itertools
 import automol
 import elstruct
 from mechlib.amech_io import printer as ioprinter
-from mechroutines.es.runner import scan, qchem_params
+from mechlib.sched import execute_in_pool
+from mechroutines.es.runner import scan, qchem_params, job_resources
 
 
 def hindered_rotor_scans(
@@ -15,8 +17,15 @@ def hindered_rotor_scans(
         zrxn=None,
         saddle=False,
         increment=0.5235987756,
-        retryfail=True):
+        retryfail=True,
+        njobs=1):
     """ Perform scans over each of the torsional coordinates
+
+        Up to `njobs` electronic structure jobs are run at once. Relaxed
+        scans of different rotors start from the same reference zma and
+        are saved to different locators, so they are run concurrently with
+        the points of each scan run in order. For rigid scans, the rotors
+        are run in order with the points of each scan run concurrently.
     """
 
     if tors_model != '1dhrfa':
@@ -38,6 +47,8 @@ def hindered_rotor_scans(
         backstep = False
         reverse_sweep = False
 
+    job_res = job_resources(method_dct)
+
     # backstep = False
     run_tors_names = automol.rotor.names(rotors)
     run_tors_grids = automol.rotor.grids(rotors, increment=increment)
@@ -47,7 +58,10 @@ def hindered_rotor_scans(
         zma, run_tors_names, tors_model)
 
     ioprinter.run_rotors(run_tors_names, const_names)
-    for tors_names, tors_grids in zip(run_tors_names, run_tors_grids):
+
+    def _scan_rotor(tors_names, tors_grids):
+        """ Run the scan and backsteps for a single rotor
+        """
 
         ioprinter.info_message(
             f'Running Rotor: {"-".join(tors_names)}', newline=1)
@@ -73,6 +87,8 @@ def hindered_rotor_scans(
             saddle=saddle,
             constraint_dct=constraint_dct,
             retryfail=retryfail,
+            njobs=njobs,
+            job_res=job_res,
             **kwargs,
         )
         if backstep:
@@ -94,6 +110,14 @@ def hindered_rotor_scans(
                 **kwargs,
             )
 
+    # Create the shared scan layers before any rotors are run at once
+    scn_run_fs[0].create()
+    scn_save_fs[0].create()
+    execute_in_pool(
+        _scan_rotor, zip(run_tors_names, run_tors_grids),
+        res_lst=itertools.repeat(job_res),
+        nworkers=(njobs if update_guess else 1))
+
 
 def check_hr_pot(tors_pots, tors_zmas, tors_paths, emax=-0.5, emin=-10.0):
     """ Check hr pot to see if a new mimnimum is needed
@@ -15,7 +15,10 @@ import elstruct
 import autofile
 import autorun
 from phydat import phycon, symm
+from mechlib import sched
+from mechlib import filesys
 from mechlib.amech_io import printer as ioprinter
+from mechlib.amech_io import reader
 from mechlib.amech_io import job_path
 from mechroutines.es import runner as es_runner
 from mechroutines.es.runner._par import qchem_params
@@ -111,13 +114,15 @@ def run_energy(zma, geo, spc_info, thy_info,
             inf_obj, inp_str, out_str = ret
 
             ioprinter.info_message(" - Reading energy from output...")
-            ene = elstruct.reader.energy(inf_obj.prog, inf_obj.method, out_str)
+            ene = reader.es.cached(
+                elstruct.reader.energy, inf_obj.prog, inf_obj.method, out_str)
 
             ioprinter.energy(ene)
             sp_save_fs[-1].create(thy_info[1:4])
             sp_save_fs[-1].file.input.write(inp_str, thy_info[1:4])
             sp_save_fs[-1].file.info.write(inf_obj, thy_info[1:4])
             sp_save_fs[-1].file.energy.write(ene, thy_info[1:4])
+            filesys.index.save_energy(sp_save_fs, thy_info[1:4], ene)
             ioprinter.save_energy(sp_save_path)
 
     else:
@@ -190,7 +195,8 @@ def run_gradient(zma, geo, spc_info, thy_info,
                 else:
                     ioprinter.info_message(
                         " - Reading gradient from output...")
-                    grad = elstruct.reader.gradient(inf_obj.prog, out_str)
+                    grad = reader.es.cached(
+                        elstruct.reader.gradient, inf_obj.prog, out_str)
 
                     ioprinter.info_message(" - Saving gradient...")
                     if _json_database(geo_save_path):
@@ -203,6 +209,7 @@ def run_gradient(zma, geo, spc_info, thy_info,
                         geo_save_fs[-1].file.gradient_input.write(
                             inp_str, locs)
                         geo_save_fs[-1].file.gradient.write(grad, locs)
+                        filesys.arrays.save_gradient(geo_save_fs, locs, grad)
                     ioprinter.save_geo(geo_save_path)
 
         else:
@@ -248,7 +255,8 @@ def rerun_hessian_and_opt(
 
         if success:
             inf_obj, _, out_str = ret
-            tight_geo = elstruct.reader.opt_geometry(inf_obj.prog, out_str)
+            tight_geo = reader.es.cached(
+                elstruct.reader.opt_geometry, inf_obj.prog, out_str)
             save_conformer(
                 ret, geo_run_fs, geo_save_fs, locs,
                 thy_info,  orig_ich=spc_info[0],
@@ -343,7 +351,8 @@ def run_hessian(zma, geo, spc_info, thy_info,
 
                 # If requested, determine if there are too many frequencies
                 if correct_vals:
-                    hfrqs = elstruct.reader.harmonic_frequencies(
+                    hfrqs = reader.es.cached(
+                        elstruct.reader.harmonic_frequencies,
                         inf_obj.prog, out_str)
                     imags = tuple(x for x in hfrqs if x < 0.0)
                     nimags = len(imags)
@@ -356,7 +365,8 @@ def run_hessian(zma, geo, spc_info, thy_info,
                 # If requested, determine if there are frequencies below thrsh
                 correct_low_vals = False
                 if correct_low_vals:
-                    hfrqs = elstruct.reader.harmonic_frequencies(
+                    hfrqs = reader.es.cached(
+                        elstruct.reader.harmonic_frequencies,
                         inf_obj.prog, out_str)
                     reals = tuple(x for x in hfrqs if x > 0.0)
                     has_low_freqs = any(x for x in reals if x < 30.0)
@@ -399,7 +409,8 @@ def run_hessian(zma, geo, spc_info, thy_info,
                         imag_success = True
 
                     if imag_success:
-                        hess = elstruct.reader.hessian(inf_obj.prog, out_str)
+                        hess = reader.es.cached(
+                            elstruct.reader.hessian, inf_obj.prog, out_str)
 
                         ioprinter.info_message(" - Saving Hessian...")
                         if _json_database(geo_save_path):
@@ -416,6 +427,8 @@ def run_hessian(zma, geo, spc_info, thy_info,
                                 inp_str, locs)
                             geo_save_fs[-1].file.hessian.write(
                                 hess, locs)
+                            filesys.arrays.save_hessian(
+                                geo_save_fs, locs, hess)
                         ioprinter.info_message(
                             f" - Save path: {geo_save_path}")
 
@@ -512,7 +525,8 @@ def run_vpt2(zma, geo, spc_info, thy_info,
 
                 ioprinter.info_message(
                     " - Reading anharmonicities from output...")
-                vpt2_dct = elstruct.reader.vpt2(inf_obj.prog, out_str)
+                vpt2_dct = reader.es.cached(
+                    elstruct.reader.vpt2, inf_obj.prog, out_str)
 
                 ioprinter.save_anharmonicity(geo_save_path)
                 geo_save_fs[-1].file.vpt2_input.write(inp_str, locs)
@@ -593,9 +607,11 @@ def run_prop(zma, geo, spc_info, thy_info,
             inf_obj, _, out_str = ret
 
             ioprinter.info_message(" - Reading dipole moment from output...")
-            dmom = elstruct.reader.dipole_moment(inf_obj.prog, out_str)
+            dmom = reader.es.cached(
+                elstruct.reader.dipole_moment, inf_obj.prog, out_str)
             ioprinter.info_message(" - Reading polarizability from output...")
-            polar = elstruct.reader.polarizability(inf_obj.prog, out_str)
+            polar = reader.es.cached(
+                elstruct.reader.polarizability, inf_obj.prog, out_str)
 
             ioprinter.debug_message('dip mom', dmom)
             ioprinter.debug_message('polar', polar)
@@ -653,8 +669,9 @@ def _hess_freqs(geo, geo_save_fs, save_path, locs, run_prefix, overwrite):
         script_str = autorun.SCRIPT_DCT['projrot']
         fml_str = automol.geom.formula_string(geo)
         vib_path = job_path(run_prefix, 'PROJROT', 'FREQ', fml_str)
-        rt_freqs, _, rt_imags, _ = autorun.projrot.frequencies(
-            script_str, vib_path, [geo], [[]], [hess])
+        rt_freqs, _, rt_imags, _ = sched.run(
+            autorun.projrot.frequencies,
+            args=(script_str, vib_path, [geo], [[]], [hess]))
         rt_imags = tuple(-1 * imag_freq for imag_freq in rt_imags)
         freqs = sorted(rt_imags + rt_freqs)
         ioprinter.frequencies(freqs)
@@ -663,6 +680,7 @@ def _hess_freqs(geo, geo_save_fs, save_path, locs, run_prefix, overwrite):
             geo_save_fs[-1].json.harmonic_frequencies.write(freqs, locs)
         else:
             geo_save_fs[-1].file.harmonic_frequencies.write(freqs, locs)
+            filesys.index.save_frequencies(geo_save_fs, locs, freqs)
         ioprinter.save_frequencies(save_path)
 
     else:
@@ -695,7 +713,7 @@ def _hess_grad(prog, out_str, geo_save_fs,
         # Read the Gradient from the electronic structure output
         ioprinter.info_message(
             " - Attempting to read gradient from Hessian from output...")
-        grad = elstruct.reader.gradient(prog, out_str)
+        grad = reader.es.cached(elstruct.reader.gradient, prog, out_str)
 
         if grad is not None:
 
@@ -704,6 +722,7 @@ def _hess_grad(prog, out_str, geo_save_fs,
                 geo_save_fs[-1].json.gradient.write(grad, locs)
             else:
                 geo_save_fs[-1].file.gradient.write(grad, locs)
+                filesys.arrays.save_gradient(geo_save_fs, locs, grad)
             ioprinter.save_gradient(save_path)
 
         else:
@@ -752,6 +771,8 @@ def _assess_imags(freqs, ref_freqs,
         cnf_save_path = cnf_save_fs[-1].path(locs)
         shutil.rmtree(cnf_run_path)
         shutil.rmtree(cnf_save_path)
+        filesys.archive.remove(cnf_save_path)
+        filesys.index.remove(cnf_save_path)
         print('Based on checks, saddle-point conformer likely bad. '
               'Removing conformer from both RUN and SAVE filesystem at\n'
               f'{cnf_run_path}\n'
@@ -1,19 +1,29 @@
 """ es_runners
 """
 
+import itertools
 import numpy
 import automol
 import elstruct
 import autofile
 from phydat import phycon
 from mechlib import filesys
+from mechlib.amech_io import reader
 from mechlib.amech_io.printer import reading, info_message
 from mechlib.amech_io.printer import debug_message, warning_message
 from mechlib.amech_io.printer import save_geo, save_energy
+from mechlib.sched import execute_in_pool
 from mechroutines.es import runner as es_runner
 from mechroutines.es._routines import _util as util
 
 
+TAU_JOB_DCT = {
+    'energy': elstruct.Job.ENERGY,
+    'grad': elstruct.Job.GRADIENT,
+    'hess': elstruct.Job.HESSIAN,
+}
+
+
 def tau_sampling(zma, ref_ene, spc_info,
                  mod_thy_info,
                  tau_run_fs, tau_save_fs,
@@ -23,6 +33,7 @@ def tau_sampling(zma, ref_ene, spc_info,
                  tors_names=(),
                  repulsion_thresh=40.0,
                  zrxn=None, resave=False,
+                 njobs=1, job_res=(1, 0.0),
                  **kwargs):
     """ Sample over torsions optimizing all other coordinates
     """
@@ -47,6 +58,8 @@ def tau_sampling(zma, ref_ene, spc_info,
         tors_names=tors_names,
         repulsion_thresh=repulsion_thresh,
         zrxn=zrxn,
+        njobs=njobs,
+        job_res=job_res,
         **kwargs,
     )
 
@@ -54,7 +67,8 @@ def tau_sampling(zma, ref_ene, spc_info,
         tau_run_fs=tau_run_fs,
         tau_save_fs=tau_save_fs,
         mod_thy_info=mod_thy_info,
-        db_style=db_style
+        db_style=db_style,
+        locs_lst=unsaved_tau_locs(tau_run_fs, tau_save_fs, db_style)
     )
 
     info_message(
@@ -67,8 +81,12 @@ def run_tau(zma, spc_info, thy_info,
             nsamp_par=(False, 3, 3, 1, 50, 50),
             tors_names=(),
             repulsion_thresh=40.0,
-            zrxn=None, **kwargs):
+            zrxn=None, njobs=1, job_res=(1, 0.0), **kwargs):
     """ run sampling algorithm to find tau dependent geometries
+
+        Up to `njobs` optimizations are run at once, each in the RUN
+        directory of its own sample. The sample count in the info files
+        is only updated by this process as each sample finishes.
     """
 
     # Set the filesystem objects
@@ -93,69 +111,18 @@ def run_tau(zma, spc_info, thy_info,
         info_message(
             f'Running {num_to_samp} samples...', newline=1)
     samp_idx = 1
+    nrunning = 0
 
     # Set the filesystem objects
     inf_obj = autofile.schema.info_objects.tau_trunk(0, tors_range_dct)
 
-    while True:
-        nsamp = nsamp0 - nsampd
-
-        # Break the while loop if enough sampls completed
-        if nsamp <= 0:
-            info_message(
-                'Reached requested number of samples. ',
-                'Tau sampling complete.')
-            break
-
-        samp_zma, = automol.zmat.samples(zma, 1, tors_range_dct)
-        tid = autofile.schema.generate_new_tau_id()
-        locs = [tid]
-
-        tau_run_fs[-1].create(locs)
-        tau_run_prefix = tau_run_fs[-1].path(locs)
-        run_fs = autofile.fs.run(tau_run_prefix)
-
-        info_message(f"\nRun {samp_idx}/{num_to_samp}")
-        samp_idx += 1
-
-        info_message(
-            'Generating sample Z-Matrix that does not have',
-            'high intramolecular repulsion...')
-        ref_pot = automol.pot.intramol_interaction_potential_sum(
-            automol.zmat.geometry(zma))
-        samp_pot = automol.pot.intramol_interaction_potential_sum(
-            automol.zmat.geometry(samp_zma))
-        if samp_pot-ref_pot < repulsion_thresh:
-            debug_message('ZMA fine.')
-            es_runner.run_job(
-                job=elstruct.Job.OPTIMIZATION,
-                script_str=script_str,
-                run_fs=run_fs,
-                geo=samp_zma,
-                spc_info=spc_info,
-                thy_info=thy_info,
-                saddle=bool(zrxn is not None),
-                overwrite=overwrite,
-                frozen_coordinates=tors_range_dct.keys(),
-                **kwargs
-            )
-        else:
-            warning_message('repulsive ZMA:')
-            inp_str = elstruct.writer.optimization(
-                geo=samp_zma,
-                charge=spc_info[1],
-                mult=spc_info[2],
-                method=thy_info[1],
-                basis=thy_info[2],
-                prog=thy_info[0],
-                orb_type=thy_info[3],
-                mol_options=['nosym'],
-                frozen_coordinates=tors_range_dct.keys(),
-            )
-            tau_run_fs[-1].file.geometry_input.write(inp_str, locs)
-            warning_message(
-                'geometry for bad ZMA at', tau_run_fs[-1].path(locs))
+    ref_pot = automol.pot.intramol_interaction_potential_sum(
+        automol.zmat.geometry(zma))
 
+    def _record_sample():
+        """ Add a finished sample to the count in the info files
+        """
+        nonlocal nsampd
         if tau_save_fs[0].file.info.exists():
             inf_obj_s = tau_save_fs[0].file.info.read()
             nsampd = inf_obj_s.nsamp
@@ -167,24 +134,175 @@ def run_tau(zma, spc_info, thy_info,
         tau_save_fs[0].file.info.write(inf_obj)
         tau_run_fs[0].file.info.write(inf_obj)
 
+    def _sample_jobs():
+        """ Generate samples until enough are finished or running
+        """
+        nonlocal samp_idx, nrunning
+        while True:
+            nsamp = nsamp0 - nsampd - nrunning
+
+            # Stop generating samples if enough are completed or running
+            if nsamp <= 0:
+                if nrunning > 0:
+                    yield None
+                    continue
+                info_message(
+                    'Reached requested number of samples. ',
+                    'Tau sampling complete.')
+                return
+
+            samp_zma, = automol.zmat.samples(zma, 1, tors_range_dct)
+            tid = autofile.schema.generate_new_tau_id()
+            locs = [tid]
+
+            tau_run_fs[-1].create(locs)
+            tau_run_prefix = tau_run_fs[-1].path(locs)
+            run_fs = autofile.fs.run(tau_run_prefix)
+
+            info_message(f"\nRun {samp_idx}/{num_to_samp}")
+            samp_idx += 1
+
+            info_message(
+                'Generating sample Z-Matrix that does not have',
+                'high intramolecular repulsion...')
+            samp_pot = automol.pot.intramol_interaction_potential_sum(
+                automol.zmat.geometry(samp_zma))
+            if samp_pot-ref_pot < repulsion_thresh:
+                debug_message('ZMA fine.')
+                nrunning += 1
+                yield (samp_zma, run_fs)
+            else:
+                warning_message('repulsive ZMA:')
+                inp_str = elstruct.writer.optimization(
+                    geo=samp_zma,
+                    charge=spc_info[1],
+                    mult=spc_info[2],
+                    method=thy_info[1],
+                    basis=thy_info[2],
+                    prog=thy_info[0],
+                    orb_type=thy_info[3],
+                    mol_options=['nosym'],
+                    frozen_coordinates=tors_range_dct.keys(),
+                )
+                tau_run_fs[-1].file.geometry_input.write(inp_str, locs)
+                warning_message(
+                    'geometry for bad ZMA at', tau_run_fs[-1].path(locs))
+                _record_sample()
+
+    def _run_sample(samp_zma, run_fs):
+        """ Optimize a sample in its RUN directory
+        """
+        es_runner.run_job(
+            job=elstruct.Job.OPTIMIZATION,
+            script_str=script_str,
+            run_fs=run_fs,
+            geo=samp_zma,
+            spc_info=spc_info,
+            thy_info=thy_info,
+            saddle=bool(zrxn is not None),
+            overwrite=overwrite,
+            frozen_coordinates=tors_range_dct.keys(),
+            **kwargs
+        )
+
+    def _finish_sample(_, __):
+        """ Count a sample once its optimization has finished
+        """
+        nonlocal nrunning
+        nrunning -= 1
+        _record_sample()
+
+    execute_in_pool(
+        _run_sample, _sample_jobs(),
+        res_lst=itertools.repeat(job_res),
+        nworkers=njobs,
+        callback=_finish_sample)
+
+
+def run_tau_jobs(job, tau_run_fs, locs_lst, geo_lst,
+                 spc_info, thy_info, script_str,
+                 retryfail=True, njobs=1, job_res=(1, 0.0), **kwargs):
+    """ Run the energy, gradient, or Hessian jobs for several tau samples
+        at once, leaving each output in the RUN directory of its sample.
+
+        The routines that save the results then find the finished jobs
+        in the RUN filesystem and only need to read them, so only the
+        electronic structure jobs are run concurrently. Nothing is done
+        if only one job is requested at a time.
+
+        :param job: tau task to run: energy, grad, hess
+        :type job: str
+        :param locs_lst: locators of the samples to run the job for
+        :type locs_lst: tuple(tuple(str))
+        :param geo_lst: geometries of the samples
+        :type geo_lst: tuple(automol.geom object)
+        :param njobs: number of jobs to run at once
+        :type njobs: int
+        :param job_res: (nprocs, mem) requested by each job
+        :type job_res: (int, float)
+    """
+
+    if njobs <= 1 or not locs_lst:
+        return
+
+    def _run_fs(locs):
+        """ Build the RUN filesystem the save routine reads the job from
+        """
+        run_path = tau_run_fs[-1].path(locs)
+        if job == 'energy':
+            sp_run_fs = autofile.fs.single_point(run_path)
+            sp_run_fs[-1].create(thy_info[1:4])
+            run_path = sp_run_fs[-1].path(thy_info[1:4])
+        return autofile.fs.run(run_path)
+
+    def _run_tau_job(locs, geo):
+        """ Run the job for a single sample
+        """
+        es_runner.run_job(
+            job=TAU_JOB_DCT[job],
+            script_str=script_str,
+            run_fs=_run_fs(locs),
+            geo=geo,
+            spc_info=spc_info,
+            thy_info=thy_info,
+            retryfail=retryfail,
+            **kwargs
+        )
+
+    for locs in locs_lst:
+        tau_run_fs[-1].create(locs)
+
+    info_message(
+        f'Running {len(locs_lst)} tau {job} jobs, {njobs} at a time...',
+        newline=1)
+    execute_in_pool(
+        _run_tau_job, zip(locs_lst, geo_lst),
+        res_lst=itertools.repeat(job_res),
+        nworkers=njobs)
+
 
-def save_tau(tau_run_fs, tau_save_fs, mod_thy_info, db_style='directory'):
+def save_tau(tau_run_fs, tau_save_fs, mod_thy_info, db_style='directory',
+             locs_lst=None):
     """ save the tau dependent geometries that have been found so far
+
+        Only the samples in `locs_lst` are read from the RUN filesystem;
+        if it is not given, every sample in the RUN filesystem is read.
+        For the JSON database, all of the new samples are written in a
+        single pass at the end.
+
+        :param locs_lst: locators of the samples to save
+        :type locs_lst: tuple(tuple(str))
     """
 
-    if db_style == 'jsondb':
-        saved_locs = tau_save_fs[-1].json_existing()
-        saved_geos = tau_save_fs[-1].json.geometry.read_all(saved_locs)
-    elif db_style == 'directory':
-        saved_geos = [tau_save_fs[-1].file.geometry.read(locs)
-                      for locs in tau_save_fs[-1].existing()]
     if not tau_run_fs[0].exists():
         info_message("No tau geometries to save. Skipping...")
     else:
+        if locs_lst is None:
+            locs_lst = tau_run_fs[-1].existing()
         if db_style == 'jsondb':
             save_info = [[], [], [], [], []]
             sp_save_info = [[], [], [], [], []]
-        for locs in tau_run_fs[-1].existing():
+        for locs in locs_lst:
             run_path = tau_run_fs[-1].path(locs)
             run_fs = autofile.fs.run(run_path)
             save_path = tau_save_fs[-1].root.path()
@@ -197,9 +315,11 @@ def save_tau(tau_run_fs, tau_save_fs, mod_thy_info, db_style='directory'):
                 inf_obj, inp_str, out_str = ret
                 prog = inf_obj.prog
                 method = inf_obj.method
-                ene = elstruct.reader.energy(prog, method, out_str)
+                ene = reader.es.cached(
+                    elstruct.reader.energy, prog, method, out_str)
 
-                geo = elstruct.reader.opt_geometry(prog, out_str)
+                geo = reader.es.cached(
+                    elstruct.reader.opt_geometry, prog, out_str)
                 if db_style == 'directory':
                     save_geo(save_path)
                     tau_save_fs[-1].create(locs)
@@ -232,14 +352,9 @@ def save_tau(tau_run_fs, tau_save_fs, mod_thy_info, db_style='directory'):
                     sp_save_info[2].append(inp_str)
                     sp_save_info[3].append(inf_obj)
                     sp_save_info[4].append(ene)
-                    sp_save_fs[-1].json.input.write(inp_str, mod_thy_info[1:4])
-                    sp_save_fs[-1].json.info.write(inf_obj, mod_thy_info[1:4])
-                    sp_save_fs[-1].json.energy.write(ene, mod_thy_info[1:4])
-
-                saved_geos.append(geo)
 
-        print('\nWriting the geometries and energies into JSON file...')
-        if db_style == 'jsondb':
+        if db_style == 'jsondb' and save_info[0]:
+            print('\nWriting the geometries and energies into JSON file...')
             tau_save_fs[-1].json_create()
             tau_save_fs[-1].json.geometry_info.write_all(
                 save_info[1], save_info[0])
@@ -262,6 +377,26 @@ def save_tau(tau_run_fs, tau_save_fs, mod_thy_info, db_style='directory'):
         filesys.mincnf.traj_sort(tau_save_fs, mod_thy_info)
 
 
+def unsaved_tau_locs(tau_run_fs, tau_save_fs, db_style='directory'):
+    """ Get the locators of the samples in the RUN filesystem that
+        have not yet been saved
+
+        :rtype: tuple(tuple(str))
+    """
+
+    if not tau_run_fs[0].exists():
+        return ()
+
+    if db_style == 'jsondb':
+        saved_locs = tau_save_fs[-1].json_existing()
+    else:
+        saved_locs = tau_save_fs[-1].existing()
+    saved_locs = set(tuple(locs) for locs in saved_locs)
+
+    return tuple(locs for locs in tau_run_fs[-1].existing()
+                 if tuple(locs) not in saved_locs)
+
+
 def assess_pf_convergence(tau_save_fs, ref_ene,
                           temps=(300., 500., 750., 1000., 1500.)):
     """ Determine how much the partition function has converged
@@ -4,6 +4,7 @@
 
 import elstruct
 from mechlib.amech_io import printer as ioprinter
+from mechlib.amech_io import reader
 from mechroutines.es.runner._run import execute_job
 
 
@@ -62,7 +63,8 @@ def multi_stage_optimization(script_str, run_fs,
 
         if success:
             inf_obj, _, out_str = ret
-            geo = elstruct.reader.opt_zmatrix(inf_obj.prog, out_str)
+            geo = reader.es.cached(
+                elstruct.reader.opt_zmatrix, inf_obj.prog, out_str)
             if idx+1 != len(frozen_coords_lst):
                 print('- Success. Moving to next stage...\n')
             else:
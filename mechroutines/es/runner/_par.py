@@ -19,6 +19,9 @@ def qchem_params(method_dct, job=None, geo=None, spc_info=None):
     """ Build the kwargs dictionary and BASH submission script string to
         be used to write and run the electronic structure job.
 
+        The kwargs include the (nprocs, mem) of the job (`res`), which the
+        runner requests from the job queue.
+
         :param method_dct:
         :type method_dct: dict[str: obj]
         :param job: elstronic structure calculation
@@ -29,15 +32,44 @@ def qchem_params(method_dct, job=None, geo=None, spc_info=None):
     prog = method_dct.get('program', None)
 
     # Build the defaul values
-    ret = INI_PARAM_BUILD_DCT[prog](
+    script_str, kwargs = INI_PARAM_BUILD_DCT[prog](
         method_dct, prog,
         job=job, geo=geo, spc_info=spc_info)
+    kwargs['res'] = job_resources(method_dct)
 
     # Alter with the input method_dct (a massive pain...)
     # opt_kwargs.update(method_dct)
     # kwargs.update(method_dct)
 
-    return ret
+    return script_str, kwargs
+
+
+def job_resources(method_dct):
+    """ Determine the number of processors and the memory (in GB) that
+        an electronic structure job run with the given method will request.
+
+        Values set for the level in theory.dat are used if present,
+        otherwise the defaults of the program are used.
+
+        :param method_dct:
+        :type method_dct: dict[str: obj]
+        :rtype: (int, float)
+    """
+
+    prog = method_dct.get('program', None)
+    method = method_dct.get('method', None)
+
+    nprocs, memory = RESOURCE_DEFAULT_DCT.get(prog, (1, 1))
+    if (prog in MOLPRO_PROGS and method in ('caspt2', 'caspt2c', 'caspt2i')
+            and 'mem' in method_dct):
+        memory = 10
+
+    if method_dct.get('nprocs') is not None:
+        nprocs = method_dct['nprocs']
+    if method_dct.get('mem') is not None:
+        memory = method_dct['mem']
+
+    return nprocs, memory
 
 
 def _gaussian(method_dct, prog, job=None, geo=None, spc_info=None):
@@ -53,10 +85,7 @@ def _gaussian(method_dct, prog, job=None, geo=None, spc_info=None):
     _, _ = geo, spc_info
 
     # Set the options
-    nprocs = method_dct.get('nprocs', 9)
-    memory = method_dct.get('mem', 20)
-    nprocs = nprocs if nprocs is not None else 9
-    memory = memory if memory is not None else 20
+    nprocs, memory = job_resources(method_dct)
 
     method = method_dct.get('method')
 
@@ -141,24 +170,11 @@ def _molpro(method_dct, prog, job=None, geo=None, spc_info=None):
 
     # Pull stuff from the method_dct
     method = method_dct.get('method')
-    if method in ('caspt2', 'caspt2c', 'caspt2i'):
-        nprocs = method_dct.get('nprocs', 4)
-        memory = method_dct.get('mem', 20)
-        econv = method_dct.get('econv', 1.0e-6)
-        gconv = method_dct.get('gconv', 3.0e-4)
-        nprocs = nprocs if nprocs is not None else 4
-        memory = memory if memory is not None else 10
-        econv = econv if econv is not None else 1.0e-6
-        gconv = gconv if gconv is not None else 3.0e-4
-    else:
-        nprocs = method_dct.get('nprocs', 4)
-        memory = method_dct.get('mem', 20)
-        econv = method_dct.get('econv', 1.0e-6)
-        gconv = method_dct.get('gconv', 3.0e-4)
-        nprocs = nprocs if nprocs is not None else 4
-        memory = memory if memory is not None else 20
-        econv = econv if econv is not None else 1.0e-6
-        gconv = gconv if gconv is not None else 3.0e-4
+    nprocs, memory = job_resources(method_dct)
+    econv = method_dct.get('econv', 1.0e-6)
+    gconv = method_dct.get('gconv', 3.0e-4)
+    econv = econv if econv is not None else 1.0e-6
+    gconv = gconv if gconv is not None else 3.0e-4
 
     scf_econv_line = f'energy={econv:.1E}'.replace('E', 'd')
     corr_econv_line = f'energy={econv:.1E}'.replace('E', 'd')
@@ -252,10 +268,7 @@ def _psi4(method_dct, prog, job=None, geo=None, spc_info=None):
 
     # Job unneeded for now
     method = method_dct.get('method')
-    nprocs = method_dct.get('nprocs', 8)
-    memory = method_dct.get('mem', 10)
-    nprocs = nprocs if nprocs is not None else 8
-    memory = memory if memory is not None else 10
+    _, memory = job_resources(method_dct)
 
     # Build the submission script string
     script_str = SCRIPT_DCT[prog]
@@ -305,10 +318,7 @@ def _qchem(method_dct, prog, job=None, geo=None, spc_info=None):
     _, _ = geo, spc_info
 
     # Set the options
-    nprocs = method_dct.get('nprocs', 8)
-    memory = method_dct.get('mem', 20)
-    nprocs = nprocs if nprocs is not None else 8
-    memory = memory if memory is not None else 20
+    nprocs, memory = job_resources(method_dct)
 
     method = method_dct.get('method')
 
@@ -322,6 +332,21 @@ def _qchem(method_dct, prog, job=None, geo=None, spc_info=None):
     return script_str, kwargs
 
 
+MOLPRO_PROGS = (
+    elstruct.par.Program.MOLPRO2021,
+    elstruct.par.Program.MOLPRO2015,
+)
+
+# Default (nprocs, mem) for each program if not set in theory.dat
+RESOURCE_DEFAULT_DCT = {
+    elstruct.par.Program.GAUSSIAN09: (9, 20),
+    elstruct.par.Program.GAUSSIAN16: (9, 20),
+    elstruct.par.Program.MOLPRO2021: (4, 20),
+    elstruct.par.Program.MOLPRO2015: (4, 20),
+    elstruct.par.Program.PSI4: (8, 10),
+    elstruct.par.Program.QCHEM5: (8, 20),
+}
+
 INI_PARAM_BUILD_DCT = {
     elstruct.par.Program.GAUSSIAN09: _gaussian,
     elstruct.par.Program.GAUSSIAN16: _gaussian,
@@ -1,10 +1,13 @@
 """ Centralized job runners and readers for electronic structure calcualtions
 """
 
+import os
 import functools
 import elstruct
 import autofile
 import automol
+from mechlib.amech_io import reader
+from mechlib.filesys import pending
 from . import _seq as optseq
 
 
@@ -34,6 +37,14 @@ JOB_SUCCESS_DCT = {
     elstruct.Job.IRCR: elstruct.Success.IRC_CONV,
 }
 
+# Marker left in the directory of a job while it is being run
+OWNER_NAME = 'run.owner'
+
+# Age (s) after which a job marked as running, but with no marker, is
+# taken to have been left by a process that stopped; the same age after
+# which the conformer routines stop waiting on running jobs
+MAX_UNMARKED_AGE = 3000000.
+
 JOB_RUNNER_DCT = {
     elstruct.Job.ENERGY: functools.partial(
         optseq.options_matrix_run, elstruct.writer.energy),
@@ -94,6 +105,10 @@ def run_job(job, script_str, run_fs,
         Will first look into the RUN filesys and will either rewrite the
         input and rerun the job if requested.
 
+        A job found as running is run again, resuming where it stopped if
+        the runner can, if it was left by a process that is no longer
+        running (see `_stale_running_job`).
+
         :param geo: input molecular geometry or Z-Matrix
         :type geo:
         :param errors: list of error message types to search output for
@@ -142,58 +157,101 @@ def run_job(job, script_str, run_fs,
                 do_run = False
                 if inf_obj.status == autofile.schema.RunStatus.SUCCESS:
                     print(f" - Found completed {job} job at {run_path}")
+                elif _stale_running_job(run_path, inf_obj):
+                    print(f" - Found interrupted {job} job at {run_path}")
+                    print(" - Resuming...")
+                    do_run = True
                 else:
                     print(f" - Found running {job} job at {run_path}")
                     print(" - Skipping...")
 
     if do_run:
-        # Create the run directory
-        status = autofile.schema.RunStatus.RUNNING
-        prog = thy_info[0]
-        method = thy_info[1]
-        basis = thy_info[2]
-        inf_obj = autofile.schema.info_objects.run(
-            job=job, prog=prog, version='',
-            method=method, basis=basis, status=status)
-        inf_obj.utc_start_time = autofile.schema.utc_time()
-        run_fs[-1].file.info.write(inf_obj, [job])
-
-        # Write the initial geo/zma
-        _write_input_geo(geo, job, run_fs)
-
-        # Set job runner based on user request; set special options as needed
-        runner = JOB_RUNNER_DCT[job]
-
-        if job == elstruct.Job.OPTIMIZATION:
-            runner = functools.partial(
-                runner, feedback=feedback,
-                frozen_coordinates=frozen_coordinates,
-                freeze_dummy_atoms=freeze_dummy_atoms)
-        inp_str, out_str = runner(
-            script_str, run_path, geo=geo, chg=spc_info[1],
-            mul=spc_info[2], method=thy_info[1], basis=thy_info[2],
-            orb_type=thy_info[3], prog=thy_info[0], zrxn=zrxn,
-            errors=errors, options_mat=options_mat, **kwargs
-        )
-
-        inf_obj.utc_end_time = autofile.schema.utc_time()
-        prog = inf_obj.prog
-        if is_successful_output(out_str, job, prog):
-            run_fs[-1].file.output.write(out_str, [job])
-            print(" - Run succeeded.")
-            status = autofile.schema.RunStatus.SUCCESS
-        else:
-            # Added writing output at point even for fail
-            # Need to check if this is bad. But read_job changes
-            # should address this hopefully
-            run_fs[-1].file.output.write(out_str, [job])
-            print(" - Run failed.")
-            status = autofile.schema.RunStatus.FAILURE
-        version = elstruct.reader.program_version(prog, out_str)
-        inf_obj.version = version
-        inf_obj.status = status
-        run_fs[-1].file.info.write(inf_obj, [job])
-        run_fs[-1].file.input.write(inp_str, [job])
+        with pending.writer_marker(os.path.join(run_path, OWNER_NAME)):
+            _run(job, script_str, run_fs, geo, spc_info, thy_info,
+                 zrxn=zrxn, errors=errors, options_mat=options_mat,
+                 feedback=feedback, frozen_coordinates=frozen_coordinates,
+                 freeze_dummy_atoms=freeze_dummy_atoms, **kwargs)
+
+
+def _run(job, script_str, run_fs, geo, spc_info, thy_info,
+         zrxn=None, errors=(), options_mat=(), feedback=False,
+         frozen_coordinates=(), freeze_dummy_atoms=True, **kwargs):
+    """ Run a job, for `run_job`
+    """
+
+    run_path = run_fs[-1].path([job])
+
+    # Create the run directory
+    status = autofile.schema.RunStatus.RUNNING
+    prog = thy_info[0]
+    method = thy_info[1]
+    basis = thy_info[2]
+    inf_obj = autofile.schema.info_objects.run(
+        job=job, prog=prog, version='',
+        method=method, basis=basis, status=status)
+    inf_obj.utc_start_time = autofile.schema.utc_time()
+    run_fs[-1].file.info.write(inf_obj, [job])
+
+    # Write the initial geo/zma
+    _write_input_geo(geo, job, run_fs)
+
+    # Set job runner based on user request; set special options as needed
+    runner = JOB_RUNNER_DCT[job]
+
+    if job == elstruct.Job.OPTIMIZATION:
+        runner = functools.partial(
+            runner, feedback=feedback,
+            frozen_coordinates=frozen_coordinates,
+            freeze_dummy_atoms=freeze_dummy_atoms)
+    inp_str, out_str = runner(
+        script_str, run_path, geo=geo, chg=spc_info[1],
+        mul=spc_info[2], method=thy_info[1], basis=thy_info[2],
+        orb_type=thy_info[3], prog=thy_info[0], zrxn=zrxn,
+        errors=errors, options_mat=options_mat, **kwargs
+    )
+
+    inf_obj.utc_end_time = autofile.schema.utc_time()
+    prog = inf_obj.prog
+    if is_successful_output(out_str, job, prog):
+        run_fs[-1].file.output.write(out_str, [job])
+        print(" - Run succeeded.")
+        status = autofile.schema.RunStatus.SUCCESS
+    else:
+        # Added writing output at point even for fail
+        # Need to check if this is bad. But read_job changes
+        # should address this hopefully
+        run_fs[-1].file.output.write(out_str, [job])
+        print(" - Run failed.")
+        status = autofile.schema.RunStatus.FAILURE
+    version = reader.es.cached(
+        elstruct.reader.program_version, prog, out_str)
+    inf_obj.version = version
+    inf_obj.status = status
+    run_fs[-1].file.info.write(inf_obj, [job])
+    run_fs[-1].file.input.write(inp_str, [job])
+
+
+def _stale_running_job(run_path, inf_obj):
+    """ Check if a job marked as running was left by a process that has
+        stopped, i.e., if the process named in its marker is gone, or, for
+        a job with no marker (e.g., one run by an older version of
+        MechDriver that may still be running it), if it was started more
+        than `MAX_UNMARKED_AGE` ago. Jobs marked by processes on other
+        hosts are taken to be running; `overwrite` reruns any job.
+    """
+
+    marker = os.path.join(run_path, OWNER_NAME)
+    if os.path.exists(marker):
+        stale = not pending.writer_running(marker)
+    else:
+        try:
+            age = (autofile.schema.utc_time() -
+                   inf_obj.utc_start_time).total_seconds()
+            stale = age > MAX_UNMARKED_AGE
+        except (AttributeError, TypeError):
+            stale = False
+
+    return stale
 
 
 def read_job(job, run_fs):
@@ -220,6 +278,9 @@ def read_job(job, run_fs):
         prog = inf_obj.prog
         ret = (inf_obj, inp_str, out_str)
 
+        # Reuse any values already parsed from this output
+        reader.es.register(out_str, run_fs[-1].path([job]))
+
         success = bool(is_successful_output(out_str, job, prog))
         if success:
             print(" - Reading successful output...")
@@ -258,9 +319,12 @@ def is_successful_output(out_str, job, prog):
     success = JOB_SUCCESS_DCT[job]
 
     ret = False
-    if elstruct.reader.has_normal_exit_message(prog, out_str):
+    normal_exit = reader.es.cached(
+        elstruct.reader.has_normal_exit_message, prog, out_str)
+    if normal_exit:
         for error in errors:
-            conv = elstruct.reader.check_convergence_messages(
+            conv = reader.es.cached(
+                elstruct.reader.check_convergence_messages,
                 prog, error, success, out_str)
         if conv:
             ret = True
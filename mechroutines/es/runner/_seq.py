@@ -12,12 +12,20 @@ note: options (`opts_dct`) are a subset of keyword arguments (`kwargs_dct`)
     to elstruct package functions to write electronic structure input files.
 """
 
+import os
 import itertools
 import warnings
 from collections.abc import Sequence as _Sequence
 import automol
 import elstruct
 import autofile
+from phydat import ptab
+from mechlib import sched
+
+
+# Names of the files elstruct.run.direct writes in each subrun directory
+SUBRUN_INPUT_NAME = 'run.inp'
+SUBRUN_OUTPUT_NAME = 'run.out'
 
 
 # FUNCTIONS FOR HANDLING THE SEQUENCE OF OPTIONS
@@ -27,9 +35,13 @@ def options_matrix_optimization(script_str, prefix,
                                 errors=(), options_mat=(), feedback=False,
                                 frozen_coordinates=(),
                                 freeze_dummy_atoms=True,
+                                res=None,
                                 **kwargs):
     """ try several sets of options to generate an output file
 
+        If the last sequence of runs in `prefix` was started for the same
+        input but interrupted, it is resumed rather than started over.
+
         :param script_str: BASH submission script for electronic structure job
         :type script_str: str
         :param prefix:
@@ -56,6 +68,8 @@ def options_matrix_optimization(script_str, prefix,
         :type frozen_coordinates: tuple(str)
         :param freeze_dummy_atoms: freeze any coords defined by dummy atoms
         :type freeze_dummy_atoms: bool
+        :param res: (nprocs, mem) the job requests from the job queue
+        :type res: (int, float)
         :param kwargs:
         :type:
         :returns: the input string and the output string
@@ -76,18 +90,54 @@ def options_matrix_optimization(script_str, prefix,
 
     kwargs_ = dict(kwargs)
 
+    # Resume the last sequence of runs if it was interrupted: the steps
+    # that finished are read back in the same order to recover the options
+    # and geometry, and the interrupted step restarts from its last geometry
+    resume_micro_idx = _interrupted_micro_idx(
+        subrun_fs, max_macro_idx, prog, errors)
+    if resume_micro_idx is not None:
+        first_inp_str, _ = _subrun_strs(
+            subrun_fs[-1].path([max_macro_idx, 0]))
+        ini_inp_str = elstruct.writer.optimization(
+            geo=geo, charge=chg, mult=mul, method=method,
+            basis=basis, prog=prog, frozen_coordinates=frozen_coordinates,
+            **kwargs_)
+        if first_inp_str == ini_inp_str:
+            macro_idx = max_macro_idx
+            print(f' - Resuming interrupted run sequence at step '
+                  f'{resume_micro_idx} in {prefix}')
+        else:
+            resume_micro_idx = None
+
     # Initialize loop geo
     step_geo = geo
     while True:
         subrun_fs[-1].create([macro_idx, micro_idx])
         path = subrun_fs[-1].path([macro_idx, micro_idx])
-        with warnings.catch_warnings():
-            warnings.simplefilter('ignore')
-            inp_str, out_str = elstruct.run.direct(
-                elstruct.writer.optimization, script_str, path,
-                geo=step_geo, charge=chg, mult=mul, method=method,
-                basis=basis, prog=prog, frozen_coordinates=frozen_coordinates,
-                **kwargs_)
+        resuming = (resume_micro_idx is not None and
+                    macro_idx == max_macro_idx)
+        if resuming and micro_idx < resume_micro_idx:
+            print(f'  - Reading finished step at {path}')
+            inp_str, out_str = _subrun_strs(path)
+        else:
+            if resuming and micro_idx == resume_micro_idx:
+                _, last_out_str = _subrun_strs(path)
+                last_geo = _last_geometry(prog, last_out_str)
+                if last_geo is not None:
+                    print('  - Restarting from the last geometry '
+                          'of the interrupted step')
+                    step_geo = _step_geometry(last_geo, step_geo, zrxn)
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                inp_str, out_str = sched.run(
+                    elstruct.run.direct,
+                    args=(elstruct.writer.optimization, script_str, path),
+                    kwargs=dict(
+                        geo=step_geo, charge=chg, mult=mul, method=method,
+                        basis=basis, prog=prog,
+                        frozen_coordinates=frozen_coordinates,
+                        **kwargs_),
+                    res=res)
 
         # List any errors found in the output
         errs_found = [err for err in errors
@@ -137,19 +187,8 @@ def options_matrix_optimization(script_str, prefix,
                 # Try and get ZMA, then geo
                 # if neither present use geo from prev. step (for weird errs)
                 geo = elstruct.reader.opt_geometry(prog, out_str)
-                if automol.zmat.is_valid(step_geo):
-                    if zrxn is not None:
-                        grxn = automol.reac.relabel_for_geometry(zrxn)
-                        gra = grxn.forward_ts_graph
-                    else:
-                        gra = None
-                    dum_key_dct = automol.zmat.dummy_key_dictionary(step_geo)
-                    geo_wdum = automol.geom.insert_dummies(
-                        geo, dum_key_dct,
-                        gra=gra)
-                    geo = automol.zmat.from_geometry(step_geo, geo_wdum)
                 if geo is not None:
-                    step_geo = geo
+                    step_geo = _step_geometry(geo, step_geo, zrxn)
         else:
             # failure
             print("\n - Robust run sequence has failed ")
@@ -162,6 +201,7 @@ def options_matrix_run(input_writer, script_str, prefix,
                        geo, chg, mul, method, basis, prog,
                        zrxn=None,
                        errors=(), options_mat=(),
+                       res=None,
                        **kwargs):
     """ try several sets of options to generate an output file
 
@@ -185,6 +225,8 @@ def options_matrix_run(input_writer, script_str, prefix,
         :type errors: tuple(str)
         :param options_mat: varopis options to run job with
         :type options_mat: tuple(dict[str: str])
+        :param res: (nprocs, mem) the job requests from the job queue
+        :type res: (int, float)
 
     :returns: the input string and the output string
     :rtype: (str, str)
@@ -205,10 +247,13 @@ def options_matrix_run(input_writer, script_str, prefix,
         path = subrun_fs[-1].path([macro_idx, micro_idx])
         with warnings.catch_warnings():
             warnings.simplefilter('ignore')
-            inp_str, out_str = elstruct.run.direct(
-                input_writer, script_str, path,
-                geo=geo, charge=chg, mult=mul, method=method,
-                basis=basis, prog=prog, **kwargs_)
+            inp_str, out_str = sched.run(
+                elstruct.run.direct,
+                args=(input_writer, script_str, path),
+                kwargs=dict(
+                    geo=geo, charge=chg, mult=mul, method=method,
+                    basis=basis, prog=prog, **kwargs_),
+                res=res)
 
         # List any errors found in the output
         errs_found = [err for err in errors
@@ -233,6 +278,126 @@ def options_matrix_run(input_writer, script_str, prefix,
     return inp_str, out_str
 
 
+# FUNCTIONS FOR RESUMING AN INTERRUPTED SEQUENCE
+def _interrupted_micro_idx(subrun_fs, macro_idx, prog, errors):
+    """ Find the step of a sequence of runs that was interrupted before
+        it finished, i.e., its output is missing or ends with neither
+        a normal exit nor one of the errors the sequence handles.
+
+        :rtype: int or None
+    """
+
+    micro_idxs = [locs[1] for locs in subrun_fs[-1].existing()
+                  if locs[0] == macro_idx]
+
+    micro_idx = None
+    if micro_idxs:
+        last_micro_idx = max(micro_idxs)
+        _, out_str = _subrun_strs(
+            subrun_fs[-1].path([macro_idx, last_micro_idx]))
+        if out_str is None:
+            micro_idx = last_micro_idx
+        else:
+            all_errors = tuple(errors) + (elstruct.Error.MCSCF_NOCONV,
+                                          elstruct.Error.LIN_DEP_BASIS)
+            finished = (
+                elstruct.reader.has_normal_exit_message(prog, out_str) or
+                any(elstruct.reader.has_error_message(prog, err, out_str)
+                    for err in all_errors))
+            if not finished:
+                micro_idx = last_micro_idx
+
+    return micro_idx
+
+
+def _subrun_strs(path):
+    """ Read the input and output strings that elstruct.run.direct
+        wrote into a subrun directory, if they exist
+    """
+
+    strs = []
+    for name in (SUBRUN_INPUT_NAME, SUBRUN_OUTPUT_NAME):
+        file_path = os.path.join(path, name)
+        if os.path.exists(file_path):
+            with open(file_path, encoding='utf-8') as fobj:
+                strs.append(fobj.read())
+        else:
+            strs.append(None)
+
+    return tuple(strs)
+
+
+def _last_geometry(prog, out_str):
+    """ Read the last geometry printed in the output of an optimization,
+        which may not have finished
+
+        :rtype: automol.geom object or None
+    """
+
+    geo = None
+    if out_str:
+        try:
+            geo = elstruct.reader.opt_geometry(prog, out_str)
+        except (AttributeError, IndexError, TypeError, ValueError):
+            geo = None
+        if geo is None and prog in ('gaussian09', 'gaussian16'):
+            geo = _last_gaussian_geometry(out_str)
+
+    return geo
+
+
+def _last_gaussian_geometry(out_str):
+    """ Read the last orientation table in a Gaussian output; None if it
+        has none, or if the last one was cut off
+
+        :rtype: automol.geom object or None
+    """
+
+    geo = None
+    blocks = out_str.split('orientation:')
+    if len(blocks) > 1:
+        # Table rows sit between the second and third dashed lines
+        lines = blocks[-1].splitlines()
+        dash_idxs = [idx for idx, line in enumerate(lines)
+                     if line.strip().startswith('-----')]
+        if len(dash_idxs) >= 3:
+            symbs, xyzs = [], []
+            try:
+                for line in lines[dash_idxs[1]+1:dash_idxs[2]]:
+                    vals = line.split()
+                    symbs.append(ptab.to_symbol(int(vals[1])))
+                    xyz = tuple(map(float, vals[3:6]))
+                    if len(xyz) != 3:
+                        raise IndexError(f'Incomplete row: {line}')
+                    xyzs.append(xyz)
+            except (IndexError, KeyError, ValueError):
+                symbs = []
+            if symbs:
+                geo = automol.geom.from_data(symbs, xyzs, angstrom=True)
+
+    return geo
+
+
+def _step_geometry(geo, step_geo, zrxn=None):
+    """ Set the geometry for the next step of a sequence from a geometry
+        read from an output, as a Z-Matrix if the step uses one
+    """
+
+    if automol.zmat.is_valid(step_geo):
+        if zrxn is not None:
+            grxn = automol.reac.relabel_for_geometry(zrxn)
+            gra = grxn.forward_ts_graph
+        else:
+            gra = None
+        dum_key_dct = automol.zmat.dummy_key_dictionary(step_geo)
+        geo_wdum = automol.geom.insert_dummies(
+            geo, dum_key_dct,
+            gra=gra)
+        geo = automol.zmat.from_geometry(step_geo, geo_wdum)
+
+    return geo
+
+
 # OPTIONS MATRIX IMPLEMENTATION
 def is_exhausted(opts_mat):
     """ Assess if the options matrix has no remaining option
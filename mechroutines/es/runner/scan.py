@@ -3,6 +3,7 @@
     SCAN or CSAN layers of the save filesystem.
 """
 
+import itertools
 import numpy
 
 import automol
@@ -11,6 +12,7 @@ import elstruct
 from phydat import phycon
 from mechlib import filesys
 from mechlib.amech_io import printer as ioprinter
+from mechlib.sched import execute_in_pool
 from mechroutines.es.runner._run import execute_job
 from mechroutines.es.runner._run import read_job
 
@@ -23,6 +25,7 @@ def execute_scan(zma, spc_info, mod_thy_info,
                  update_guess=True, reverse_sweep=False,
                  saddle=False,
                  constraint_dct=None, retryfail=True,
+                 njobs=1, job_res=(1, 0.0),
                  **kwargs):
     """ Run all of the electronic structure calculations for the
         scan and save the resulting information.
@@ -30,6 +33,8 @@ def execute_scan(zma, spc_info, mod_thy_info,
         Function will first assess whether the scan has been run by
         searching the filesystem.
 
+        If the guess is not updated along the scan, the points do not
+        depend on one another and up to `njobs` of them are run at once.
     """
 
     # Need a resave option
@@ -47,6 +52,7 @@ def execute_scan(zma, spc_info, mod_thy_info,
             update_guess=update_guess, reverse_sweep=reverse_sweep,
             saddle=saddle,
             constraint_dct=constraint_dct, retryfail=retryfail,
+            njobs=njobs, job_res=job_res,
             **kwargs)
 
         save_scan(
@@ -66,6 +72,7 @@ def run_scan(zma, spc_info, mod_thy_info,
              update_guess=True, reverse_sweep=True,
              saddle=False,
              constraint_dct=None, retryfail=True,
+             njobs=1, job_res=(1, 0.0),
              **kwargs):
     """ run constrained optimization scan
     """
@@ -105,6 +112,8 @@ def run_scan(zma, spc_info, mod_thy_info,
             update_guess=update_guess,
             saddle=saddle,
             constraint_dct=constraint_dct,
+            njobs=njobs,
+            job_res=job_res,
             **kwargs
         )
 
@@ -319,6 +328,7 @@ def _run_scan(guess_zma, spc_info, mod_thy_info,
               errors=(), options_mat=(),
               retryfail=True, update_guess=True,
               saddle=False, constraint_dct=None,
+              njobs=1, job_res=(1, 0.0),
               **kwargs):
     """ new run function
 
@@ -332,6 +342,11 @@ def _run_scan(guess_zma, spc_info, mod_thy_info,
         :type scn_save_fs: autofile.fs.scan or autofile.fs.cscan object
         :param scn_typ: label for scan type ('relaxed' or 'rigid')
         :type scn_typ: str
+        :param njobs: number of scan points to run at once if the guess
+            is not updated along the scan
+        :type njobs: int
+        :param job_res: (nprocs, mem) requested by each scan point job
+        :type job_res: (int, float)
 
     """
 
@@ -352,67 +367,89 @@ def _run_scan(guess_zma, spc_info, mod_thy_info,
             grid_vals, coord_names, constraint_dct, scn_run_fs, job):
 
         num_vals = len(grid_vals)
-        # Read the energies and Hessians from the filesystem
-        for val_idx, vals in enumerate(grid_vals):
-
-            print(f'Running Scan Point {val_idx+1}/{num_vals}:')
-
-            # Set the locs for the scan point
-            locs = [coord_names, vals]
-            if constraint_dct is not None:
-                locs = [constraint_dct] + locs
-
-            # Create the filesys
-            scn_run_fs[-1].create(locs)
-            run_fs = autofile.fs.run(scn_run_fs[-1].path(locs))
-
-            # Build the zma
-            zma = automol.zmat.set_values_by_name(
-                guess_zma, dict(zip(coord_names, vals)),
-                angstrom=False, degree=False)
-
-            # Run an optimization or energy job, as needed.
-            geo_exists = scn_save_fs[-1].file.geometry.exists(locs)
-            if not geo_exists or overwrite:
-                if job == elstruct.Job.OPTIMIZATION:
-                    success, ret = execute_job(
-                        job=job,
-                        script_str=script_str,
-                        run_fs=run_fs,
-                        geo=zma,
-                        spc_info=spc_info,
-                        thy_info=mod_thy_info,
-                        zrxn=zrxn,
-                        overwrite=overwrite,
-                        frozen_coordinates=frozen_coordinates,
-                        errors=errors,
-                        options_mat=options_mat,
-                        retryfail=retryfail,
-                        saddle=saddle,
-                        **kwargs
-                    )
-
-                    # Read the output for the zma and geo
-                    if success:
-                        opt_zma = filesys.save.read_job_zma(ret, init_zma=zma)
-                        if update_guess:
-                            guess_zma = opt_zma
-
-                elif job == elstruct.Job.ENERGY:
-                    _, _ = execute_job(
-                        job=job,
-                        script_str=script_str,
-                        run_fs=run_fs,
-                        geo=zma,
-                        spc_info=spc_info,
-                        thy_info=mod_thy_info,
-                        zrxn=zrxn,
-                        overwrite=overwrite,
-                        errors=errors,
-                        options_mat=options_mat,
-                        retryfail=retryfail,
-                        **kwargs
-                    )
+        point_zmas = []
+
+        def _scan_points():
+            """ Build the zma and run filesys for each point that needs
+                to be run, using the latest guess zma
+            """
+            for val_idx, vals in enumerate(grid_vals):
+
+                print(f'Running Scan Point {val_idx+1}/{num_vals}:')
+
+                # Set the locs for the scan point
+                locs = [coord_names, vals]
+                if constraint_dct is not None:
+                    locs = [constraint_dct] + locs
+
+                # Create the filesys
+                scn_run_fs[-1].create(locs)
+                run_path = scn_run_fs[-1].path(locs)
+
+                # Build the zma
+                zma = automol.zmat.set_values_by_name(
+                    guess_zma, dict(zip(coord_names, vals)),
+                    angstrom=False, degree=False)
+
+                # Run an optimization or energy job, as needed.
+                geo_exists = scn_save_fs[-1].file.geometry.exists(locs)
+                if not geo_exists or overwrite:
+                    point_zmas.append(zma)
+                    yield (zma, run_path)
+
+        def _run_scan_point(zma, run_path):
+            """ Run the job for a single point of the scan
+            """
+            run_fs = autofile.fs.run(run_path)
+            if job == elstruct.Job.OPTIMIZATION:
+                success, ret = execute_job(
+                    job=job,
+                    script_str=script_str,
+                    run_fs=run_fs,
+                    geo=zma,
+                    spc_info=spc_info,
+                    thy_info=mod_thy_info,
+                    zrxn=zrxn,
+                    overwrite=overwrite,
+                    frozen_coordinates=frozen_coordinates,
+                    errors=errors,
+                    options_mat=options_mat,
+                    retryfail=retryfail,
+                    saddle=saddle,
+                    **kwargs
+                )
+            elif job == elstruct.Job.ENERGY:
+                success, ret = execute_job(
+                    job=job,
+                    script_str=script_str,
+                    run_fs=run_fs,
+                    geo=zma,
+                    spc_info=spc_info,
+                    thy_info=mod_thy_info,
+                    zrxn=zrxn,
+                    overwrite=overwrite,
+                    errors=errors,
+                    options_mat=options_mat,
+                    retryfail=retryfail,
+                    **kwargs
+                )
+            return success, ret
+
+        def _update_guess(idx, job_ret):
+            """ Read the output for the zma and geo
+            """
+            nonlocal guess_zma
+            if job == elstruct.Job.OPTIMIZATION and update_guess:
+                if job_ret is not None and job_ret[0]:
+                    guess_zma = filesys.save.read_job_zma(
+                        job_ret[1], init_zma=point_zmas[idx])
+
+        # Points only depend on one another if the guess is updated
+        execute_in_pool(
+            _run_scan_point, _scan_points(),
+            res_lst=itertools.repeat(job_res),
+            nworkers=(1 if update_guess else njobs),
+            callback=_update_guess)
 
 
 def save_scan(scn_run_fs, scn_save_fs, scn_typ,
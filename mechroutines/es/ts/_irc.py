@@ -4,8 +4,10 @@
 import automol.reac
 import autofile
 import elstruct
+from mechlib import filesys
 from mechlib.reaction import grid as rxngrid
 from mechlib.amech_io import printer as ioprinter
+from mechlib.amech_io import reader
 from mechroutines.es import runner as es_runner
 from mechroutines.es.runner import qchem_params
 
@@ -122,8 +124,10 @@ def save_irc(irc_job, coord_name,
         # Read the IRC output file
         inf_obj, inp_str, out_str = opt_ret
         prog = inf_obj.prog
-        geos, gras, hessians = elstruct.reader.irc_points(prog, out_str)
-        coord_vals, enes = elstruct.reader.irc_path(prog, out_str)
+        geos, gras, hessians = reader.es.cached(
+            elstruct.reader.irc_points, prog, out_str)
+        coord_vals, enes = reader.es.cached(
+            elstruct.reader.irc_path, prog, out_str)
 
         # Write the data for each geom along IRC to the filesystem
         save_path = ini_scn_save_fs[1].path([coord_name])
@@ -150,9 +154,12 @@ def save_irc(irc_job, coord_name,
             ini_scn_save_fs[-1].file.geometry_info.write(inf_obj, locs)
             if gras:
                 ini_scn_save_fs[-1].file.gradient.write(gras[idx], locs)
+                filesys.arrays.save_gradient(ini_scn_save_fs, locs, gras[idx])
                 ini_scn_save_fs[-1].file.gradient_info.write(inf_obj, locs)
             if hessians:
                 ini_scn_save_fs[-1].file.hessian.write(hessians[idx], locs)
+                filesys.arrays.save_hessian(
+                    ini_scn_save_fs, locs, hessians[idx])
                 ini_scn_save_fs[-1].file.hessian_info.write(inf_obj, locs)
 
             scn_save_path = ini_scn_save_fs[-1].path(locs)
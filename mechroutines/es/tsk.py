@@ -20,6 +20,7 @@ from mechroutines.es.ts import findts
 
 from mechroutines.es.runner import scan
 from mechroutines.es.runner import qchem_params
+from mechroutines.es.runner import job_resources
 
 
 # Dictionary of Electronic Structure Calculators
@@ -263,6 +264,8 @@ def conformer_tsk(job, spc_dct, spc_name,
                 zrxn=zrxn, two_stage=two_stage,
                 retryfail=retryfail, resave=resave,
                 repulsion_thresh=40.0, print_debug=print_debug,
+                njobs=es_keyword_dct['njobs'],
+                job_res=job_resources(method_dct),
                 **kwargs)
         else:
             ioprinter.info_message(
@@ -606,6 +609,8 @@ def tau_tsk(job, spc_dct, spc_name,
                 tors_names=tors_names,
                 repulsion_thresh=40.0,
                 zrxn=zrxn, resave=resave,
+                njobs=es_keyword_dct['njobs'],
+                job_res=job_resources(method_dct),
                 **kwargs)
 
         elif job in ('energy', 'grad'):
@@ -619,18 +624,31 @@ def tau_tsk(job, spc_dct, spc_name,
                 tau_locs = tau_save_fs[-1].existing()
             elif db_style == 'jsondb':
                 tau_locs = tau_save_fs[-1].json_existing()
+            geos = _tau_geos(tau_save_fs, tau_locs, db_style)
+
+            # Run the missing jobs at once, then read and save them serially;
+            # to overwrite, the serial tasks run every job themselves
+            if not overwrite:
+                run_locs = tuple(
+                    locs for locs in tau_locs
+                    if not _tau_job_saved(
+                        job, tau_save_fs, locs, mod_thy_info, db_style))
+                tau.run_tau_jobs(
+                    job, tau_run_fs, run_locs,
+                    tuple(geos[tuple(locs)] for locs in run_locs),
+                    spc_info, mod_thy_info, script_str,
+                    retryfail=retryfail,
+                    njobs=es_keyword_dct['njobs'],
+                    job_res=job_resources(method_dct),
+                    **kwargs)
+
             for locs in tau_locs:
-                if db_style == 'jsondb':
-                    geo_save_path = tau_save_fs[-1].root.path()
-                    geo = tau_save_fs[-1].json.geometry.read(locs)
-                elif db_style == 'directory':
-                    geo_save_path = tau_save_fs[-1].path(locs)
-                    geo = tau_save_fs[-1].file.geometry.read(locs)
+                geo = geos[tuple(locs)]
                 tau_run_fs[-1].create(locs)
                 zma = None
                 ES_TSKS[job](
                     zma, geo, spc_info, mod_thy_info,
-                    tau_save_fs, locs, run_prefix,
+                    tau_run_fs, tau_save_fs, locs, run_prefix,
                     script_str, overwrite,
                     retryfail=retryfail,
                     **kwargs)
@@ -651,6 +669,25 @@ def tau_tsk(job, spc_dct, spc_name,
                 tau_locs = tau_save_fs[-1].existing()
             elif db_style == 'jsondb':
                 tau_locs = tau_save_fs[-1].json_existing()
+
+            # Run the missing Hessians, up to the max, at once; to
+            # overwrite, the serial tasks run every job themselves
+            if not overwrite:
+                run_locs = []
+                for locs in tuple(tau_locs)[:hessmax]:
+                    if not _tau_job_saved(
+                            job, tau_save_fs, locs, mod_thy_info, db_style):
+                        run_locs.append(locs)
+                geos = _tau_geos(tau_save_fs, run_locs, db_style)
+                tau.run_tau_jobs(
+                    job, tau_run_fs, run_locs,
+                    tuple(geos[tuple(locs)] for locs in run_locs),
+                    spc_info, mod_thy_info, script_str,
+                    retryfail=retryfail,
+                    njobs=es_keyword_dct['njobs'],
+                    job_res=job_resources(method_dct),
+                    **kwargs)
+
             for locs in tau_locs:
                 ioprinter.info_message(
                     f'HESS Number {hess_cnt+1}', newline=1)
@@ -885,7 +922,8 @@ def hr_tsk(job, spc_dct, spc_name,
                 zrxn=zrxn,
                 saddle=saddle,
                 increment=increment,
-                retryfail=retryfail)
+                retryfail=retryfail,
+                njobs=es_keyword_dct['njobs'])
 
         elif job == 'reopt':
 
@@ -986,6 +1024,94 @@ def hr_tsk(job, spc_dct, spc_name,
                     ioprinter.obj('vspace')
 
 
+def plan_tsk(tsk, spc_dct, spc_name,
+             thy_dct, es_keyword_dct,
+             run_prefix, save_prefix):
+    """ Determine, without running anything, whether an electronic
+        structure task would run jobs for a species given what is
+        currently in the save filesystem.
+
+        The status returned is one of
+            'skip': the task is skipped for the species
+            'saved': all of the results of the task are saved
+            'run': the returned number of jobs would be run
+            'check': the routine decides at run time (sampling, scans,
+                TS searches), so the number of jobs is not known
+
+        :param tsk: name of task
+        :type tsk: str
+        :param spc_name: name of species
+        :type spc_name: str
+        :param es_keyword_dct: keyword-value pairs for task
+        :type es_keyword_dct: dict[str:str]
+        :param run_prefix: root-path to the run-filesystem
+        :type run_prefix: str
+        :param save_prefix: root-path to the save-filesystem
+        :type save_prefix: str
+        :rtype: (str, int)
+    """
+
+    if skip_task(tsk, spc_dct, spc_name,
+                 thy_dct, es_keyword_dct, save_prefix):
+        return 'skip', 0
+
+    saddle = bool('ts_' in spc_name)
+    spc_dct_i = spc_dct[spc_name]
+    if not saddle:
+        spc_info = sinfo.from_dct(spc_dct_i)
+    else:
+        spc_info = rinfo.ts_info(spc_dct_i['rxn_info'])
+
+    overwrite = es_keyword_dct['overwrite']
+    job = tsk.split('_', 1)[1]
+
+    thy_info = tinfo.from_dct(thy_dct.get(es_keyword_dct['runlvl']))
+    ini_thy_info = tinfo.from_dct(thy_dct.get(es_keyword_dct['inplvl']))
+    mod_thy_info = tinfo.modify_orb_label(thy_info, spc_info)
+    mod_ini_thy_info = tinfo.modify_orb_label(ini_thy_info, spc_info)
+
+    _root = root_locs(spc_dct_i, saddle=saddle, name=spc_name)
+    _, ini_cnf_save_fs = build_fs(
+        run_prefix, save_prefix, 'CONFORMER',
+        thy_locs=mod_ini_thy_info[1:],
+        **_root)
+    _, cnf_save_fs = build_fs(
+        run_prefix, save_prefix, 'CONFORMER',
+        thy_locs=mod_thy_info[1:],
+        **_root)
+
+    if tsk == 'init_geom':
+        locs, _ = filesys.mincnf.min_energy_conformer_locators(
+            cnf_save_fs, mod_thy_info)
+        if any(locs) and not overwrite:
+            status, njobs = 'saved', 0
+        else:
+            status, njobs = 'run', 1
+    elif 'conf' in tsk and job in ('energy', 'grad', 'hess', 'vpt2', 'prop'):
+        user_conf_ids = spc_dct_i.get('conf_id')
+        if user_conf_ids is None:
+            ini_locs_lst, _ = filesys.mincnf.conformer_locators(
+                ini_cnf_save_fs, mod_ini_thy_info,
+                cnf_range=es_keyword_dct['cnf_range'],
+                sort_info_lst=_sort_info_lst(
+                    es_keyword_dct['sort'], thy_dct, spc_info),
+                hbond_cutoffs=spc_dct_i['hbond_cutoffs'])
+        else:
+            ini_locs_lst = (user_conf_ids,)
+
+        njobs = sum(
+            1 for locs in ini_locs_lst
+            if overwrite or not _conf_job_saved(
+                job, ini_cnf_save_fs, locs, mod_thy_info))
+        status = 'run' if njobs else 'saved'
+        if not ini_locs_lst:
+            status = 'skip'
+    else:
+        status, njobs = 'check', None
+
+    return status, njobs
+
+
 def skip_task(tsk, spc_dct, spc_name, thy_dct, es_keyword_dct, save_prefix):
     """ Determine if an electronic structure task should be skipped based on
         various parameters.
@@ -1074,3 +1200,55 @@ def _sort_info_lst(sort_str, thy_dct, spc_info):
                 else:
                     sort_lvls[idx] = float(lvl_key)
     return sort_lvls
+
+
+def _tau_geos(tau_save_fs, tau_locs, db_style):
+    """ Read the geometries of a set of tau samples, keyed by locators
+    """
+    if db_style == 'jsondb':
+        geos = tau_save_fs[-1].json.geometry.read_all(tau_locs)
+    else:
+        geos = [tau_save_fs[-1].file.geometry.read(locs)
+                for locs in tau_locs]
+    return {tuple(locs): geo for locs, geo in zip(tau_locs, geos)}
+
+
+def _tau_job_saved(job, tau_save_fs, locs, thy_info, db_style):
+    """ Check if the result of a tau energy, gradient, or Hessian job is
+        already in the save filesystem, checked the same way as in the
+        routine that saves it
+    """
+    if job == 'energy':
+        sp_save_fs = autofile.fs.single_point(tau_save_fs[-1].path(locs))
+        saved = sp_save_fs[-1].file.energy.exists(thy_info[1:4])
+    elif job == 'grad':
+        if db_style == 'jsondb':
+            saved = tau_save_fs[-1].json.gradient.exists(locs)
+        else:
+            saved = tau_save_fs[-1].file.gradient.exists(locs)
+    else:
+        if db_style == 'jsondb':
+            saved = tau_save_fs[-1].json.hessian.exists(locs)
+        else:
+            saved = tau_save_fs[-1].file.hessian.exists(locs)
+    return saved
+
+
+def _conf_job_saved(job, cnf_save_fs, locs, thy_info):
+    """ Check if the result of a conformer energy, gradient, Hessian,
+        VPT2, or property job is already in the save filesystem, checked
+        the same way as in the routine that runs it
+    """
+    if job == 'energy':
+        sp_save_fs = autofile.fs.single_point(cnf_save_fs[-1].path(locs))
+        saved = sp_save_fs[-1].file.energy.exists(thy_info[1:4])
+    elif job == 'grad':
+        saved = cnf_save_fs[-1].file.gradient.exists(locs)
+    elif job == 'hess':
+        saved = cnf_save_fs[-1].file.hessian.exists(locs)
+    elif job == 'vpt2':
+        saved = cnf_save_fs[-1].file.anharmonicity_matrix.exists(locs)
+    else:
+        saved = (cnf_save_fs[-1].file.dipole_moment.exists(locs) and
+                 cnf_save_fs[-1].file.polarizability.exists(locs))
+    return saved
@@ -43,7 +43,8 @@ def set_reference_ene(rxn_lst, spc_dct, tsk_key_dct,
             spc_dct, rgt,
             pes_model_dct_i, spc_model_dct_i,
             run_prefix, save_prefix, model_basis_energy_dct,
-            spc_locs=spc_locs_lst[0])
+            spc_locs=spc_locs_lst[0],
+            memo_models=(tsk_key_dct['spc_model'], tsk_key_dct['kin_model']))
 
         hf0k += chnl_infs_i['ene_chnlvl']
         # hf0k += chnl_infs_i['ene_tsref']
@@ -181,25 +181,18 @@ def _single_pes_ktp_dct(pes_grp_rlst,
 
     if mess_version == 'v1' and use_well_extension:
         typ = f'wext-{mess_version}'
-        mess_path = mess_paths_dct[pes_inf][typ]
-        mess_str = rate_strs_dct[pes_inf][typ]['ktp_out']
-    elif mess_version == 'v1' and not use_well_extension:
-        typ = f'base-{mess_version}'
-        mess_path = mess_paths_dct[pes_inf][typ]
-        mess_str = rate_strs_dct[pes_inf][typ]['ktp_out']
-    elif mess_version == 'v2':
+    else:
         typ = f'base-{mess_version}'
-        mess_path = mess_paths_dct[pes_inf][typ]
-        mess_str = rate_strs_dct[pes_inf][typ]['ktp_out']
+    mess_path = mess_paths_dct[pes_inf][typ]
 
-    # If file found, read and fit the rate constants
-    if mess_str is not None:
+    # If file found, read and fit the rate constants; the dct of the
+    # strings of a run is only empty if it has no rate.out
+    if rate_strs_dct[pes_inf][typ]:
         print('Fitting rates for single PES...')
         print(f'Fitting rates from {mess_path}')
 
-        rxn_ktp_dct = mess_io.reader.rates.get_rxn_ktp_dct(
-            mess_str,
-            filter_kts=True,
+        rxn_ktp_dct = reader.mess.rxn_ktp_dct(
+            mess_path,
             filter_reaction_types=('fake', 'self',
                                    'loss', 'capture', 'reverse'),
             tmin=min(temps),
@@ -12,6 +12,7 @@ from mechlib.amech_io.parser.spc import tsnames_in_dct, base_tsname
 from mechlib.amech_io import reader
 from mechlib.amech_io import printer as ioprinter
 from mechlib import filesys
+from mechlib.sched import execute_in_pool
 from mechroutines.models import blocks
 from mechroutines.models import build
 from mechroutines.models import etrans
@@ -281,8 +282,12 @@ def make_pes_mess_str(spc_dct, rxn_lst, pes_idx, pesgrp_num,
                       run_prefix, save_prefix, label_dct,
                       tsk_key_dct, pes_param_dct,
                       thy_dct, pes_model_dct_i, spc_model_dct_i,
-                      spc_model):
+                      spc_model, nworkers=1):
     """ Write all the MESS input file strings for the reaction channels
+
+        The data for the channels is read from the save filesystem for up
+        to `nworkers` channels at once, in separate processes; the strings
+        are then written for the channels in order.
     """
 
     ioprinter.messpf('channel_section')
@@ -303,28 +308,23 @@ def make_pes_mess_str(spc_dct, rxn_lst, pes_idx, pesgrp_num,
         run_prefix, save_prefix, ref_idx=0)
     basis_energy_dct[spc_model].update(model_basis_energy_dct)
 
+    # Read the data for all of the channels
+    chnl_data_lst = _read_pes_channel_data(
+        rxn_lst, pes_idx, spc_dct, tsk_key_dct,
+        basis_energy_dct[spc_model],
+        thy_dct, pes_model_dct_i, spc_model_dct_i,
+        run_prefix, save_prefix, nworkers=nworkers)
+
     # Loop over all the channels and write the MESS strings
     written_labels = []
     hot_enes_dct = {}
-    for rxn in rxn_lst:
+    for rxn, chnl_data in zip(rxn_lst, chnl_data_lst):
 
         chnl_idx, (reacs, prods) = rxn
+        chnl_infs, chn_basis_ene_dct = chnl_data
 
-        ioprinter.obj('vspace')
-        ioprinter.reading('PES electronic structure data')
-        ioprinter.channel(chnl_idx+1, reacs, prods)
-
-        # Get the names for all of the configurations of the TS
+        # Get the name for the TS
         tsname = base_tsname(pes_idx, chnl_idx)
-        tsname_allconfigs = tsnames_in_dct(pes_idx, chnl_idx, spc_dct)
-
-        # Pass in full ts class
-        chnl_infs, chn_basis_ene_dct = get_channel_data(
-            reacs, prods, tsname_allconfigs,
-            spc_dct, tsk_key_dct,
-            basis_energy_dct[spc_model],
-            thy_dct, pes_model_dct_i, spc_model_dct_i,
-            run_prefix, save_prefix)
 
         basis_energy_dct[spc_model].update(chn_basis_ene_dct)
 
@@ -780,17 +780,12 @@ def get_channel_data(reacs, prods, tsname_allconfigs,
     for rgts, side in zip((reacs, prods), ('reacs', 'prods')):
         _need_ene_trans = bool(len(rgts) == 1)
         for rgt in rgts:
-            spc_locs_lst = filesys.models.get_spc_locs_lst(
-                spc_dct[rgt], spc_model_dct_i,
-                run_prefix, save_prefix, saddle=False,
-                cnf_range=cnf_range, sort_info_lst=sort_info_lst,
-                name=rgt)
-            chnl_infs_i, model_basis_energy_dct = build.read_spc_data(
-                spc_dct, rgt,
-                pes_model_dct_i, spc_model_dct_i,
-                run_prefix, save_prefix, model_basis_energy_dct,
-                calc_ene_trans=_need_ene_trans,
-                spc_locs=spc_locs_lst[0])
+            chnl_infs_i, model_basis_energy_dct = _read_rgt_data(
+                rgt, _need_ene_trans,
+                spc_dct, tsk_key_dct,
+                model_basis_energy_dct,
+                thy_dct, pes_model_dct_i, spc_model_dct_i,
+                run_prefix, save_prefix)
             chnl_infs[side].append(chnl_infs_i)
 
     # Get data for all configurations for a TS
@@ -819,3 +814,121 @@ def get_channel_data(reacs, prods, tsname_allconfigs,
         chnl_infs['fake_vdwp'] = copy.deepcopy(chnl_infs['prods'])
 
     return chnl_infs, model_basis_energy_dct
+
+
+def _read_rgt_data(rgt, calc_ene_trans,
+                   spc_dct, tsk_key_dct,
+                   model_basis_energy_dct,
+                   thy_dct, pes_model_dct_i, spc_model_dct_i,
+                   run_prefix, save_prefix):
+    """ Read the data for a reactant or product of a channel, only once
+        per run for each species (see `build.read_spc_data`)
+    """
+
+    cnf_range = tsk_key_dct['cnf_range']
+    sort_info_lst = filesys.mincnf.sort_info_lst(tsk_key_dct['sort'], thy_dct)
+
+    spc_locs_lst = filesys.models.get_spc_locs_lst(
+        spc_dct[rgt], spc_model_dct_i,
+        run_prefix, save_prefix, saddle=False,
+        cnf_range=cnf_range, sort_info_lst=sort_info_lst,
+        name=rgt)
+
+    return build.read_spc_data(
+        spc_dct, rgt,
+        pes_model_dct_i, spc_model_dct_i,
+        run_prefix, save_prefix, model_basis_energy_dct,
+        calc_ene_trans=calc_ene_trans,
+        spc_locs=spc_locs_lst[0],
+        memo_models=(tsk_key_dct['spc_model'], tsk_key_dct['kin_model']))
+
+
+def _read_pes_channel_data(rxn_lst, pes_idx, spc_dct, tsk_key_dct,
+                           model_basis_energy_dct,
+                           thy_dct, pes_model_dct_i, spc_model_dct_i,
+                           run_prefix, save_prefix, nworkers=1):
+    """ Read the data for all of the channels of a PES, using up to
+        `nworkers` processes at once, and return it in channel order.
+
+        The reactants and products are read first, each species only once
+        however many channels it is on, and the data is kept in this
+        process; the channels, mostly their transition states, are read
+        after.
+    """
+
+    # Read all of the distinct reactants and products
+    rgt_lst = ()
+    for _, (reacs, prods) in rxn_lst:
+        for rgts in (reacs, prods):
+            rgt_lst += tuple((rgt, bool(len(rgts) == 1)) for rgt in rgts)
+    rgt_lst = tuple(dict.fromkeys(rgt_lst))
+
+    rgt_memos = execute_in_pool(
+        _read_rgt_data_memo,
+        tuple((rgt, calc_ene_trans,
+               spc_dct, tsk_key_dct,
+               model_basis_energy_dct,
+               thy_dct, pes_model_dct_i, spc_model_dct_i,
+               run_prefix, save_prefix)
+              for rgt, calc_ene_trans in rgt_lst),
+        nworkers=nworkers)
+    for rgt_memo in rgt_memos:
+        if rgt_memo is not None:
+            build.update_spc_data_memo(rgt_memo)
+
+    # Read the channels
+    chnl_args_lst = tuple(
+        (rxn, pes_idx, spc_dct, tsk_key_dct,
+         model_basis_energy_dct,
+         thy_dct, pes_model_dct_i, spc_model_dct_i,
+         run_prefix, save_prefix)
+        for rxn in rxn_lst)
+    chnl_data_lst = execute_in_pool(
+        _read_channel_data, chnl_args_lst, nworkers=nworkers)
+
+    # Read any channel that failed in a worker again, to raise the error
+    return tuple(
+        chnl_data if chnl_data is not None else _read_channel_data(*args)
+        for chnl_data, args in zip(chnl_data_lst, chnl_args_lst))
+
+
+def _read_rgt_data_memo(rgt, calc_ene_trans,
+                        spc_dct, tsk_key_dct,
+                        model_basis_energy_dct,
+                        thy_dct, pes_model_dct_i, spc_model_dct_i,
+                        run_prefix, save_prefix):
+    """ Read the data for a reactant or product and return what is kept
+        for it, to pass back from a worker process
+    """
+    _read_rgt_data(
+        rgt, calc_ene_trans,
+        spc_dct, tsk_key_dct,
+        model_basis_energy_dct,
+        thy_dct, pes_model_dct_i, spc_model_dct_i,
+        run_prefix, save_prefix)
+    return build.spc_data_memo((rgt,))
+
+
+def _read_channel_data(rxn, pes_idx, spc_dct, tsk_key_dct,
+                       model_basis_energy_dct,
+                       thy_dct, pes_model_dct_i, spc_model_dct_i,
+                       run_prefix, save_prefix):
+    """ Read the data for a channel of a PES with `get_channel_data`
+    """
+
+    chnl_idx, (reacs, prods) = rxn
+
+    ioprinter.obj('vspace')
+    ioprinter.reading('PES electronic structure data')
+    ioprinter.channel(chnl_idx+1, reacs, prods)
+
+    # Get the names for all of the configurations of the TS
+    tsname_allconfigs = tsnames_in_dct(pes_idx, chnl_idx, spc_dct)
+
+    # Pass in full ts class
+    return get_channel_data(
+        reacs, prods, tsname_allconfigs,
+        spc_dct, tsk_key_dct,
+        model_basis_energy_dct,
+        thy_dct, pes_model_dct_i, spc_model_dct_i,
+        run_prefix, save_prefix)
@@ -7,8 +7,11 @@ import chemkin_io
 import autorun
 import ratefit
 from mechlib import filesys
+from mechlib import sched
 from mechlib.amech_io import writer
 from mechlib.amech_io import output_path
+from mechlib.amech_io import mess_run_current
+from mechlib.amech_io import run_mess
 from mechlib.amech_io import printer as ioprinter
 from mechroutines.models.typ import is_abstraction_pes
 from mechroutines.ktp.rates import make_full_str
@@ -22,7 +25,8 @@ def write_messrate_task(pesgrp_num, pes_inf, rxn_lst,
                         spc_dct,
                         thy_dct, pes_model_dct, spc_model_dct,
                         unstab_chnls, label_dct,
-                        rate_paths_dct, run_prefix, save_prefix):
+                        rate_paths_dct, run_prefix, save_prefix,
+                        nworkers=1):
     """ Reads and processes all information in the save filesys for
         all species on the PES that are required for MESS rate calculations,
         as specified by the model dictionaries built from user input.
@@ -36,6 +40,9 @@ def write_messrate_task(pesgrp_num, pes_inf, rxn_lst,
         :param spc_model: model for partition fxns for rates from user input
         :type spc_model: str
         :param mess_path: path to write mess file (change since pfx given?)
+        :param nworkers: number of channels to read the save filesys for
+            at once
+        :type nworkers: int
     """
 
     _, pes_idx, _ = pes_inf
@@ -51,7 +58,8 @@ def write_messrate_task(pesgrp_num, pes_inf, rxn_lst,
         spc_dct, rxn_lst, pes_idx, pesgrp_num, unstab_chnls,
         run_prefix, save_prefix, label_dct,
         tsk_key_dct, pes_param_dct,
-        thy_dct, pes_model_dct_i, spc_model_dct_i, spc_mod)
+        thy_dct, pes_model_dct_i, spc_model_dct_i, spc_mod,
+        nworkers=nworkers)
 
     # Write the energy transfer section strings for MESS file
     energy_trans_str = make_global_etrans_str(
@@ -70,13 +78,25 @@ def write_messrate_task(pesgrp_num, pes_inf, rxn_lst,
     return pes_param_dct
 
 
-def run_messrate_task(pes_inf, rxn_lst, tsk_key_dct, spc_dct, rate_paths_dct):
-    """ Run the MESSRATE input file.
+def run_messrate_task(pes_inf, rxn_lst, tsk_key_dct, spc_dct, rate_paths_dct,
+                      mess_futs=()):
+    """ Launch the run of the MESSRATE input file, without waiting for
+        it to finish.
+
+        The run is skipped if the outputs in the directory were produced
+        from the same input and auxiliary files as are there now, unless
+        `overwrite` is set in the task keywords.
 
         First tries to run a well-extended file, then tries to
         run the base file if it exists.
 
-        Need an overwrite task
+        At most `nprocs` (from the task keywords) MESS runs are left
+        running at once: if as many of the runs already launched are
+        still going, this waits for the oldest of them to finish first.
+
+        :param mess_futs: runs already launched by this task
+        :type mess_futs: tuple(concurrent.futures.Future)
+        :rtype: concurrent.futures.Future (None if not run)
     """
 
     _, pes_idx, _ = pes_inf
@@ -97,9 +117,13 @@ def run_messrate_task(pes_inf, rxn_lst, tsk_key_dct, spc_dct, rate_paths_dct):
         typ = 'base'
 
     mess_inp = os.path.join(path, 'mess.inp')
-    # mess_out = os.path.join(path, 'mess.out')
-    # if not os.path.exists(mess_out): (rerun option needed?)
-    if os.path.exists(mess_inp):
+    if (not tsk_key_dct['overwrite'] and
+            os.path.exists(mess_inp) and mess_run_current(path)):
+        ioprinter.info_message(
+            f'MESS output at {path} is from the current input, '
+            'not running MESS again')
+        mess_fut = None
+    elif os.path.exists(mess_inp):
         ioprinter.obj('vspace')
         ioprinter.obj('line_dash')
         if typ == 'base':
@@ -110,10 +134,14 @@ def run_messrate_task(pes_inf, rxn_lst, tsk_key_dct, spc_dct, rate_paths_dct):
             ioprinter.running(
                 f'MESS well-extended input with version {mess_version} '
                 f'at {path}')
-        autorun.run_script(
-            autorun.SCRIPT_DCT[f'messrate-{mess_version}'], path
-        )
+        running_futs = tuple(fut for fut in mess_futs if not fut.done())
+        if len(running_futs) >= tsk_key_dct['nprocs']:
+            sched.wait_any(running_futs)
+        mess_fut = sched.submit(
+            run_mess,
+            args=(autorun.SCRIPT_DCT[f'messrate-{mess_version}'], path))
     else:
+        mess_fut = None
         if typ == 'base':
             ioprinter.warning_message(
                 f'No MESS base input for version {mess_version} '
@@ -123,6 +151,8 @@ def run_messrate_task(pes_inf, rxn_lst, tsk_key_dct, spc_dct, rate_paths_dct):
                 f'No MESS well-extended input for version {mess_version} '
                 f'found at {path}')
 
+    return mess_fut
+
 
 def run_fits_task(pes_grp_rlst, pes_param_dct, rate_paths_dct, mdriver_path,
                   pes_mod_dct, spc_mod_dct, thy_dct,
@@ -13,6 +13,7 @@ from mechanalyzer.inf import spc as sinfo
 from mechlib.amech_io import printer as ioprinter
 from mechlib.amech_io import job_path
 from mechlib import filesys
+from mechlib import sched
 
 
 # FUNCTIONS TO BUILD ROTOR OBJECTS CONTAINING ALL NEEDED INFO
@@ -145,8 +146,9 @@ def _read_potentials(rotors, spc_dct_i, run_path, cnf_save_path,
 
         if is_mdhrv:
             script_str = autorun.SCRIPT_DCT['projrot']
-            freqs = autorun.projrot.pot_frequencies(
-                script_str, geoms, grads, hessians, run_path)
+            freqs = sched.run(
+                autorun.projrot.pot_frequencies,
+                args=(script_str, geoms, grads, hessians, run_path))
         else:
             freqs = None
 
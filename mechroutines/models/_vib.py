@@ -8,6 +8,8 @@ import automol.pot
 import automol.geom
 import autofile.fs
 from phydat import phycon
+from mechlib import filesys
+from mechlib import sched
 from mechlib.amech_io import printer as ioprinter
 from mechlib.amech_io._path import job_path
 from mechroutines.models import typ
@@ -141,24 +143,36 @@ def read_locs_harmonic_freqs(cnf_fs, cnf_locs, run_prefix, zrxn=None):
     if geo_exists and hess_exists:
         # Obtain geom and freqs from filesys
         geo = cnf_fs[-1].file.geometry.read(cnf_locs)
-        hess = cnf_fs[-1].file.hessian.read(cnf_locs)
+        hess = filesys.arrays.hessian(cnf_fs, cnf_locs)
 
         ioprinter.reading('Hessian', cnf_fs[-1].path(cnf_locs))
 
-        # Build the run filesystem using locs
-        fml_str = automol.geom.formula_string(geo)
-        vib_path = job_path(run_prefix, 'PROJROT', 'FREQ', fml_str)
+        def _projrot_vibrations():
+            """ Diagonalize the Hessian with ProjRot """
+
+            # Build the run filesystem using locs
+            fml_str = automol.geom.formula_string(geo)
+            vib_path = job_path(run_prefix, 'PROJROT', 'FREQ', fml_str)
+
+            # Obtain the frequencies
+            ioprinter.info_message(
+                'Calling ProjRot to diagonalize Hessian and get freqs...')
+            script_str = autorun.SCRIPT_DCT['projrot']
+            freqs, _, imag_freqs, _ = sched.run(
+                autorun.projrot.frequencies,
+                args=(script_str, vib_path, [geo], [[]], [hess]))
 
-        # Obtain the frequencies
-        ioprinter.info_message(
-            'Calling ProjRot to diagonalize Hessian and get freqs...')
-        script_str = autorun.SCRIPT_DCT['projrot']
-        freqs, _, imag_freqs, _ = autorun.projrot.frequencies(
-            script_str, vib_path, [geo], [[]], [hess])
+            # Obtain the displacements
+            norm_coord_str, _ = sched.run(
+                autorun.projrot.displacements,
+                args=(script_str, vib_path, [geo], [[]], [hess]))
 
-        # Obtain the displacements
-        norm_coord_str, _ = autorun.projrot.displacements(
-            script_str, vib_path, [geo], [[]], [hess])
+            return freqs, imag_freqs, norm_coord_str
+
+        # Reuse the frequencies if found for this Hessian before
+        freqs, imag_freqs, norm_coord_str = (
+            filesys.arrays.harmonic_vibrations(
+                geo, hess, _projrot_vibrations))
 
         # Calculate the zpve
         ioprinter.frequencies(freqs)
@@ -215,7 +229,7 @@ def tors_projected_freqs(pf_filesystems, mess_hr_str, projrot_hr_str,
 
     # Read info from the filesystem that is needed
     harm_geo = harm_cnf_fs[-1].file.geometry.read(harm_min_locs)
-    hess = harm_cnf_fs[-1].file.hessian.read(harm_min_locs)
+    hess = filesys.arrays.hessian(harm_cnf_fs, harm_min_locs)
     tors_geo = tors_cnf_fs[-1].file.geometry.read(tors_min_locs)
     ioprinter.reading('Hessian', harm_cnf_fs[-1].path(harm_min_locs))
 
@@ -228,18 +242,22 @@ def tors_projected_freqs(pf_filesystems, mess_hr_str, projrot_hr_str,
     dist_cutoff_dct1 = {('H', 'O'): 2.26767, ('H', 'C'): 2.26767}
     dist_cutoff_dct2 = {('H', 'O'): 2.83459, ('H', 'C'): 2.83459,
                         ('C', 'O'): 3.7807}
-    proj_inf = autorun.projected_frequencies(
-        mess_script_str, projrot_script_str, vib_path,
-        mess_hr_str, projrot_hr_str,
-        tors_geo, harm_geo, hess,
-        dist_cutoff_dct1=dist_cutoff_dct1,
-        dist_cutoff_dct2=dist_cutoff_dct2,
-        saddle=(zrxn is not None))
-
-    # Obtain the displacements
+    proj_fut = sched.submit(
+        autorun.projected_frequencies,
+        args=(mess_script_str, projrot_script_str, vib_path,
+              mess_hr_str, projrot_hr_str,
+              tors_geo, harm_geo, hess),
+        kwargs={'dist_cutoff_dct1': dist_cutoff_dct1,
+                'dist_cutoff_dct2': dist_cutoff_dct2,
+                'saddle': (zrxn is not None)})
+
+    # Obtain the displacements, in their own directory at the same time
     disp_path = os.path.join(vib_path, 'DISP')
-    harm_disps = autorun.projrot.displacements(
-        projrot_script_str, disp_path, [harm_geo], [[]], [hess])
+    disp_fut = sched.submit(
+        autorun.projrot.displacements,
+        args=(projrot_script_str, disp_path, [harm_geo], [[]], [hess]))
+
+    proj_inf, harm_disps = sched.wait((proj_fut, disp_fut))
 
     proj_freqs, proj_imag, _, harm_freqs, tors_freqs = proj_inf
 
@@ -326,7 +344,7 @@ def ted(spc_dct_i, pf_filesystems, spc_mod_dct_i,
     if geo_exists and hess_exists:
 
         geo = cnf_fs[-1].file.geometry.read(min_cnf_locs)
-        hess = cnf_fs[-1].file.hessian.read(min_cnf_locs)
+        hess = filesys.arrays.hessian(cnf_fs, min_cnf_locs)
 
         geo_path = cnf_fs[-1].path(min_cnf_locs)
         zma_fs = autofile.fs.zmatrix(geo_path)
@@ -7,6 +7,7 @@
 """
 
 import os
+import copy
 import automol
 import elstruct
 import autofile
@@ -15,6 +16,7 @@ from phydat import phycon
 from mechanalyzer.inf import spc as sinfo
 from mechanalyzer.inf import thy as tinfo
 from mechlib import filesys
+from mechlib import sched
 from mechlib.amech_io import printer as ioprinter
 from mechlib.amech_io._path import job_path
 from mechroutines.models import ene
@@ -29,13 +31,19 @@ from mechroutines.thermo import basis
 # import thermfit
 
 
+# Data read for species so far in this run, by species, models, and
+# conformer, with the basis species energies added while reading it
+_SPC_DATA_MEMO = {}
+
+
 # General readers
 def read_spc_data(spc_dct, spc_name,
                   pes_mod_dct_i, spc_mod_dct_i,
                   run_prefix, save_prefix, chn_basis_ene_dct,
                   calc_chn_ene=True,
                   calc_ene_trans=True,
-                  spc_locs=None):
+                  spc_locs=None,
+                  memo_models=None):
     """ Reads all required data from the SAVE filesystem for a given species.
         Also sets the writer for appropriately formatting the data into
         an MESS input file string.
@@ -59,9 +67,76 @@ def read_spc_data(spc_dct, spc_name,
         :type save_prefix: str
         :param chn_basis_ene_dct: basis species <names> for mechanism species
         :type chn_basis_ene_dct: dict[]
+        :param memo_models: names of the (spc, pes) models; if given, the
+            data is only read once per run for the species, models, and
+            conformer, and reused for any later request
+        :type memo_models: (str, str)
         :rtype: (dict[], dict[])
     """
 
+    memo_key = None
+    if memo_models is not None:
+        memo_key = (spc_name, tuple(memo_models),
+                    tuple(spc_locs) if spc_locs is not None else None,
+                    calc_chn_ene, calc_ene_trans)
+
+    if memo_key is not None and memo_key in _SPC_DATA_MEMO:
+        ioprinter.info_message(
+            f'Reusing the filesystem info already read for {spc_name}')
+        inf_dct, basis_ene_dct = _SPC_DATA_MEMO[memo_key]
+        inf_dct = copy.deepcopy(inf_dct)
+        chn_basis_ene_dct = dict(chn_basis_ene_dct)
+        chn_basis_ene_dct.update(basis_ene_dct)
+    else:
+        init_basis_ene_dct = dict(chn_basis_ene_dct)
+        inf_dct, chn_basis_ene_dct = _read_spc_data(
+            spc_dct, spc_name,
+            pes_mod_dct_i, spc_mod_dct_i,
+            run_prefix, save_prefix, chn_basis_ene_dct,
+            calc_chn_ene=calc_chn_ene,
+            calc_ene_trans=calc_ene_trans,
+            spc_locs=spc_locs)
+        if memo_key is not None:
+            basis_ene_dct = {
+                key: val for key, val in chn_basis_ene_dct.items()
+                if key not in init_basis_ene_dct or
+                init_basis_ene_dct[key] is not val}
+            _SPC_DATA_MEMO[memo_key] = (
+                copy.deepcopy(inf_dct), basis_ene_dct)
+
+    return inf_dct, chn_basis_ene_dct
+
+
+def spc_data_memo(spc_names):
+    """ Get the data kept by `read_spc_data` for species, to pass on to
+        another process (see `update_spc_data_memo`).
+
+        :param spc_names: mechanism names of the species
+        :type spc_names: tuple(str)
+        :rtype: dict
+    """
+    return {key: val for key, val in _SPC_DATA_MEMO.items()
+            if key[0] in spc_names}
+
+
+def update_spc_data_memo(memo):
+    """ Keep species data read by `read_spc_data` in another process.
+
+        :param memo: data from `spc_data_memo`
+        :type memo: dict
+    """
+    _SPC_DATA_MEMO.update(memo)
+
+
+def _read_spc_data(spc_dct, spc_name,
+                   pes_mod_dct_i, spc_mod_dct_i,
+                   run_prefix, save_prefix, chn_basis_ene_dct,
+                   calc_chn_ene=True,
+                   calc_ene_trans=True,
+                   spc_locs=None):
+    """ Read the data for a species, for `read_spc_data`
+    """
+
     ioprinter.obj('line_plus')
     ioprinter.reading(f'filesystem info for {spc_name}', newline=1)
 
@@ -649,8 +724,9 @@ def _rpath_ene_data(ts_dct, frm_name, scn_vals,
         remove_bad_points=False)
 
     script_str = autorun.SCRIPT_DCT['projrot']
-    freqs = autorun.projrot.pot_frequencies(
-        script_str, geoms, grads, hessians, vib_path)
+    freqs = sched.run(
+        autorun.projrot.pot_frequencies,
+        args=(script_str, geoms, grads, hessians, vib_path))
 
     # Read all data needed to get multiref inf sep ene values
     # Based on if scan is a multireference method
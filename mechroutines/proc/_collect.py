@@ -13,6 +13,7 @@ from mechanalyzer.inf import spc as sinfo
 from mechanalyzer.inf import thy as tinfo
 
 from mechlib import filesys
+from mechlib import sched
 import mechlib.amech_io.printer as ioprinter
 from mechlib.amech_io import reader
 from mechroutines.models import _rot as rot
@@ -361,9 +362,9 @@ def partition_function(
             messpf_inp_str,
             aux_dct=dat_str_dct,
             input_name='pf.inp')
-        autorun.run_script(
-            autorun.SCRIPT_DCT['messpf'],
-            file_path)
+        sched.run(
+            autorun.run_script,
+            args=(autorun.SCRIPT_DCT['messpf'], file_path))
         pf_arrays = reader.mess.messpf(
             file_path)
     return (
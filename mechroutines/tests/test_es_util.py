@@ -0,0 +1,169 @@
+""" Test the batched screening of torsional samples in
+    mechroutines.es._routines._util
+"""
+
+import numpy
+import automol
+from mechroutines.es._routines import _util as util
+
+
+# n-butane, anti
+C4H10_GEO = automol.geom.from_data(
+    ('C', 'C', 'C', 'C', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'H'),
+    ((0.0000, 0.0000, 0.0000),
+     (0.0000, 0.0000, 1.5300),
+     (1.4186, 0.0000, 2.1031),
+     (1.4186, 0.0000, 3.6331),
+     (0.5121, -0.8870, -0.3728),
+     (-1.0243, 0.0000, -0.3728),
+     (0.5121, 0.8870, -0.3728),
+     (-0.5153, 0.8925, 1.8849),
+     (-0.5153, -0.8925, 1.8849),
+     (1.9407, -0.8925, 1.7583),
+     (1.9407, 0.8925, 1.7583),
+     (0.9065, -0.8870, 4.0060),
+     (2.4429, 0.0000, 4.0060),
+     (0.9065, 0.8870, 4.0060)),
+    angstrom=True)
+
+# n-butane, as key and value matrices (bohr, radian)
+C4H10_KEY_MAT = (
+    (None, None, None), (0, None, None), (1, 0, None), (2, 1, 0),
+    (0, 1, 2), (0, 1, 2), (0, 1, 2), (1, 0, 2), (1, 0, 2),
+    (2, 1, 3), (2, 1, 3), (3, 2, 1), (3, 2, 1), (3, 2, 1))
+C4H10_VAL_MAT = numpy.array(
+    ((0., 0., 0.), (2.89, 0., 0.), (2.89, 112., 0.), (2.89, 112., 180.),
+     (2.06, 110., 60.), (2.06, 110., 180.), (2.06, 110., -60.),
+     (2.06, 109., 120.), (2.06, 109., -120.),
+     (2.06, 109., 120.), (2.06, 109., -120.),
+     (2.06, 110., 60.), (2.06, 110., 180.), (2.06, 110., -60.)))
+C4H10_VAL_MAT[:, 1:] *= numpy.pi / 180.
+
+
+def _dihedral(xyz1, xyz2, xyz3, xyz4):
+    """ Dihedral angle of four points
+    """
+    vec1, vec2, vec3 = xyz1 - xyz2, xyz3 - xyz2, xyz4 - xyz3
+    vec2 = vec2 / numpy.linalg.norm(vec2)
+    vec1 = vec1 - numpy.dot(vec1, vec2) * vec2
+    vec3 = vec3 - numpy.dot(vec3, vec2) * vec2
+    return numpy.arctan2(
+        numpy.dot(numpy.cross(vec2, vec1), vec3), numpy.dot(vec1, vec3))
+
+
+def _angle(xyz1, xyz2, xyz3):
+    """ Angle between three points
+    """
+    vec1, vec2 = xyz1 - xyz2, xyz3 - xyz2
+    return numpy.arccos(numpy.dot(vec1, vec2) /
+                        numpy.linalg.norm(vec1) / numpy.linalg.norm(vec2))
+
+
+def _distance_matrix(xyzs):
+    """ Distances between all pairs of points
+    """
+    xyzs = numpy.array(xyzs)
+    return numpy.linalg.norm(
+        xyzs[:, numpy.newaxis] - xyzs[numpy.newaxis], axis=2)
+
+
+def test__zmatrix_cartesians():
+    """ test util._zmatrix_cartesians
+    """
+
+    numpy.random.seed(1)
+
+    # A batch of samples with random dihedrals reproduce their values
+    nsamp = 20
+    val_arr = numpy.repeat(C4H10_VAL_MAT[numpy.newaxis], nsamp, axis=0)
+    val_arr[:, 3:, 2] = numpy.random.uniform(
+        -numpy.pi, numpy.pi, size=(nsamp, len(C4H10_KEY_MAT)-3))
+    xyz_arr = util._zmatrix_cartesians(C4H10_KEY_MAT, val_arr)
+    assert xyz_arr.shape == (nsamp, len(C4H10_KEY_MAT), 3)
+
+    for xyzs, vals in zip(xyz_arr, val_arr):
+        for row, keys in enumerate(C4H10_KEY_MAT[1:], start=1):
+            assert numpy.isclose(
+                numpy.linalg.norm(xyzs[row] - xyzs[keys[0]]), vals[row, 0])
+            if row > 1:
+                assert numpy.isclose(
+                    _angle(xyzs[row], xyzs[keys[0]], xyzs[keys[1]]),
+                    vals[row, 1])
+            if row > 2:
+                dih = _dihedral(xyzs[row], xyzs[keys[0]],
+                                xyzs[keys[1]], xyzs[keys[2]])
+                assert numpy.isclose(numpy.cos(dih - vals[row, 2]), 1.)
+
+    # The structure is that of the Z-Matrix, up to its orientation
+    zma = automol.geom.zmatrix(C4H10_GEO)
+    val_mat = numpy.array(
+        [[0.0 if val is None else val for val in row]
+         for row in automol.zmat.value_matrix(zma)])
+    xyzs, = util._zmatrix_cartesians(
+        automol.zmat.key_matrix(zma), val_mat[numpy.newaxis])
+    assert numpy.allclose(
+        _distance_matrix(xyzs),
+        _distance_matrix(
+            automol.geom.coordinates(automol.zmat.geometry(zma))),
+        atol=1e-5)
+
+
+def test__screened_samples():
+    """ test util.screened_samples
+    """
+
+    numpy.random.seed(2)
+
+    zma = automol.geom.zmatrix(C4H10_GEO)
+    name_mat = automol.zmat.name_matrix(zma)
+    tors_names = tuple(name_mat[row][2] for row in (3, len(name_mat)-1))
+    tors_range_dct = {name: (0., 2*numpy.pi) for name in tors_names}
+
+    nsamp = 30
+    samps = util.screened_samples(zma, tors_range_dct, nsamp=nsamp)
+
+    # Every sample is returned without a threshold
+    assert len(samps) == nsamp
+    dpots = [dpot for _, dpot in samps]
+
+    # Only the sampled torsions are changed
+    symbs = automol.zmat.symbols(zma)
+    key_mat = automol.zmat.key_matrix(zma)
+    ref_val_dct = automol.zmat.value_dictionary(
+        zma, angstrom=False, degree=False)
+    val_arr = []
+    tors_vals = set()
+    for samp_zma, _ in samps:
+        val_dct = automol.zmat.value_dictionary(
+            samp_zma, angstrom=False, degree=False)
+        for name, val in val_dct.items():
+            if name in tors_names:
+                tors_vals.add(round(val, 6))
+            else:
+                assert numpy.isclose(val, ref_val_dct[name])
+        val_arr.append(
+            [[0.0 if val is None else val for val in row]
+             for row in automol.zmat.value_matrix(samp_zma)])
+    assert len(tors_vals) == len(tors_names) * nsamp
+
+    # The repulsion of each sample is its change over the input
+    ref_vals = [[0.0 if val is None else val for val in row]
+                for row in automol.zmat.value_matrix(zma)]
+    pots = util._lj_potential_sums(
+        symbs, util._zmatrix_cartesians(
+            key_mat, numpy.array([ref_vals] + val_arr)))
+    assert numpy.allclose(pots[1:] - pots[0], dpots)
+
+    # With a threshold, only the samples under it are kept, in the order
+    # they were drawn
+    numpy.random.seed(2)
+    thresh = sorted(dpots)[nsamp // 2]
+    kept_samps = util.screened_samples(
+        zma, tors_range_dct, nsamp=nsamp, thresh=thresh)
+    assert [dpot for _, dpot in kept_samps] == [
+        dpot for dpot in dpots if dpot <= thresh]
+
+
+if __name__ == '__main__':
+    test__zmatrix_cartesians()
+    test__screened_samples()
@@ -5,6 +5,7 @@
 import automol
 import autorun
 import ioformat
+from mechlib import sched
 from mechlib.amech_io import writer
 from mechlib.amech_io import printer as ioprinter
 
@@ -53,10 +54,11 @@ def build_polynomial(spc_name, spc_dct, pf_path, nasa_path,
 
     # Copy MESSPF output file to THERMP run dir and rename to pf.dat
     pf_str = ioformat.pathtools.read_file(pf_path, 'pf.dat')
-    hform298, poly_str = autorun.thermo(
-        thermp_script_str, pac99_script_str, nasa_path,
-        pf_str, spc_label, formula_dct, hform0,
-        enthalpyt=0.0, breakt=1000.0, convert=True)
+    hform298, poly_str = sched.run(
+        autorun.thermo,
+        args=(thermp_script_str, pac99_script_str, nasa_path,
+              pf_str, spc_label, formula_dct, hform0),
+        kwargs={'enthalpyt': 0.0, 'breakt': 1000.0, 'convert': True})
 
     # Write the full CHEMKIN strings
     ckin_str = '\n' + writer.ckin.nasa_polynomial(hform0, hform298, poly_str)
@@ -5,10 +5,13 @@ import autorun
 from automol.inchi import formula_string as fstring
 import thermfit
 from mechlib import filesys
+from mechlib import sched
 from mechlib.amech_io import reader
 from mechlib.amech_io import writer
 from mechlib.amech_io import parser
 from mechlib.amech_io import output_path
+from mechlib.amech_io import mess_run_current
+from mechlib.amech_io import run_mess
 from mechlib.amech_io import printer as ioprinter
 from mechroutines.models import ene
 from mechroutines.thermo import qt
@@ -51,7 +54,9 @@ def write_messpf_task(
 def run_messpf_task(
         run_messpf_tsk, spc_locs_dct, spc_dct,
         thm_paths_dct):
-    """ Run messpf input file
+    """ Run messpf input file, unless the partition functions in its
+        directory were produced from the same input and auxiliary files
+        and `overwrite` is not set in the task keywords
     """
     ioprinter.messpf('run_header')
 
@@ -66,12 +71,20 @@ def run_messpf_task(
         for spc_locs in spc_locs_dct[spc_name]:
             _mod_pfs = []
             for spc_mod in spc_mods:
-                autorun.run_script(
-                    autorun.SCRIPT_DCT['messpf'],
-                    thm_paths_dct[spc_name][tuple(spc_locs)][spc_mod][0])
-                _mod_pfs.append(
-                    reader.mess.messpf(
-                        thm_paths_dct[spc_name][tuple(spc_locs)][spc_mod][0]))
+                pf_path = thm_paths_dct[spc_name][tuple(spc_locs)][spc_mod][0]
+                if (not run_messpf_tsk[-1]['overwrite'] and
+                        mess_run_current(pf_path, input_name='pf.inp',
+                                         output_names=('pf.dat',))):
+                    ioprinter.info_message(
+                        f'MESSPF output at {pf_path} is from the current '
+                        'input, not running MESSPF again')
+                else:
+                    sched.run(
+                        run_mess,
+                        args=(autorun.SCRIPT_DCT['messpf'], pf_path),
+                        kwargs={'input_name': 'pf.inp',
+                                'output_names': ('pf.dat',)})
+                _mod_pfs.append(reader.mess.messpf(pf_path))
 
             # Unpack the the pf model combination information
             spc_mod_info = parser.models.split_model(spc_mod)
@@ -9,6 +9,7 @@ import autorun
 from mechanalyzer.inf import spc as sinfo
 from mechanalyzer.inf import thy as tinfo
 from mechlib import filesys
+from mechlib import sched
 from mechlib.amech_io import printer as ioprinter
 from mechlib.amech_io._path import job_path
 
@@ -139,10 +140,13 @@ def _runlj(nsamp_needed,
     # Run OneDMin
     # prolly better to just get strings
     # need geoms geo_str = _output_str(jobdir, 'min_geoms.out')
-    inp_strs, els_str, out_strs = autorun.onedmin.direct(
-        sp_script_str, run_dir, nsamp_per_job, njobs,
-        tgt_geo, bath_geo, lj_mod_thy_info, charge, mult,
-        smin=tgt_dct['smin'], smax=tgt_dct['smax'], spin_method=1)
+    inp_strs, els_str, out_strs = sched.run(
+        autorun.onedmin.direct,
+        args=(sp_script_str, run_dir, nsamp_per_job, njobs,
+              tgt_geo, bath_geo, lj_mod_thy_info, charge, mult),
+        kwargs={'smin': tgt_dct['smin'], 'smax': tgt_dct['smax'],
+                'spin_method': 1},
+        res=(njobs, 0.0))
 
     # Parse out certain info
     epsilons, sigmas, geoms, ranseeds, version, input_str = _parse(
@@ -27,7 +27,8 @@ setup(
         'mechlib.amech_io.reader',
         'mechlib.amech_io.writer',
         'mechlib.filesys',
-        'mechlib.reaction'
+        'mechlib.reaction',
+        'mechlib.sched'
     ],
     package_dir={
         'drivers': 'drivers',